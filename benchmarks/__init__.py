@@ -0,0 +1,6 @@
+"""
+Mesures de performance des moteurs de crypto_utils
+Chaque module s'exécute avec python -m benchmarks.<nom> ; python -m benchmarks
+exécute les suites (factorization, cracking, rsa_analysis, startup), enregistre les
+résultats et les compare à une référence
+"""
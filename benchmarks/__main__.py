@@ -0,0 +1,72 @@
+"""
+Exécution de toutes les suites de mesures, enregistrement et comparaison
+
+Usage :
+    python -m benchmarks [suite ...] [--quick] [--only PRÉFIXE ...]
+                         [--save FICHIER] [--compare FICHIER] [--threshold ÉCART]
+
+Avec --compare, le code de sortie vaut 1 si une mesure régresse au-delà du seuil.
+"""
+
+import argparse
+import sys
+
+from benchmarks import cracking, factorization, rsa_analysis, startup
+from benchmarks.harness import REGRESSION_THRESHOLD, compare_results, load_results, run_workloads, save_results
+from crypto_utils import arithmetic
+
+SUITES = {
+    'factorization': factorization,
+    'cracking': cracking,
+    'rsa': rsa_analysis,
+    'startup': startup
+}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description="Mesures de performance de crypto_utils")
+    parser.add_argument('suites', nargs='*', metavar='suite',
+                        help=f"Suites à exécuter parmi {', '.join(SUITES)} (défaut : toutes)")
+    parser.add_argument('--quick', action='store_true', help="Charges réduites (vérification rapide)")
+    parser.add_argument('--only', nargs='+', metavar='PRÉFIXE',
+                        help="Charges dont le nom commence par l'un de ces préfixes")
+    parser.add_argument('--save', metavar='FICHIER', help="Enregistre les résultats en JSON")
+    parser.add_argument('--compare', metavar='FICHIER', help="Compare les résultats à une référence JSON")
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help=f"Écart relatif toléré (défaut : {REGRESSION_THRESHOLD})")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.suites if name not in SUITES]
+    if unknown:
+        parser.error(f"suite inconnue : {', '.join(unknown)}")
+
+    baseline = load_results(args.compare) if args.compare else None
+    if baseline is not None and baseline.get('quick') != args.quick:
+        print("Attention : la référence n'a pas été mesurée dans le même mode (--quick)", file=sys.stderr)
+    backend = arithmetic.load_backend()
+    if baseline is not None and baseline.get('environment', {}).get('arithmetic', backend) != backend:
+        print(f"Attention : la référence n'a pas été mesurée avec le même moteur de calcul ({backend})",
+              file=sys.stderr)
+
+    results = []
+    for name in args.suites or list(SUITES):
+        # Une suite sans charge retenue n'est pas préparée (génération des clés RSA...)
+        if args.only and not any((name + '/').startswith(prefix) or prefix.startswith(name + '/')
+                                 for prefix in args.only):
+            continue
+        results.extend(run_workloads(SUITES[name].workloads(args.quick), args.only))
+
+    if args.save:
+        save_results(args.save, results, args.quick)
+
+    if baseline is None:
+        return 0
+    changes = compare_results(results, baseline, args.threshold)
+    for change in changes:
+        status = 'RÉGRESSION' if change['regression'] else 'amélioration'
+        print(f"{status:<12} {change['name']:<40} {change['metric']:<10} "
+              f"{change['baseline']:.4g} -> {change['current']:.4g} ({change['change']:+.1%})")
+    if not changes:
+        print(f"Aucun écart au-delà de {args.threshold:.0%}")
+    return 1 if any(change['regression'] for change in changes) else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+Mesure de la boucle de force brute
+Compare la boucle d'origine (itertools.product, join, encode, hexdigest)
+à la boucle actuelle (odomètre sur bytearray et réutilisation du préfixe).
+
+Usage : python -m benchmarks.bruteforce [longueur] [type]
+"""
+
+import hashlib
+import itertools
+import sys
+import time
+
+from crypto_utils.hash_cracker import CHARSETS, _bruteforce_shard
+
+def reference_loop(hash_value, hash_func, charset, length):
+    """Boucle d'origine, conservée comme point de comparaison"""
+    attempts = 0
+    for combination in itertools.product(charset, repeat=length):
+        attempts += 1
+        word = ''.join(combination)
+        if hash_func(word.encode()).hexdigest() == hash_value:
+            return word, attempts
+    return None, attempts
+
+def run(length=4, hash_type='md5', charset_name='alphanumeric'):
+    """
+    Parcourt tout l'espace de clés d'une longueur avec les deux boucles.
+
+    Returns:
+        dict: Débits (candidats par seconde) et accélération
+    """
+    charset = CHARSETS[charset_name]
+    hash_func = getattr(hashlib, hash_type)
+    # Cible absente : les deux boucles parcourent tout l'espace
+    target = hash_func(b'\x00').hexdigest()
+    keyspace = len(charset) ** length
+
+    start = time.perf_counter()
+    reference_loop(target, hash_func, charset, length)
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _bruteforce_shard(frozenset([(hash_type, b'', bytes.fromhex(target))]), [charset] * length, 0, keyspace)
+    current_time = time.perf_counter() - start
+
+    return {
+        'hash_type': hash_type,
+        'length': length,
+        'candidates': keyspace,
+        'reference_rate': keyspace / reference_time,
+        'current_rate': keyspace / current_time,
+        'speedup': reference_time / current_time
+    }
+
+if __name__ == '__main__':
+    length = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    hash_types = sys.argv[2:3] or ['md5', 'sha1', 'sha256', 'sha512']
+    for hash_type in hash_types:
+        result = run(length, hash_type)
+        print(f"{result['hash_type']:>6} : {result['candidates']} candidats, "
+              f"origine {result['reference_rate']:,.0f}/s, "
+              f"actuel {result['current_rate']:,.0f}/s, "
+              f"x{result['speedup']:.2f}")
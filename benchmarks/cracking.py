@@ -0,0 +1,160 @@
+"""
+Mesure des attaques par force brute et par dictionnaire
+Force brute : pour chaque jeu de caractères, la cible est le dernier
+candidat d'une longueur donnée (tout l'espace de clés jusqu'à cette longueur
+est parcouru). Dictionnaire : liste synthétique d'un million de mots tirée
+d'une graine fixe (construction de l'index, recherches dans l'index, parcours
+pour un hash salé, règles de transformation).
+
+Usage : python -m benchmarks.cracking [--quick]
+"""
+
+import multiprocessing
+import random
+import sys
+import time
+from pathlib import Path
+
+from benchmarks.harness import run_workloads, workload
+from crypto_utils import hash_cracker
+from crypto_utils.dictionary_index import ensure_index
+from crypto_utils.hash_cracker import CHARSETS, bruteforce_attack, dictionary_attack, hash_string
+from crypto_utils.hash_formats import get_hash_format, parse_hash
+
+SEED = 20240521
+
+# Longueur de la cible par jeu de caractères (mode normal, mode rapide)
+BRUTEFORCE_LENGTHS = {
+    'numeric': (6, 5),
+    'alpha': (4, 3),
+    'alphanumeric': (4, 3),
+    'full': (3, 2)
+}
+
+# Répétitions de chaque attaque par force brute
+BRUTEFORCE_RUNS = 3
+
+# Taille de la liste de mots (mode normal, mode rapide)
+WORDLIST_SIZE = 1000000
+QUICK_WORDLIST_SIZE = 100000
+
+# Taille de la liste de mots des attaques avec règles (mode normal, mode rapide)
+RULES_WORDLIST_SIZE = 20000
+QUICK_RULES_WORDLIST_SIZE = 5000
+
+RULESETS_MEASURED = ('basic', 'digits')
+
+# Recherches dans l'index (la moitié des mots cherchés sont absents)
+LOOKUPS = 1000
+
+# Nom du dictionnaire de mesure (ajouté à hash_cracker.DICTIONARIES)
+WORDLIST_NAME = 'benchmark'
+
+WORD_ALPHABET = 'abcdefghijklmnopqrstuvwxyz0123456789'
+
+def synthetic_words(count, seed=SEED):
+    """Mots de 6 à 12 caractères, identiques d'une exécution à l'autre"""
+    rng = random.Random(f"{seed}:{count}")
+    for _ in range(count):
+        yield ''.join(rng.choices(WORD_ALPHABET, k=rng.randint(6, 12)))
+
+def _write_wordlist(directory, count, keep=()):
+    """
+    Écrit la liste de mots (sans la garder en mémoire, pour ne pas gonfler le
+    pic mesuré) et la déclare comme dictionnaire de mesure.
+
+    Returns:
+        tuple: (mots conservés, aux positions keep, chemin de la liste)
+    """
+    kept = []
+    path = Path(directory) / 'wordlist.txt'
+    with open(path, 'w') as file:
+        for position, word in enumerate(synthetic_words(count)):
+            file.write(word + '\n')
+            if position in keep:
+                kept.append(word)
+    hash_cracker.DICTIONARIES[WORDLIST_NAME] = path
+    return kept, path
+
+def _hash(text, hash_type, salt=''):
+    """Hash d'un texte (avec son sel au format 'hash:sel' pour un type salé)"""
+    if not salt:
+        return hash_string(text, hash_type)
+    return f"{get_hash_format(hash_type)['hasher'](salt.encode())(text.encode()).hex()}:{salt}"
+
+def _dictionary_run(hash_values, hash_type, rules=None, expected=None):
+    """Attaque chaque hash et retourne (mots testés, latences)"""
+    attempts = 0
+    latencies = []
+    for hash_value in hash_values:
+        normalized, target = parse_hash(hash_value, hash_type)
+        result = dictionary_attack(normalized, target, WORDLIST_NAME, time.time(), hash_type, rules)
+        if not result['success'] or (expected is not None and result['found'] != expected):
+            raise RuntimeError(f"Attaque par dictionnaire : résultat inattendu ({result.get('error')})")
+        attempts += result['attempts']
+        latencies.append(result['execution_time'])
+    return attempts, latencies
+
+def _bruteforce_run(charset_name, length, runs):
+    """Retrouve le dernier candidat de la longueur et retourne (candidats, latences)"""
+    text = CHARSETS[charset_name][-1] * length
+    normalized, target = parse_hash(hash_string(text, 'md5'), 'md5')
+    attempts = 0
+    latencies = []
+    for _ in range(runs):
+        result = bruteforce_attack(normalized, target, charset_name, length, time.time(), 'md5')
+        if not result.get('found') or result['original'] != text:
+            raise RuntimeError(f"Force brute : {text} non retrouvé ({result.get('error')})")
+        attempts += result['attempts']
+        latencies.append(result['execution_time'])
+    return attempts, latencies
+
+def workloads(quick=False):
+    """Charges de travail de la suite"""
+    specs = []
+    for charset_name, lengths in BRUTEFORCE_LENGTHS.items():
+        length = lengths[1] if quick else lengths[0]
+        specs.append(workload(f"cracking/bruteforce/{charset_name}/{length}", 'candidates/s',
+                              lambda state, c=charset_name, l=length: _bruteforce_run(c, l, BRUTEFORCE_RUNS)))
+
+    size = QUICK_WORDLIST_SIZE if quick else WORDLIST_SIZE
+
+    # Premier appel : construction de l'index (mots indexés par seconde)
+    def index_setup(directory):
+        words, _ = _write_wordlist(directory, size, {size - 1})
+        return [_hash(words[0], 'md5')]
+    specs.append(workload('cracking/dictionary-index/md5', 'words/s',
+                          lambda hashes: _dictionary_run(hashes, 'md5', expected=True), index_setup))
+
+    # Index déjà construit : latence d'une recherche
+    def lookup_setup(directory):
+        words, path = _write_wordlist(directory, size, set(random.Random(SEED).sample(range(size), LOOKUPS)))
+        # Index construit dans un processus à part : sa mémoire n'entre pas dans le pic mesuré
+        builder = multiprocessing.get_context('fork').Process(target=ensure_index, args=(path, 'md5'))
+        builder.start()
+        builder.join()
+        present = [_hash(word, 'md5') for word in words[::2]]
+        absent = [_hash(word + '#', 'md5') for word in words[1::2]]
+        return present + absent
+    specs.append(workload('cracking/dictionary-lookup/md5', 'hashes/s',
+                          lambda hashes: (len(hashes), _dictionary_run(hashes, 'md5')[1]), lookup_setup))
+
+    # Hash salé absent : parcours complet du dictionnaire
+    def scan_setup(directory):
+        _write_wordlist(directory, size)
+        return [_hash('absent#', 'sha1-salt-pass', 'sel')]
+    specs.append(workload('cracking/dictionary-scan/sha1-salt-pass', 'candidates/s',
+                          lambda hashes: _dictionary_run(hashes, 'sha1-salt-pass', expected=False), scan_setup))
+
+    rules_size = QUICK_RULES_WORDLIST_SIZE if quick else RULES_WORDLIST_SIZE
+    for ruleset in RULESETS_MEASURED:
+        def rules_setup(directory):
+            _write_wordlist(directory, rules_size)
+            return [_hash('absent#', 'md5')]
+        specs.append(workload(f"cracking/dictionary-rules/{ruleset}", 'candidates/s',
+                              lambda hashes, r=ruleset: _dictionary_run(hashes, 'md5', r, expected=False),
+                              rules_setup))
+    return specs
+
+if __name__ == '__main__':
+    run_workloads(workloads(quick='--quick' in sys.argv[1:]))
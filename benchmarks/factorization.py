@@ -0,0 +1,72 @@
+"""
+Mesure de factorize_number par méthode et par taille de semi-premier
+Les semi-premiers (deux facteurs de même taille) sont tirés d'une graine
+fixe : deux exécutions factorisent exactement les mêmes nombres. Chaque
+charge part d'un cache de factorisation vide.
+
+Usage : python -m benchmarks.factorization [--quick]
+"""
+
+import math
+import random
+import sys
+
+from benchmarks.harness import run_workloads, workload
+from crypto_utils.factorizer import factorize_number, is_prime
+
+SEED = 20240521
+
+# Méthodes mesurées par taille (bits) ; les méthodes trop lentes pour une
+# taille en sont absentes (rho au-delà de 80 bits, ECM au-delà de 100 bits)
+SIZES = {
+    40: ('trial-division', 'pollard-rho', 'quadratic-sieve', 'ecm', 'auto'),
+    60: ('pollard-rho', 'quadratic-sieve', 'ecm', 'auto'),
+    80: ('pollard-rho', 'quadratic-sieve', 'ecm', 'auto'),
+    100: ('quadratic-sieve', 'ecm', 'auto'),
+    128: ('quadratic-sieve', 'auto')
+}
+
+# Tailles exclues du mode rapide
+SLOW_SIZES = (128,)
+
+# Nombres factorisés par charge (mode normal, mode rapide)
+COUNT = 5
+QUICK_COUNT = 2
+
+def random_prime(rng, bits):
+    """Nombre premier de exactement bits bits (deux bits de poids fort à 1)"""
+    while True:
+        candidate = rng.getrandbits(bits) | (3 << (bits - 2)) | 1
+        if is_prime(candidate):
+            return candidate
+
+def semiprimes(bits, count, seed=SEED):
+    """Semi-premiers de bits bits, identiques d'une exécution à l'autre"""
+    rng = random.Random(f"{seed}:{bits}")
+    return [random_prime(rng, bits // 2) * random_prime(rng, bits - bits // 2) for _ in range(count)]
+
+def _factorize_all(numbers, method):
+    """Factorise chaque nombre et vérifie le résultat"""
+    latencies = []
+    for n in numbers:
+        result = factorize_number(str(n), method)
+        if not result['success'] or math.prod(result['factors']) != n or len(result['factors']) != 2:
+            raise RuntimeError(f"{method} : échec sur {n} ({result.get('error', result.get('factors'))})")
+        latencies.append(result['execution_time'])
+    return len(numbers), latencies
+
+def workloads(quick=False):
+    """Charges de travail de la suite"""
+    count = QUICK_COUNT if quick else COUNT
+    specs = []
+    for bits, methods in SIZES.items():
+        if quick and bits in SLOW_SIZES:
+            continue
+        numbers = semiprimes(bits, count)
+        for method in methods:
+            specs.append(workload(f"factorization/{method}/{bits}", 'numbers/s',
+                                  lambda state, numbers=numbers, method=method: _factorize_all(numbers, method)))
+    return specs
+
+if __name__ == '__main__':
+    run_workloads(workloads(quick='--quick' in sys.argv[1:]))
@@ -0,0 +1,227 @@
+"""
+Outils communs des mesures de performance
+Chaque charge de travail s'exécute dans un processus dédié : pic de mémoire
+propre, caches froids et bases SQLite temporaires (le cache de factorisation
+ne court-circuite pas les mesures et les bases réelles ne sont pas modifiées).
+Les résultats s'enregistrent en JSON et se comparent à une référence.
+"""
+
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from crypto_utils import arithmetic, corpus_bdd, factorisation_bdd, factorizer, sessions_bdd
+
+# Écart relatif toléré avant de signaler une régression (débit ou latence p50)
+REGRESSION_THRESHOLD = 0.10
+
+# Version du format des fichiers de résultats
+RESULTS_FORMAT = 1
+
+def workload(name, unit, run, setup=None):
+    """
+    Décrit une charge de travail.
+
+    Args:
+        name (str): Nom unique (suite/charge/paramètre), clé de comparaison
+        unit (str): Unité du débit (numbers/s, candidates/s, keys/s...)
+        run (callable): run(état) -> (quantité traitée, latences en secondes)
+        setup (callable): Préparation non mesurée, setup(répertoire temporaire)
+            retourne l'état passé à run
+    """
+    return {'name': name, 'unit': unit, 'run': run, 'setup': setup}
+
+def percentile(samples, fraction):
+    """Percentile par rang le plus proche (samples non vide)"""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(fraction * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+def _isolate(directory):
+    """
+    Redirige les bases SQLite vers un répertoire temporaire. La méthode
+    automatique n'interroge pas FactorDB : seuls les moteurs locaux sont mesurés.
+    """
+    for module, name in ((factorisation_bdd, 'factorization_cache.db'), (corpus_bdd, 'rsa_corpus.db'),
+                         (sessions_bdd, 'cracking_sessions.db')):
+        module.DB_PATH = Path(directory) / name
+        module._local = threading.local()
+        module._schema_ready = False
+    factorizer.AUTO_FACTORDB_RACE = False
+
+def _reset_peak_rss():
+    """
+    Remet le pic de mémoire du processus au niveau courant (Linux), pour que
+    la préparation n'entre pas dans la mesure.
+
+    Returns:
+        bool: True si le pic a été remis à zéro
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as file:
+            file.write('5')
+        return True
+    except OSError:
+        return False
+
+def _peak_rss_kb(reset, children_before):
+    """
+    Pic de mémoire résidente du processus et des sous-processus lancés pendant
+    la mesure (Ko). Le pic des sous-processus n'est connu que globalement : il
+    n'est retenu que s'il dépasse celui des sous-processus de la préparation.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if reset:
+        # ru_maxrss n'est pas remis à zéro par clear_refs, VmHWM l'est
+        with open('/proc/self/status') as file:
+            peak = next((int(line.split()[1]) for line in file if line.startswith('VmHWM:')), peak)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return max(peak, children) if children > children_before else peak
+
+def _workload_entry(spec, connection):
+    """Point d'entrée du processus d'une charge de travail"""
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            _isolate(directory)
+            state = spec['setup'](directory) if spec['setup'] else None
+            reset = _reset_peak_rss()
+            children_before = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+            start = time.perf_counter()
+            count, latencies = spec['run'](state)
+            elapsed = time.perf_counter() - start
+        result = {
+            'name': spec['name'],
+            'unit': spec['unit'],
+            'count': count,
+            'elapsed': elapsed,
+            'throughput': count / elapsed if elapsed > 0 else None,
+            'p50': percentile(latencies, 0.50) if latencies else None,
+            'p99': percentile(latencies, 0.99) if latencies else None,
+            'samples': len(latencies),
+            'peak_rss_kb': _peak_rss_kb(reset, children_before)
+        }
+    except Exception as e:
+        result = {'name': spec['name'], 'unit': spec['unit'], 'error': str(e)}
+    connection.send(result)
+    connection.close()
+
+def run_workload(spec):
+    """
+    Exécute une charge de travail dans un processus dédié.
+
+    Returns:
+        dict: Débit, latences p50/p99, pic de mémoire (ou erreur)
+    """
+    # fork : les fonctions des charges n'ont pas à être sérialisables
+    context = multiprocessing.get_context('fork')
+    parent_connection, child_connection = context.Pipe(duplex=False)
+    process = context.Process(target=_workload_entry, args=(spec, child_connection))
+    process.start()
+    child_connection.close()
+    try:
+        result = parent_connection.recv()
+    except EOFError:
+        result = {'name': spec['name'], 'unit': spec['unit'],
+                  'error': f"Processus arrêté (code {process.exitcode})"}
+    process.join()
+    return result
+
+def format_result(result):
+    """Ligne de rapport d'une charge de travail"""
+    if 'error' in result:
+        return f"{result['name']:<40} ERREUR : {result['error']}"
+    line = f"{result['name']:<40} {result['throughput']:>14,.1f} {result['unit']:<13}"
+    if result['p50'] is not None:
+        line += f" p50 {result['p50'] * 1000:>9.2f} ms  p99 {result['p99'] * 1000:>9.2f} ms"
+    return line + f"  RSS {result['peak_rss_kb'] / 1024:>7.1f} Mo"
+
+def run_workloads(specs, name_filter=None, output=sys.stdout):
+    """Exécute les charges (filtrées par préfixe de nom) et affiche chaque résultat"""
+    results = []
+    for spec in specs:
+        if name_filter and not any(spec['name'].startswith(prefix) for prefix in name_filter):
+            continue
+        result = run_workload(spec)
+        print(format_result(result), file=output, flush=True)
+        results.append(result)
+    return results
+
+def environment():
+    """Description de la machine et de la version mesurées"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=Path(__file__).parent, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        # Les mesures de deux moteurs de calcul différents ne sont pas comparables
+        'arithmetic': arithmetic.load_backend(),
+        'commit': commit,
+        'timestamp': time.time()
+    }
+
+def save_results(path, results, quick=False):
+    """Enregistre les résultats (fichier de référence)"""
+    document = {
+        'format': RESULTS_FORMAT,
+        'quick': quick,
+        'environment': environment(),
+        'results': {result['name']: result for result in results}
+    }
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as file:
+        json.dump(document, file, indent=2, sort_keys=True)
+
+def load_results(path):
+    """Charge un fichier de résultats"""
+    with open(path) as file:
+        return json.load(file)
+
+def compare_results(results, baseline, threshold=REGRESSION_THRESHOLD):
+    """
+    Compare des résultats à une référence.
+
+    Args:
+        results (list): Résultats de run_workloads
+        baseline (dict): Document chargé par load_results
+        threshold (float): Écart relatif toléré
+
+    Returns:
+        list: Écarts au-delà du seuil (nom, mesure, référence, actuel,
+        variation relative, régression ou amélioration)
+    """
+    reference = baseline.get('results', {})
+    changes = []
+    for result in results:
+        before = reference.get(result['name'])
+        if before is None or 'error' in result or 'error' in before:
+            continue
+        # Débit : plus haut est mieux ; latence : plus bas est mieux
+        for metric, higher_is_better in (('throughput', True), ('p50', False)):
+            old, new = before.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if abs(change) <= threshold:
+                continue
+            changes.append({
+                'name': result['name'],
+                'metric': metric,
+                'baseline': old,
+                'current': new,
+                'change': change,
+                'regression': (change < 0) == higher_is_better
+            })
+    return changes
@@ -0,0 +1,162 @@
+"""
+Mesure de l'analyse des clés RSA
+Clés RSA 2048 bits tirées d'une graine fixe et encodées en PEM (clé publique,
+clé privée PKCS#1 et PKCS#8, certificat autosigné) : analyse clé par clé avec
+analyze_rsa_key, avec et sans vérification contre le corpus, puis analyse en
+masse d'un lot PEM et d'un NDJSON de modules, et PGCD par lots.
+
+Les modules des charges en masse sont synthétiques (impairs, sans facteur
+inférieur à SMALL_FACTOR_BOUND, mais pas semi-premiers) : tirer des millions
+de bits de nombres premiers à chaque exécution serait trop long.
+
+Usage : python -m benchmarks.rsa_analysis [--quick]
+"""
+
+import datetime
+import json
+import math
+import random
+import sys
+
+from cryptography import x509
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+
+from benchmarks.factorization import random_prime
+from benchmarks.harness import run_workloads, workload
+from crypto_utils import corpus_bdd
+from crypto_utils.batch_gcd import batch_gcd, check_modulus
+from crypto_utils.factorizer import primes_up_to
+from crypto_utils.rsa_bulk import analyze_rsa_stream
+from crypto_utils.rsa_utils import analyze_rsa_key
+
+SEED = 20240521
+
+KEY_SIZE = 2048
+PUBLIC_EXPONENT = 65537
+
+# Clés générées (mode normal, mode rapide)
+KEY_COUNT = 16
+QUICK_KEY_COUNT = 4
+
+# Modules du corpus pré-rempli, du NDJSON en masse et du PGCD par lots (mode normal, mode rapide)
+CORPUS_SIZE = (8192, 1024)
+NDJSON_SIZE = (4096, 1024)
+BATCH_GCD_SIZE = (1024, 256)
+
+# Les modules synthétiques n'ont aucun facteur premier inférieur à cette borne
+SMALL_FACTOR_BOUND = 100000
+
+# Budgets de l'analyse clé par clé : ceux de l'analyse en masse (Fermat
+# limité à sa passe rapide), sinon Fermat épuise son budget sur chaque clé saine
+ANALYSIS_OPTIONS = {'fermatTimeLimit': 0, 'wienerTimeLimit': 0.05}
+NO_CORPUS_OPTIONS = dict(ANALYSIS_OPTIONS, checkSharedPrimes=False, checkCommonFactors=False)
+
+def _private_key(p, q):
+    """Clé privée cryptography à partir de ses deux facteurs"""
+    n = p * q
+    d = pow(PUBLIC_EXPONENT, -1, (p - 1) * (q - 1))
+    return rsa.RSAPrivateNumbers(
+        p, q, d, d % (p - 1), d % (q - 1), pow(q, -1, p), rsa.RSAPublicNumbers(PUBLIC_EXPONENT, n)
+    ).private_key(default_backend())
+
+def _certificate(key, index):
+    """Certificat autosigné (déterministe : dates et numéro de série fixes)"""
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, f"benchmark-{index}")])
+    return (x509.CertificateBuilder()
+            .subject_name(name)
+            .issuer_name(name)
+            .public_key(key.public_key())
+            .serial_number(index + 1)
+            .not_valid_before(datetime.datetime(2024, 1, 1))
+            .not_valid_after(datetime.datetime(2034, 1, 1))
+            .sign(key, hashes.SHA256(), default_backend()))
+
+def pem_keys(count, seed=SEED):
+    """
+    Clés RSA identiques d'une exécution à l'autre, dans chaque encodage PEM.
+
+    Returns:
+        dict: Encodage -> liste de textes PEM
+    """
+    rng = random.Random(f"{seed}:rsa")
+    encoded = {'public': [], 'pkcs1': [], 'pkcs8': [], 'certificate': []}
+    for index in range(count):
+        key = _private_key(random_prime(rng, KEY_SIZE // 2), random_prime(rng, KEY_SIZE // 2))
+        encoded['public'].append(key.public_key().public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo).decode())
+        for name, private_format in (('pkcs1', serialization.PrivateFormat.TraditionalOpenSSL),
+                                     ('pkcs8', serialization.PrivateFormat.PKCS8)):
+            encoded[name].append(key.private_bytes(
+                serialization.Encoding.PEM, private_format, serialization.NoEncryption()).decode())
+        encoded['certificate'].append(_certificate(key, index).public_bytes(serialization.Encoding.PEM).decode())
+    return encoded
+
+def synthetic_moduli(count, label, seed=SEED):
+    """Modules synthétiques de KEY_SIZE bits, identiques d'une exécution à l'autre"""
+    rng = random.Random(f"{seed}:{label}")
+    small = math.prod(primes_up_to(SMALL_FACTOR_BOUND))
+    moduli = []
+    while len(moduli) < count:
+        candidate = rng.getrandbits(KEY_SIZE) | (1 << (KEY_SIZE - 1)) | 1
+        if math.gcd(candidate, small % candidate) == 1:
+            moduli.append(candidate)
+    return moduli
+
+def _analyze_all(keys, options):
+    """Analyse chaque clé et retourne (clés, latences)"""
+    latencies = []
+    for key in keys:
+        result = analyze_rsa_key('PEM', key, options)
+        if not result['success']:
+            raise RuntimeError(f"Analyse RSA : {result['error']}")
+        latencies.append(result['execution_time'])
+    return len(keys), latencies
+
+def _stream_all(lines):
+    """Analyse un flux en masse et retourne (clés, latences)"""
+    summary = None
+    for record in analyze_rsa_stream(lines):
+        if record['type'] == 'summary':
+            summary = record
+    if summary['errors']:
+        raise RuntimeError(f"Analyse en masse : {summary['errors']} clé(s) en erreur")
+    return summary['keys'], []
+
+def _fill_corpus(size):
+    """Pré-remplit le corpus et calcule les produits de ses blocs (hors mesure)"""
+    corpus_bdd.add_moduli(synthetic_moduli(size, 'corpus'), 'benchmark')
+    check_modulus(3, add=False)
+
+def workloads(quick=False):
+    """Charges de travail de la suite"""
+    mode = 1 if quick else 0
+    encoded = pem_keys(QUICK_KEY_COUNT if quick else KEY_COUNT)
+    specs = []
+    for encoding, keys in encoded.items():
+        specs.append(workload(f"rsa/analyze/{encoding}", 'keys/s',
+                              lambda state, keys=keys: _analyze_all(keys, NO_CORPUS_OPTIONS)))
+
+    corpus_size = CORPUS_SIZE[mode]
+    specs.append(workload(f"rsa/analyze-corpus/{corpus_size}", 'keys/s',
+                          lambda state: _analyze_all(encoded['public'], ANALYSIS_OPTIONS),
+                          lambda directory: _fill_corpus(corpus_size)))
+
+    bundle = '\n'.join(key for keys in encoded.values() for key in keys).splitlines()
+    specs.append(workload('rsa/bulk-pem', 'keys/s', lambda lines: _stream_all(lines), lambda directory: bundle))
+
+    ndjson_size = NDJSON_SIZE[mode]
+    specs.append(workload(f"rsa/bulk-ndjson/{ndjson_size}", 'keys/s', lambda lines: _stream_all(lines),
+                          lambda directory: [json.dumps({'n': str(n), 'e': PUBLIC_EXPONENT})
+                                             for n in synthetic_moduli(ndjson_size, 'ndjson')]))
+
+    batch_size = BATCH_GCD_SIZE[mode]
+    specs.append(workload(f"rsa/batch-gcd/{batch_size}", 'moduli/s',
+                          lambda moduli: (len(batch_gcd(moduli)), []),
+                          lambda directory: synthetic_moduli(batch_size, 'batch')))
+    return specs
+
+if __name__ == '__main__':
+    run_workloads(workloads(quick='--quick' in sys.argv[1:]))
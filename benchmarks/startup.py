@@ -0,0 +1,156 @@
+"""
+Mesure du démarrage à froid de l'application
+Chaque démarrage est un nouvel interpréteur : import de app (enregistrement
+des routes), puis première requête sur une route, comme lors d'une
+invocation serverless. Les dépendances lourdes (cryptography, requests,
+pycryptodome, gmpy2) ne doivent être chargées qu'à la première utilisation
+de l'outil qui en a besoin : la page d'accueil échoue si l'une d'elles est
+chargée, et l'import de app échoue s'il charge un moteur de calcul
+(factorisation, crackage).
+
+Usage : python -m benchmarks.startup [--quick] [--modules]
+    --modules : détail des imports les plus coûteux (python -X importtime)
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.harness import run_workloads, workload
+from crypto_utils.hash_cracker import hash_string
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Démarrages par charge (mode normal, mode rapide)
+COUNT = 10
+QUICK_COUNT = 3
+
+# Modules chargés à la demande par les outils
+HEAVY_MODULES = ('cryptography', 'requests', 'Crypto', 'gmpy2')
+
+# Moteurs importés par les routes qui s'en servent, jamais à l'import de routes
+ENGINE_MODULES = ('crypto_utils.factorizer', 'crypto_utils.hash_cracker')
+
+# Script exécuté par chaque interpréteur : durées de l'import et de la
+# première requête, moteurs chargés par l'import, dépendances lourdes chargées
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter()
+request = json.loads(sys.argv[1])
+result = {'import': imported - start, 'request': None,
+          'engines': sorted(set(sys.modules) & set(json.loads(sys.argv[4])))}
+if request:
+    from benchmarks.harness import _isolate
+    _isolate(sys.argv[2])
+    client = app.app.test_client()
+    start = time.perf_counter()
+    response = client.open(request['path'], method=request['method'], json=request.get('json'))
+    result['request'] = time.perf_counter() - start
+    result['status'] = response.status_code
+    if response.is_json and response.get_json().get('success') is False:
+        result['error'] = response.get_json().get('error')
+result['heavy'] = sorted({name.split('.')[0] for name in sys.modules} & set(json.loads(sys.argv[3])))
+print(json.dumps(result))
+"""
+
+def _environment():
+    """Environnement des interpréteurs : bytecode mis en cache comme en production"""
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return env
+
+def probe(request=None, directory=''):
+    """
+    Démarre un interpréteur, importe app et exécute éventuellement une requête.
+
+    Args:
+        request (dict): path, method et json de la requête (None : import seul)
+        directory (str): Répertoire des bases SQLite temporaires
+
+    Returns:
+        dict: Durées de l'import et de la requête (secondes), code HTTP,
+        moteurs chargés par l'import, dépendances lourdes chargées
+    """
+    completed = subprocess.run(
+        [sys.executable, '-c', PROBE, json.dumps(request), directory, json.dumps(HEAVY_MODULES),
+         json.dumps(ENGINE_MODULES)],
+        cwd=ROOT, env=_environment(), capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.splitlines()[-1])
+
+def _cold_starts(request, directory, count):
+    """Démarrages successifs, retourne (démarrages, latences import + requête)"""
+    latencies = []
+    for _ in range(count):
+        result = probe(request, directory)
+        if result['engines']:
+            raise RuntimeError(f"Chargés dès l'import de routes : {', '.join(result['engines'])}")
+        if request and (result['status'] != 200 or 'error' in result):
+            raise RuntimeError(f"{request['path']} : HTTP {result['status']} {result.get('error', '')}")
+        if request and request['path'] == '/' and result['heavy']:
+            raise RuntimeError(f"Chargés dès la page d'accueil : {', '.join(result['heavy'])}")
+        latencies.append(result['import'] + (result['request'] or 0))
+    return count, latencies
+
+def _rsa_key():
+    """Clé publique PEM tirée de la graine des mesures RSA"""
+    from benchmarks.rsa_analysis import pem_keys
+    return pem_keys(1)['public'][0]
+
+def first_requests(rsa_key):
+    """Première requête mesurée par route"""
+    return {
+        'index': {'path': '/', 'method': 'GET'},
+        'factorize': {'path': '/api/factorize', 'method': 'POST',
+                      'json': {'number': str(1000000007 * 1000000009), 'method': 'auto'}},
+        'crack-hash': {'path': '/api/crack-hash', 'method': 'POST',
+                       'json': {'hash': hash_string('123', 'md5'), 'type': 'md5', 'mode': 'bruteforce',
+                                'charset': 'numeric', 'maxLength': 3}},
+        'analyze-rsa': {'path': '/api/analyze-rsa', 'method': 'POST',
+                        'json': {'keyType': 'PEM', 'keyContent': rsa_key,
+                                 'options': {'checkSharedPrimes': False, 'checkCommonFactors': False,
+                                             'fermatTimeLimit': 0}}}
+    }
+
+def workloads(quick=False):
+    """Charges de travail de la suite"""
+    count = QUICK_COUNT if quick else COUNT
+
+    def setup(directory, route=None):
+        # Démarrage non mesuré : le bytecode est compilé et mis en cache
+        request = first_requests(_rsa_key())[route] if route else None
+        probe(request, directory)
+        return request, directory
+
+    specs = [workload('startup/import-app', 'starts/s', lambda state: _cold_starts(*state, count), setup)]
+    for route in ('index', 'factorize', 'crack-hash', 'analyze-rsa'):
+        specs.append(workload(f"startup/first-request/{route}", 'starts/s',
+                              lambda state: _cold_starts(*state, count),
+                              lambda directory, route=route: setup(directory, route)))
+    return specs
+
+def import_profile(module='app', top=15):
+    """
+    Imports les plus coûteux d'un module (durées cumulées de python -X importtime).
+
+    Returns:
+        list: (durée cumulée en secondes, module), du plus coûteux au moins coûteux
+    """
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                               cwd=ROOT, env=_environment(), capture_output=True, text=True, check=True)
+    timings = []
+    for line in completed.stderr.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            timings.append((int(fields[1]) / 1e6, fields[2].strip()))
+    return sorted(timings, reverse=True)[:top]
+
+if __name__ == '__main__':
+    if '--modules' in sys.argv[1:]:
+        for cumulative, name in import_profile():
+            print(f"{cumulative * 1000:>9.1f} ms  {name}")
+    else:
+        run_workloads(workloads(quick='--quick' in sys.argv[1:]))
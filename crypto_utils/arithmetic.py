@@ -0,0 +1,131 @@
+"""
+Module d'arithmétique des grands entiers
+Opérations dont dépendent les moteurs de factorisation et les attaques RSA :
+gcd (PGCD), isqrt (racine carrée entière), powmod (exponentiation
+modulaire), is_square (carré parfait), jacobi (symbole de Jacobi) et invert
+(inverse modulaire, ValueError s'il n'existe pas).
+
+gmpy2 (GMP) est utilisé s'il est installé : nettement plus rapide dès
+quelques dizaines de chiffres. Sinon, math.gcd, math.isqrt et pow.
+CRYPTOTOOLS_ARITHMETIC=python impose le second. Comme les autres
+dépendances lourdes, gmpy2 n'est importé qu'au premier calcul.
+
+Les résultats sont toujours des int. Pour que les opérateurs des boucles de
+calcul (* % + -) profitent aussi de GMP, un moteur convertit ses opérandes
+par mpz() à l'entrée et rend des int.
+"""
+
+import math
+import os
+
+# Moteur de calcul ('gmpy2' ou 'python'), choisi au premier calcul (voir load_backend)
+BACKEND = None
+gmpy2 = None
+
+def _python_is_square(n):
+    if n < 0:
+        return False
+    root = math.isqrt(n)
+    return root * root == n
+
+def _python_jacobi(a, n):
+    if n <= 0 or n % 2 == 0:
+        raise ValueError("n doit être un entier impair positif")
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+def _python_invert(a, n):
+    return pow(a, -1, n)
+
+def _gmpy2_mpz(n):
+    return gmpy2.mpz(n)
+
+def _gmpy2_gcd(a, b):
+    return int(gmpy2.gcd(a, b))
+
+def _gmpy2_isqrt(n):
+    return int(gmpy2.isqrt(n))
+
+def _gmpy2_powmod(base, exponent, modulus):
+    return int(gmpy2.powmod(base, exponent, modulus))
+
+def _gmpy2_is_square(n):
+    return n >= 0 and gmpy2.is_square(n)
+
+def _gmpy2_jacobi(a, n):
+    if n <= 0 or n % 2 == 0:
+        raise ValueError("n doit être un entier impair positif")
+    return gmpy2.jacobi(a, n)
+
+def _gmpy2_invert(a, n):
+    try:
+        return int(gmpy2.invert(a, n))
+    except ZeroDivisionError:
+        raise ValueError("base is not invertible for the given modulus")
+
+_IMPLEMENTATIONS = {
+    'python': {
+        'mpz': int,
+        'gcd': math.gcd,
+        'isqrt': math.isqrt,
+        'powmod': pow,
+        'is_square': _python_is_square,
+        'jacobi': _python_jacobi,
+        'invert': _python_invert
+    },
+    'gmpy2': {
+        'mpz': _gmpy2_mpz,
+        'gcd': _gmpy2_gcd,
+        'isqrt': _gmpy2_isqrt,
+        'powmod': _gmpy2_powmod,
+        'is_square': _gmpy2_is_square,
+        'jacobi': _gmpy2_jacobi,
+        'invert': _gmpy2_invert
+    }
+}
+
+def load_backend():
+    """
+    Choisit le moteur de calcul (gmpy2 s'il est installé et n'est pas exclu
+    par CRYPTOTOOLS_ARITHMETIC) et installe ses opérations dans le module.
+
+    Returns:
+        str: Le moteur retenu
+    """
+    global BACKEND, gmpy2
+    if BACKEND is None:
+        if os.environ.get('CRYPTOTOOLS_ARITHMETIC', 'auto') != 'python':
+            try:
+                import gmpy2
+            except ImportError:
+                gmpy2 = None
+        backend = 'gmpy2' if gmpy2 is not None else 'python'
+        globals().update(_IMPLEMENTATIONS[backend])
+        BACKEND = backend
+    return BACKEND
+
+def _on_first_call(name):
+    """Opération provisoire : choisit le moteur puis lui passe l'appel"""
+    def first_call(*args):
+        load_backend()
+        return globals()[name](*args)
+    first_call.__name__ = name
+    return first_call
+
+mpz = _on_first_call('mpz')
+gcd = _on_first_call('gcd')
+isqrt = _on_first_call('isqrt')
+powmod = _on_first_call('powmod')
+is_square = _on_first_call('is_square')
+jacobi = _on_first_call('jacobi')
+invert = _on_first_call('invert')
@@ -0,0 +1,319 @@
+"""
+Module de recherche de nombres premiers partagés entre modules RSA
+PGCD par lots (arbre de produits et arbre de restes, D. J. Bernstein) sur un
+ensemble de modules, et vérification incrémentale de nouveaux modules contre
+le corpus persistant des modules déjà analysés ou importés.
+"""
+
+import threading
+import time
+
+from crypto_utils import arithmetic, corpus_bdd, metrics
+from crypto_utils.factorisation_bdd import store_factorization
+from crypto_utils.progress import rate_and_eta, report_progress
+
+# Taille (bits) à partir de laquelle la division récursive remplace l'opérateur %
+DIV_LIMIT = 4000
+
+# Nombre de modules par bloc du corpus (le produit de chaque bloc est conservé)
+BLOCK_SIZE = 256
+
+# Nombre de nouveaux modules vérifiés ensemble lors d'un import
+IMPORT_CHUNK = 1024
+
+METHOD_NAME = "PGCD par lots (premier partagé)"
+
+# Produits des blocs complets du corpus, calculés à la demande
+_block_products = []
+_blocks_lock = threading.Lock()
+
+def _div2n1n(a, b, n):
+    """Division de a (2n bits) par b (n bits), Burnikel-Ziegler"""
+    if a.bit_length() - n <= DIV_LIMIT:
+        return divmod(a, b)
+    pad = n & 1
+    if pad:
+        a <<= 1
+        b <<= 1
+        n += 1
+    half_n = n >> 1
+    mask = (1 << half_n) - 1
+    b1, b2 = b >> half_n, b & mask
+    q1, r = _div3n2n(a >> n, (a >> half_n) & mask, b, b1, b2, half_n)
+    q2, r = _div3n2n(r, a & mask, b, b1, b2, half_n)
+    if pad:
+        r >>= 1
+    return q1 << half_n | q2, r
+
+def _div3n2n(a12, a3, b, b1, b2, n):
+    """Étape de _div2n1n : division de 3 demi-mots par 2"""
+    if a12 >> n == b1:
+        q, r = (1 << n) - 1, a12 - (b1 << n) + b1
+    else:
+        q, r = _div2n1n(a12, b1, n)
+    r = (r << n | a3) - q * b2
+    while r < 0:
+        q -= 1
+        r += b
+    return q, r
+
+def _mod(a, b):
+    """
+    Reste de a par b (a >= 0, b > 0).
+    L'opérateur % de CPython est quadratique : pour les grands opérandes, la
+    division récursive (coût proche de celui des multiplications) est
+    nettement plus rapide. GMP divise déjà en temps quasi linéaire.
+    """
+    if arithmetic.load_backend() == 'gmpy2':
+        return a % b
+    n = b.bit_length()
+    if n <= DIV_LIMIT or a.bit_length() - n <= DIV_LIMIT:
+        return a % b
+    # Découpage de a en tranches de n bits, de la plus forte à la plus faible
+    mask = (1 << n) - 1
+    shift = (a.bit_length() - 1) // n * n
+    r = 0
+    while shift >= 0:
+        _, r = _div2n1n(r << n | (a >> shift) & mask, b, n)
+        shift -= n
+    return r
+
+def product_tree(values):
+    """
+    Arbre de produits d'une liste d'entiers.
+
+    Args:
+        values (list): Les feuilles
+
+    Returns:
+        list: Les niveaux de l'arbre, des feuilles (premier) à la racine (dernier)
+    """
+    tree = [[arithmetic.mpz(value) for value in values]]
+    while len(tree[-1]) > 1:
+        level = tree[-1]
+        tree.append([level[i] * level[i + 1] if i + 1 < len(level) else level[i]
+                     for i in range(0, len(level), 2)])
+    return tree
+
+def remainder_tree(value, tree, squared=False):
+    """
+    Restes d'un entier par chaque feuille d'un arbre de produits, en
+    descendant l'arbre depuis la racine.
+
+    Args:
+        value (int): L'entier à réduire
+        tree (list): Arbre de produits (voir product_tree)
+        squared (bool): Réduire modulo le carré de chaque nœud (PGCD par lots)
+
+    Returns:
+        list: Un reste par feuille
+    """
+    remainders = [value]
+    for level in reversed(tree):
+        remainders = [_mod(remainders[i >> 1], node * node if squared else node)
+                      for i, node in enumerate(level)]
+    return remainders
+
+def batch_gcd(moduli):
+    """
+    PGCD de chaque module avec le produit de tous les autres (Bernstein).
+
+    Args:
+        moduli (list): Modules distincts
+
+    Returns:
+        list: Pour chaque module, le PGCD (1 si aucun facteur partagé)
+    """
+    if len(moduli) < 2:
+        return [1] * len(moduli)
+    tree = product_tree(moduli)
+    remainders = remainder_tree(tree[-1][0], tree, squared=True)
+    return [arithmetic.gcd(r // n, n) for r, n in zip(remainders, moduli)]
+
+def _corpus_blocks(corpus):
+    """
+    Produits des blocs du corpus : relus dans la base quand ils y sont, sinon
+    calculés et enregistrés (le dernier bloc, incomplet, est recalculé).
+    """
+    full = len(corpus) // BLOCK_SIZE
+    with _blocks_lock:
+        if len(_block_products) < full:
+            for index, size, last, product in corpus_bdd.load_blocks(len(_block_products)):
+                # Bloc utilisable seulement s'il suit le précédent et couvre les mêmes modules
+                if (index != len(_block_products) or index >= full or size != BLOCK_SIZE
+                        or corpus[(index + 1) * BLOCK_SIZE - 1] != last):
+                    break
+                _block_products.append(product)
+        while len(_block_products) < full:
+            start = len(_block_products) * BLOCK_SIZE
+            product = product_tree(corpus[start:start + BLOCK_SIZE])[-1][0]
+            corpus_bdd.store_block(len(_block_products), BLOCK_SIZE, corpus[start + BLOCK_SIZE - 1], int(product))
+            _block_products.append(product)
+        blocks = _block_products[:full]
+    if len(corpus) % BLOCK_SIZE:
+        blocks.append(product_tree(corpus[full * BLOCK_SIZE:])[-1][0])
+    return blocks
+
+def _corpus_gcds(moduli, corpus, exclude=None):
+    """
+    PGCD de chaque module avec le produit du corpus : les produits des blocs
+    sont réduits modulo le produit des modules, puis le reste redescend leur
+    arbre de produits. exclude est la position d'un module du corpus à ignorer.
+    """
+    if not corpus:
+        return [1] * len(moduli)
+    tree = product_tree(moduli)
+    root = tree[-1][0]
+    bits = root.bit_length()
+
+    blocks = _corpus_blocks(corpus)
+    if exclude is not None and exclude < len(corpus):
+        blocks[exclude // BLOCK_SIZE] //= corpus[exclude]
+
+    acc = 1
+    pending = 1
+    for block in blocks:
+        # Blocs regroupés jusqu'à la taille de la racine : une réduction par groupe
+        pending *= block
+        if pending.bit_length() >= bits:
+            acc = _mod(acc * _mod(pending, root), root)
+            pending = 1
+    if pending != 1:
+        acc = _mod(acc * _mod(pending, root), root)
+
+    return [arithmetic.gcd(r, n) for r, n in zip(remainder_tree(acc, tree), moduli)]
+
+def _split(n, g, candidates):
+    """
+    Retrouve un facteur premier de n à partir de g = PGCD(n, produit des autres).
+
+    Returns:
+        tuple: (p, q) ou None
+    """
+    if 1 < g < n:
+        p = g
+    else:
+        # Les deux facteurs de n sont partagés (avec des modules différents)
+        p = next((d for d in (arithmetic.gcd(n, m) for m in candidates if m != n) if 1 < d < n), None)
+        if p is None:
+            return None
+    return min(p, n // p), max(p, n // p)
+
+def _findings(moduli, gcds, corpus):
+    """Décrit les modules cassés : facteurs et modules partageant un facteur"""
+    findings = []
+    broken = [(n, g) for n, g in zip(moduli, gcds) if g > 1]
+    if not broken:
+        return findings
+    candidates = list(corpus) + list(moduli)
+    for n, g in broken:
+        factors = _split(n, g, candidates)
+        if factors is None:
+            continue
+        p, q = factors
+        shared_with = [m for m in candidates if m != n and (m % p == 0 or m % q == 0)]
+        store_factorization(n, [p, q], METHOD_NAME)
+        findings.append({
+            'modulus': n,
+            'p': p,
+            'q': q,
+            'sharedWith': shared_with
+        })
+    return findings
+
+def check_modulus(n, add=True, source=None):
+    """
+    Cherche un facteur premier partagé entre un module et le corpus.
+
+    Args:
+        n (int): Le module à vérifier
+        add (bool): Ajouter le module au corpus après vérification
+        source (str): Provenance enregistrée avec le module
+
+    Returns:
+        dict: Facteurs (p, q) et modules partageant un facteur, ou None
+    """
+    corpus = corpus_bdd.load_moduli()
+    gcds = _corpus_gcds([n], corpus, corpus_bdd.index_of(n))
+    findings = _findings([n], gcds, corpus)
+    if add:
+        corpus_bdd.add_moduli([n], source)
+    return findings[0] if findings else None
+
+def check_moduli(moduli, source=None):
+    """
+    Cherche les facteurs partagés d'un lot de modules, entre eux et avec le
+    corpus, puis les ajoute au corpus. Les modules déjà présents dans le
+    corpus sont ignorés (ils ont été vérifiés à leur ajout).
+
+    Args:
+        moduli (list): Les modules (de préférence au plus IMPORT_CHUNK)
+        source (str): Provenance enregistrée avec les modules
+
+    Returns:
+        list: Les modules cassés (voir check_modulus), dont 'modulus'
+    """
+    start_time = time.time()
+    corpus = corpus_bdd.load_moduli()
+    known = set(corpus)
+    new = [n for n in dict.fromkeys(moduli) if n > 1 and n not in known]
+    if not new:
+        return []
+    gcds = [arithmetic.gcd(n, a * b) for n, a, b in zip(new, batch_gcd(new), _corpus_gcds(new, corpus))]
+    findings = _findings(new, gcds, corpus)
+    corpus_bdd.add_moduli(new, source)
+    metrics.record_run('batch-gcd', time.time() - start_time, 'vulnerable' if findings else 'ok',
+                       moduli=len(new), corpus_moduli=len(corpus))
+    return findings
+
+def import_moduli(moduli, source=None):
+    """
+    Importe des modules dans le corpus et y cherche les facteurs partagés,
+    entre eux et avec les modules déjà connus.
+
+    Args:
+        moduli (iterable): Les modules (entiers)
+        source (str): Provenance enregistrée avec les modules
+
+    Returns:
+        dict: Résultat de l'import (modules ajoutés, modules cassés)
+    """
+    start_time = time.time()
+    try:
+        received = [n for n in moduli if n > 1]
+        known = set(corpus_bdd.load_moduli())
+        new = [n for n in dict.fromkeys(received) if n not in known]
+
+        findings = []
+        done = 0
+        for start in range(0, len(new), IMPORT_CHUNK):
+            chunk = new[start:start + IMPORT_CHUNK]
+            findings.extend(check_moduli(chunk, source))
+
+            done += len(chunk)
+            report_progress(engine='PGCD par lots', done=done, total=len(new),
+                            broken=len(findings), **rate_and_eta(done, len(new), time.time() - start_time))
+
+        return {
+            'success': True,
+            'imported': len(new),
+            'duplicates': len(received) - len(new),
+            'corpusSize': corpus_bdd.corpus_size(),
+            'findings': [serialize_finding(finding) for finding in findings],
+            'execution_time': time.time() - start_time
+        }
+    except Exception as e:
+        return {
+            'success': False,
+            'error': f"Erreur lors de l'import des modules: {str(e)}",
+            'execution_time': time.time() - start_time
+        }
+
+def serialize_finding(finding):
+    """Représentation JSON d'un module cassé (grands entiers en chaînes)"""
+    return {
+        'modulus': str(finding['modulus']),
+        'p': str(finding['p']),
+        'q': str(finding['q']),
+        'sharedWith': [str(m) for m in finding['sharedWith']]
+    }
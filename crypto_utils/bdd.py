@@ -0,0 +1,35 @@
+"""
+Module des bases de données locales
+Les bases SQLite (cache des factorisations, sessions de crackage, corpus
+RSA) sont écrites hors du paquet, dans le répertoire CRYPTOTOOLS_DATA_DIR
+(par défaut le dossier instance/ à la racine du projet). S'il n'est pas
+accessible en écriture (déploiement serverless), chaque module se replie
+sur la mémoire.
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+
+# Répertoire des bases de données
+DATA_DIR = Path(os.environ.get('CRYPTOTOOLS_DATA_DIR') or Path(__file__).parent.parent / "instance")
+
+def connect(path, **options):
+    """
+    Ouvre une base en mode WAL, en créant son répertoire si nécessaire.
+
+    Args:
+        path (Path): Chemin de la base
+        **options: Options de sqlite3.connect
+
+    Returns:
+        sqlite3.Connection: La connexion (sqlite3.Error si la base est inaccessible)
+    """
+    try:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        raise sqlite3.OperationalError(f"Répertoire de données inaccessible: {e}")
+    connection = sqlite3.connect(path, timeout=5, **options)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
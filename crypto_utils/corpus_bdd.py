@@ -0,0 +1,176 @@
+"""
+Module de stockage du corpus de modules RSA
+Conserve chaque module analysé ou importé dans la base SQLite locale
+rsa_corpus.db, pour rechercher les nombres premiers partagés entre clés,
+ainsi que les produits des blocs du corpus (coûteux à recalculer).
+Les modules sont aussi gardés en mémoire (entiers), dans l'ordre des lignes
+de la base, et seules les lignes ajoutées depuis la dernière lecture sont relues.
+"""
+
+import sqlite3
+import threading
+import time
+
+from crypto_utils.bdd import DATA_DIR, connect
+
+# Chemin de la base de données du corpus (voir bdd.DATA_DIR)
+DB_PATH = DATA_DIR / "rsa_corpus.db"
+
+_INSERT = "INSERT OR IGNORE INTO moduli (n, bits, source, added) VALUES (?, ?, ?, ?)"
+_SELECT_NEW = "SELECT rowid, n FROM moduli WHERE rowid > ? ORDER BY rowid"
+_SELECT_BLOCKS = "SELECT idx, size, last, product FROM blocks WHERE idx >= ? ORDER BY idx"
+_INSERT_BLOCK = "INSERT OR REPLACE INTO blocks (idx, size, last, product) VALUES (?, ?, ?, ?)"
+
+_local = threading.local()
+_schema_lock = threading.Lock()
+_schema_ready = False
+_disabled = False
+
+# Copie en mémoire du corpus : modules (entiers) dans l'ordre d'ajout, position
+# de chaque module, et dernière ligne lue dans la base
+_cache_lock = threading.Lock()
+_moduli = []
+_known = {}
+_last_rowid = 0
+
+def _connection():
+    """Connexion SQLite propre au thread courant (None si la base est inaccessible)"""
+    global _disabled, _schema_ready
+    if _disabled:
+        return None
+    connection = getattr(_local, 'connection', None)
+    if connection is not None:
+        return connection
+
+    try:
+        connection = connect(DB_PATH)
+        with _schema_lock:
+            if not _schema_ready:
+                # Module stocké en binaire (gros-boutiste) : relu bien plus vite qu'en décimal
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS moduli (n BLOB PRIMARY KEY, bits INTEGER, source TEXT, added REAL)"
+                )
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS blocks (idx INTEGER PRIMARY KEY, size INTEGER, last BLOB, product BLOB)"
+                )
+                connection.commit()
+                _schema_ready = True
+    except sqlite3.Error:
+        # Système de fichiers en lecture seule : corpus en mémoire uniquement
+        _disabled = True
+        return None
+
+    _local.connection = connection
+    return connection
+
+def _to_blob(n):
+    return n.to_bytes((n.bit_length() + 7) // 8, 'big')
+
+def _refresh():
+    """Ajoute au cache les modules enregistrés depuis la dernière lecture (par tout processus)"""
+    global _last_rowid
+    connection = _connection()
+    if connection is None:
+        return
+    try:
+        rows = connection.execute(_SELECT_NEW, (_last_rowid,)).fetchall()
+    except sqlite3.Error:
+        return
+    for rowid, blob in rows:
+        n = int.from_bytes(blob, 'big')
+        if n not in _known:
+            _known[n] = len(_moduli)
+            _moduli.append(n)
+        _last_rowid = rowid
+
+def load_moduli():
+    """
+    Retourne tous les modules du corpus.
+
+    Returns:
+        list: Les modules (entiers), dans l'ordre d'ajout
+    """
+    with _cache_lock:
+        _refresh()
+        return list(_moduli)
+
+def index_of(n):
+    """Position d'un module dans le corpus (None s'il n'y figure pas)"""
+    with _cache_lock:
+        _refresh()
+        return _known.get(n)
+
+def add_moduli(moduli, source=None):
+    """
+    Ajoute des modules au corpus (les doublons sont ignorés).
+
+    Args:
+        moduli (iterable): Les modules (entiers)
+        source (str): Provenance (analyse, import...)
+
+    Returns:
+        list: Les modules réellement ajoutés
+    """
+    now = time.time()
+    with _cache_lock:
+        _refresh()
+        added = [n for n in dict.fromkeys(moduli) if n > 1 and n not in _known]
+        if not added:
+            return added
+
+        connection = _connection()
+        if connection is not None:
+            try:
+                with connection:
+                    connection.executemany(_INSERT, ((_to_blob(n), n.bit_length(), source, now) for n in added))
+                # Relecture : l'ordre en mémoire reste celui des lignes de la base
+                _refresh()
+            except sqlite3.Error:
+                pass
+        for n in added:
+            if n not in _known:
+                _known[n] = len(_moduli)
+                _moduli.append(n)
+        return added
+
+def load_blocks(start):
+    """
+    Produits de blocs enregistrés à partir d'un indice.
+
+    Returns:
+        list: Tuples (indice, taille du bloc, dernier module du bloc, produit)
+    """
+    connection = _connection()
+    if connection is None:
+        return []
+    try:
+        rows = connection.execute(_SELECT_BLOCKS, (start,)).fetchall()
+    except sqlite3.Error:
+        return []
+    return [(idx, size, int.from_bytes(last, 'big'), int.from_bytes(product, 'big'))
+            for idx, size, last, product in rows]
+
+def store_block(index, size, last, product):
+    """
+    Enregistre le produit d'un bloc de modules.
+
+    Args:
+        index (int): Indice du bloc
+        size (int): Nombre de modules par bloc
+        last (int): Dernier module du bloc (contrôle de cohérence à la relecture)
+        product (int): Produit des modules du bloc
+    """
+    connection = _connection()
+    if connection is None:
+        return
+    try:
+        with connection:
+            connection.execute(_INSERT_BLOCK, (index, size, _to_blob(last), _to_blob(product)))
+    except sqlite3.Error:
+        pass
+
+def corpus_size():
+    """Nombre de modules du corpus"""
+    with _cache_lock:
+        _refresh()
+        return len(_moduli)
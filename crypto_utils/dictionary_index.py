@@ -0,0 +1,181 @@
+"""
+Module d'index des dictionnaires
+Pour chaque dictionnaire et chaque type de hash, un fichier binaire trié
+associe l'empreinte de chaque mot à sa position dans le dictionnaire. Les
+recherches se font par dichotomie dans le fichier projeté en mémoire (mmap),
+sans relire ni rehacher le dictionnaire.
+
+Construction hors ligne : python -m crypto_utils.dictionary_index [dictionnaire ...]
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import threading
+from pathlib import Path
+
+# Types de hash indexés (empreintes brutes, sans sel)
+INDEXED_HASH_TYPES = ('md5', 'sha1', 'sha256', 'sha512')
+
+# En-tête : signature, taille d'empreinte, nombre d'entrées, mtime (ns) et taille du dictionnaire
+INDEX_MAGIC = b'CTIDX1'
+_HEADER = struct.Struct('<6sBxQqQ')
+
+# Position du mot dans le dictionnaire (octets)
+_OFFSET = struct.Struct('<Q')
+
+_build_lock = threading.Lock()
+
+def index_path(dict_path, hash_type):
+    """Chemin du fichier d'index d'un dictionnaire pour un type de hash"""
+    dict_path = Path(dict_path)
+    return dict_path.with_name(f"{dict_path.name}.{hash_type}.idx")
+
+def _read_words(dict_path):
+    """
+    Parcourt le dictionnaire en binaire.
+
+    Returns:
+        generator: (position de la ligne en octets, mot nettoyé)
+    """
+    offset = 0
+    with open(dict_path, 'rb') as file:
+        for line in file:
+            # Même nettoyage que l'attaque par dictionnaire
+            yield offset, line.decode('utf-8', errors='ignore').strip()
+            offset += len(line)
+
+def build_index(dict_path, hash_type):
+    """
+    Construit (ou reconstruit) l'index d'un dictionnaire pour un type de hash.
+
+    Le fichier est écrit à côté puis renommé, une lecture concurrente voit
+    donc toujours un index complet.
+
+    Args:
+        dict_path (Path): Le dictionnaire
+        hash_type (str): Type de hash (md5, sha1, sha256, sha512)
+
+    Returns:
+        Path: Le fichier d'index créé
+    """
+    hash_func = getattr(hashlib, hash_type)
+    digest_size = hash_func().digest_size
+    stat = os.stat(dict_path)
+
+    entries = sorted(
+        (hash_func(word.encode()).digest(), offset) for offset, word in _read_words(dict_path)
+    )
+
+    path = index_path(dict_path, hash_type)
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(temporary, 'wb') as file:
+        file.write(_HEADER.pack(INDEX_MAGIC, digest_size, len(entries), stat.st_mtime_ns, stat.st_size))
+        for digest, offset in entries:
+            file.write(digest)
+            file.write(_OFFSET.pack(offset))
+    os.replace(temporary, path)
+    return path
+
+def _read_header(path):
+    """Lit l'en-tête d'un index, ou None s'il est absent ou illisible"""
+    try:
+        with open(path, 'rb') as file:
+            header = file.read(_HEADER.size)
+    except OSError:
+        return None
+    if len(header) != _HEADER.size:
+        return None
+    magic, digest_size, count, mtime_ns, size = _HEADER.unpack(header)
+    if magic != INDEX_MAGIC:
+        return None
+    return digest_size, count, mtime_ns, size
+
+def ensure_index(dict_path, hash_type):
+    """
+    Retourne l'index à jour d'un dictionnaire, en le reconstruisant si le
+    dictionnaire a changé (date de modification ou taille).
+
+    Returns:
+        Path: Le fichier d'index, ou None s'il ne peut pas être construit
+        (type non indexé, système de fichiers en lecture seule...)
+    """
+    if hash_type not in INDEXED_HASH_TYPES:
+        return None
+    path = index_path(dict_path, hash_type)
+    try:
+        stat = os.stat(dict_path)
+    except OSError:
+        return None
+
+    header = _read_header(path)
+    if header is not None and header[2:] == (stat.st_mtime_ns, stat.st_size):
+        return path
+
+    with _build_lock:
+        header = _read_header(path)
+        if header is not None and header[2:] == (stat.st_mtime_ns, stat.st_size):
+            return path
+        try:
+            return build_index(dict_path, hash_type)
+        except OSError:
+            return None
+
+def lookup_digests(dict_path, hash_type, digests):
+    """
+    Cherche des empreintes dans l'index d'un dictionnaire.
+
+    Args:
+        dict_path (Path): Le dictionnaire
+        hash_type (str): Type de hash
+        digests (iterable): Empreintes brutes recherchées
+
+    Returns:
+        tuple: (dict empreinte -> mot trouvé, nombre de mots indexés), ou
+        None si aucun index n'est disponible
+    """
+    path = ensure_index(dict_path, hash_type)
+    if path is None:
+        return None
+
+    with open(path, 'rb') as file:
+        _, digest_size, count, _, _ = _HEADER.unpack(file.read(_HEADER.size))
+        if count == 0:
+            return {}, 0
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as index:
+            record_size = digest_size + _OFFSET.size
+            offsets = {}
+            for digest in digests:
+                # Dichotomie : première entrée dont l'empreinte est >= digest
+                low, high = 0, count
+                while low < high:
+                    middle = (low + high) // 2
+                    position = _HEADER.size + middle * record_size
+                    if index[position:position + digest_size] < digest:
+                        low = middle + 1
+                    else:
+                        high = middle
+                position = _HEADER.size + low * record_size
+                if low < count and index[position:position + digest_size] == digest:
+                    offsets[digest] = _OFFSET.unpack_from(index, position + digest_size)[0]
+
+    found = {}
+    if offsets:
+        with open(dict_path, 'rb') as file:
+            for digest, offset in offsets.items():
+                file.seek(offset)
+                found[digest] = file.readline().decode('utf-8', errors='ignore').strip()
+    return found, count
+
+if __name__ == '__main__':
+    from crypto_utils.hash_cracker import DICTIONARIES
+
+    paths = [Path(arg) for arg in sys.argv[1:]] or list(DICTIONARIES.values())
+    for dict_path in paths:
+        if not dict_path.exists():
+            print(f"Dictionnaire non trouvé: {dict_path}")
+            continue
+        for hash_type in INDEXED_HASH_TYPES:
+            print(f"Index créé: {build_index(dict_path, hash_type)}")
@@ -0,0 +1,169 @@
+"""
+Module client de FactorDB
+Une seule session HTTP (connexions réutilisées) pour toutes les recherches,
+des délais de connexion et de lecture bornés, quelques nouvelles tentatives
+sur les erreurs transitoires, et une seule requête en vol par nombre : les
+recherches simultanées du même n attendent la même réponse.
+
+L'adresse de l'API se règle par la variable d'environnement FACTORDB_ENDPOINT
+(voir crypto_utils.factordb_mock pour un serveur local de substitution).
+"""
+
+import math
+import os
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+from crypto_utils import metrics
+
+DEFAULT_ENDPOINT = "http://factordb.com/api"
+FACTORDB_ENDPOINT = os.environ.get('FACTORDB_ENDPOINT', DEFAULT_ENDPOINT)
+
+# Délais de connexion et de lecture d'une requête (secondes)
+CONNECT_TIMEOUT = 3.0
+READ_TIMEOUT = 10.0
+
+# Attente maximale d'une recherche synchrone, nouvelles tentatives comprises (secondes)
+LOOKUP_DEADLINE = 15.0
+
+# Nouvelles tentatives sur erreur de connexion ou réponse 429/5xx, et base du délai entre elles
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.2
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Connexions conservées par la session, et nombre maximal de requêtes simultanées
+POOL_SIZE = 8
+
+# Statuts de FactorDB pour lesquels la liste des facteurs est complète
+# (FF : entièrement factorisé, P : premier prouvé)
+COMPLETE_STATUSES = ('FF', 'P')
+
+_session = None
+# Recherches en cours : n -> Future partagé par tous les demandeurs
+_inflight = {}
+_lock = threading.Lock()
+_slots = threading.BoundedSemaphore(POOL_SIZE)
+
+def _reset_after_fork():
+    """Un processus fils n'hérite ni des threads ni des connexions du parent"""
+    global _session, _inflight, _lock, _slots
+    _session = None
+    _inflight = {}
+    _lock = threading.Lock()
+    _slots = threading.BoundedSemaphore(POOL_SIZE)
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+def _get_session():
+    """Session HTTP partagée, créée à la première recherche (requests est importé à ce moment)"""
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(total=MAX_RETRIES, read=0, backoff_factor=RETRY_BACKOFF,
+                      status_forcelist=RETRY_STATUSES, allowed_methods=('GET',),
+                      raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE, max_retries=retry)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _session = session
+    return _session
+
+def _fetch(n):
+    """
+    Interroge l'API pour n.
+
+    Returns:
+        dict: Statut FactorDB et facteurs premiers connus (avec multiplicité)
+    """
+    import requests
+    from urllib3.exceptions import NewConnectionError, TimeoutError as Urllib3TimeoutError
+
+    try:
+        response = _get_session().get(FACTORDB_ENDPOINT, params={'query': str(n)},
+                                      timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+        response.raise_for_status()
+        data = response.json()
+    except requests.RequestException as e:
+        # Après les nouvelles tentatives, un délai dépassé arrive enveloppé dans une erreur
+        # de connexion ; NewConnectionError (connexion refusée) dérive du délai dans urllib3
+        reason = getattr(e.args[0], 'reason', None) if e.args else None
+        timed_out = isinstance(e, requests.Timeout) or isinstance(reason, Urllib3TimeoutError)
+        if timed_out and not isinstance(reason, NewConnectionError):
+            raise TimeoutError("FactorDB n'a pas répondu à temps")
+        if isinstance(e, requests.HTTPError):
+            raise ConnectionError(f"FactorDB a répondu par une erreur HTTP {e.response.status_code}")
+        raise ConnectionError(f"FactorDB injoignable ({type(reason or e).__name__})")
+    except ValueError:
+        raise ConnectionError("Réponse de FactorDB illisible")
+
+    factors = [int(p) for p, exponent in data.get('factors') or [] for _ in range(int(exponent))]
+    return {'status': data.get('status'), 'factors': factors}
+
+def _run_lookup(n, future):
+    """Exécute une recherche puis la retire des recherches en cours"""
+    start_time = time.time()
+    try:
+        with _slots:
+            found = _fetch(n)
+        outcome = 'success' if complete_factors(n, found) else 'failure'
+    except Exception as e:
+        found = e
+        outcome = 'timeout' if isinstance(e, TimeoutError) else 'error'
+    metrics.record_run('factordb', time.time() - start_time, outcome)
+    with _lock:
+        if _inflight.get(n) is future:
+            del _inflight[n]
+    if isinstance(found, Exception):
+        future.set_exception(found)
+    else:
+        future.set_result(found)
+
+def submit_lookup(n):
+    """
+    Lance la recherche de n en arrière-plan, ou rejoint celle déjà en cours.
+    Le thread de recherche ne retient pas l'arrêt du processus.
+
+    Returns:
+        Future: Résultat de _fetch (statut, facteurs)
+    """
+    with _lock:
+        future = _inflight.get(n)
+        if future is not None:
+            return future
+        future = Future()
+        _inflight[n] = future
+    threading.Thread(target=_run_lookup, args=(n, future), name='factordb', daemon=True).start()
+    return future
+
+def lookup(n, deadline=LOOKUP_DEADLINE):
+    """
+    Recherche synchrone de n.
+
+    Args:
+        n (int): Le nombre
+        deadline (float): Attente maximale en secondes
+
+    Returns:
+        dict: Statut FactorDB et facteurs premiers connus
+    """
+    try:
+        return submit_lookup(n).result(timeout=deadline)
+    except FutureTimeoutError:
+        raise TimeoutError("FactorDB n'a pas répondu à temps")
+
+def complete_factors(n, found):
+    """
+    Facteurs d'une réponse qui factorise entièrement n, sinon None (statut
+    incomplet ou produit différent de n).
+    """
+    if found['status'] not in COMPLETE_STATUSES or not found['factors']:
+        return None
+    if math.prod(found['factors']) != n or any(p < 2 for p in found['factors']):
+        return None
+    return sorted(found['factors'])
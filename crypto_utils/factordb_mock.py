@@ -0,0 +1,112 @@
+"""
+Module de serveur FactorDB local
+Répond à GET /api?query=n comme l'API de FactorDB, à partir des
+factorisations qu'on lui fournit (statut FF), du test de primalité (P) ou
+sans facteur connu (C). Un délai de réponse et des erreurs 503 peuvent être
+simulés pour vérifier les délais, les nouvelles tentatives et le
+regroupement des recherches sans accès au réseau.
+
+Utilisation : python -m crypto_utils.factordb_mock [port] [délai]
+puis FACTORDB_ENDPOINT=http://127.0.0.1:<port>/api python app.py
+"""
+
+import json
+import math
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from crypto_utils.factorizer import is_prime
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        url = urlparse(self.path)
+        with server.lock:
+            server.requests += 1
+            failing = server.failures > 0
+            if failing:
+                server.failures -= 1
+        if server.delay:
+            time.sleep(server.delay)
+        if url.path != '/api':
+            self.send_error(404)
+            return
+        if failing:
+            self.send_error(503)
+            return
+        try:
+            n = int(parse_qs(url.query)['query'][0])
+        except (KeyError, ValueError):
+            self.send_error(400)
+            return
+        body = json.dumps(mock_response(n, server.known)).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def mock_response(n, known):
+    """
+    Réponse de l'API pour n.
+
+    Args:
+        n (int): Le nombre demandé
+        known (dict): Factorisations connues, n -> liste des facteurs premiers
+
+    Returns:
+        dict: id, statut et facteurs [[facteur, exposant], ...] au format FactorDB
+    """
+    if n in known:
+        status, factors = 'FF', sorted(known[n])
+    elif n > 1 and is_prime(n):
+        status, factors = 'P', [n]
+    else:
+        status, factors = 'C', [n]
+    grouped = [[str(p), factors.count(p)] for p in sorted(set(factors))]
+    return {'id': str(n), 'status': status, 'factors': grouped}
+
+def start_mock_server(known=None, delay=0.0, failures=0, port=0):
+    """
+    Démarre le serveur dans un thread.
+
+    Args:
+        known (dict): Factorisations connues (n -> facteurs premiers)
+        delay (float): Délai avant chaque réponse (secondes)
+        failures (int): Nombre de premières requêtes répondues par une erreur 503
+        port (int): Port d'écoute (0 : choisi par le système)
+
+    Returns:
+        tuple: (serveur, adresse de l'API) ; server.requests compte les requêtes
+        reçues, server.shutdown() arrête le serveur
+    """
+    known = {n: list(factors) for n, factors in (known or {}).items()}
+    for n, factors in known.items():
+        if math.prod(factors) != n:
+            raise ValueError(f"Factorisation incorrecte de {n}")
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), _Handler)
+    server.daemon_threads = True
+    server.known = known
+    server.delay = delay
+    server.failures = failures
+    server.requests = 0
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, name='factordb-mock', daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/api"
+
+if __name__ == '__main__':
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.0
+    server, endpoint = start_mock_server(delay=delay, port=port)
+    print(f"FactorDB local sur {endpoint} (FACTORDB_ENDPOINT={endpoint})")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -1,2 +1,168 @@
-# Ce module n'est plus utilisé : la gestion de la base de données locale pour la factorisation a été retirée.
+"""
+Module de cache des factorisations
+Conserve les résultats (complets ou partiels) dans la base SQLite locale
+factorization_cache.db, avec un cache LRU en mémoire devant la base.
+"""
 
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from crypto_utils.bdd import DATA_DIR, connect
+
+# Chemin de la base de données du cache (voir bdd.DATA_DIR)
+DB_PATH = DATA_DIR / "factorization_cache.db"
+
+# Nombre maximal d'entrées du cache en mémoire
+LRU_SIZE = 1024
+
+# Les nombres plus petits se factorisent plus vite qu'une lecture en base
+MIN_CACHED_DIGITS = 12
+
+# Requêtes SQL constantes : sqlite3 conserve leur forme préparée par connexion
+_SELECT = "SELECT factors, cofactor, method, execution_time FROM factorizations WHERE number = ?"
+_UPSERT = (
+    "INSERT INTO factorizations (number, factors, cofactor, method, execution_time, timestamp) "
+    "VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(number) DO UPDATE SET factors = excluded.factors, cofactor = excluded.cofactor, "
+    "method = excluded.method, execution_time = excluded.execution_time, timestamp = excluded.timestamp"
+)
+
+_lru = OrderedDict()
+_lru_lock = threading.Lock()
+_local = threading.local()
+_schema_lock = threading.Lock()
+_schema_ready = False
+_disabled = False
+
+def _connection():
+    """Connexion SQLite propre au thread courant (None si la base est inaccessible)"""
+    global _disabled, _schema_ready
+    if _disabled:
+        return None
+    connection = getattr(_local, 'connection', None)
+    if connection is not None:
+        return connection
+
+    try:
+        connection = connect(DB_PATH, cached_statements=16)
+        with _schema_lock:
+            if not _schema_ready:
+                _ensure_schema(connection)
+                _schema_ready = True
+    except sqlite3.Error:
+        # Système de fichiers en lecture seule (ex. déploiement serverless) :
+        # seul le cache en mémoire reste actif
+        _disabled = True
+        return None
+
+    _local.connection = connection
+    return connection
+
+def _ensure_schema(connection):
+    """Crée la table ou ajoute les colonnes manquantes aux anciennes bases"""
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS factorizations ("
+        "number TEXT PRIMARY KEY, factors TEXT, method TEXT, timestamp REAL)"
+    )
+    columns = {row[1] for row in connection.execute("PRAGMA table_info(factorizations)")}
+    if 'cofactor' not in columns:
+        connection.execute("ALTER TABLE factorizations ADD COLUMN cofactor TEXT")
+    if 'execution_time' not in columns:
+        connection.execute("ALTER TABLE factorizations ADD COLUMN execution_time REAL")
+    connection.commit()
+
+def _remember(n, entry):
+    """Place une entrée en tête du cache LRU"""
+    with _lru_lock:
+        _lru[n] = entry
+        _lru.move_to_end(n)
+        while len(_lru) > LRU_SIZE:
+            _lru.popitem(last=False)
+
+def get_cached_factorization(n):
+    """
+    Recherche une factorisation connue de n.
+
+    Args:
+        n (int): Le nombre recherché
+
+    Returns:
+        dict: {'factors', 'cofactor', 'method', 'execution_time'} où cofactor
+        vaut None si la factorisation est complète, ou None si n est inconnu
+    """
+    if len(str(n)) < MIN_CACHED_DIGITS:
+        return None
+
+    with _lru_lock:
+        entry = _lru.get(n)
+        if entry is not None:
+            _lru.move_to_end(n)
+            return entry
+
+    connection = _connection()
+    if connection is None:
+        return None
+    try:
+        row = connection.execute(_SELECT, (str(n),)).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        return None
+
+    factors, cofactor, method, execution_time = row
+    entry = {
+        'factors': [int(f) for f in json.loads(factors)],
+        'cofactor': int(cofactor) if cofactor else None,
+        'method': method,
+        'execution_time': execution_time
+    }
+    _remember(n, entry)
+    return entry
+
+def store_factorization(n, factors, method, execution_time=None, cofactor=None):
+    """
+    Enregistre une factorisation complète, ou partielle si cofactor est fourni.
+
+    Une factorisation complète déjà connue n'est jamais remplacée par un
+    résultat partiel.
+
+    Args:
+        n (int): Le nombre factorisé
+        factors (list): Facteurs premiers trouvés
+        method (str): Méthode ayant produit le résultat
+        execution_time (float): Durée du calcul en secondes
+        cofactor (int): Partie de n restant à factoriser (None si complet)
+    """
+    if len(str(n)) < MIN_CACHED_DIGITS:
+        return
+    if cofactor is not None:
+        known = get_cached_factorization(n)
+        if known is not None and known['cofactor'] is None:
+            return
+
+    entry = {
+        'factors': sorted(factors),
+        'cofactor': cofactor,
+        'method': method,
+        'execution_time': execution_time
+    }
+    _remember(n, entry)
+
+    connection = _connection()
+    if connection is None:
+        return
+    try:
+        with connection:
+            connection.execute(_UPSERT, (
+                str(n),
+                json.dumps(entry['factors']),
+                str(cofactor) if cofactor is not None else None,
+                method,
+                execution_time,
+                time.time()
+            ))
+    except sqlite3.Error:
+        pass
@@ -5,22 +5,38 @@ Implémente différentes méthodes pour tenter de retrouver un texte original à
 """
 
 import time
-import hashlib
-import itertools
+import multiprocessing
 import os
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from pathlib import Path
 
-def crack_hash(hash_value, hash_type, wordlist=None, mode="bruteforce", charset_name="alphanumeric", max_length=6):
+from crypto_utils import metrics
+from crypto_utils.dictionary_index import INDEXED_HASH_TYPES, lookup_digests
+from crypto_utils.hash_formats import get_hash_format, hash_type_supported, parse_hash
+from crypto_utils.mangling_rules import compile_rule, mangle, resolve_rules
+from crypto_utils.progress import (PROGRESS_INTERVAL, progress_due, rate_and_eta, report_progress,
+                                   set_progress_channel, worker_count)
+from crypto_utils.sessions_bdd import load_session, save_session
+
+def crack_hash(hash_value, hash_type, wordlist=None, mode="bruteforce", charset_name="alphanumeric", max_length=6,
+               rules=None, mask=None, custom_charsets=None, skip=0):
     """
     Tente de retrouver le texte original à partir d'un hash.
 
     Args:
         hash_value (str): Le hash à cracker
-        hash_type (str): Type de hash (md5, sha1, sha256, sha512)
+        hash_type (str): Type de hash (voir hash_formats.HASH_FORMATS), ou
+            'auto' pour le détecter d'après la forme du hash
         wordlist (str): Nom du dictionnaire à utiliser en mode dictionary
-        mode (str): Mode d'attaque ("dictionary" ou "bruteforce")
+        mode (str): Mode d'attaque ("dictionary", "bruteforce" ou "mask")
         charset_name (str): Jeu de caractères pour le mode bruteforce
         max_length (int): Longueur maximale pour la force brute
+        rules (str | list): Règles de transformation des mots en mode dictionary
+            (nom d'un jeu de mangling_rules.RULESETS ou liste de règles)
+        mask (str): Masque pour le mode mask, ex. '?u?l?l?l?d?d?d?d'
+        custom_charsets (dict): Jeux personnalisés du masque, ex. {'1': '?l?d'}
+        skip (int): Indice du premier candidat du masque (reprise)
 
     Returns:
         dict: Résultats du crackage avec succès ou échec
@@ -35,23 +51,33 @@ def crack_hash(hash_value, hash_type, wordlist=None, mode="bruteforce", charset_
             'execution_time': time.time() - start_time
         }
 
-    # Normaliser le hash (enlever les espaces et convertir en minuscules)
-    hash_value = hash_value.strip().lower()
-
-    # Obtenir la fonction de hash correspondante
-    hash_func = get_hash_function(hash_type)
-    if not hash_func:
+    if not hash_type_supported(hash_type):
         return {
             'success': False,
             'error': f"Type de hash non supporté: {hash_type}",
             'execution_time': time.time() - start_time
         }
 
+    # Lire le hash (sel, paramètres et empreinte) et le normaliser
+    parsed = parse_hash(hash_value, hash_type)
+    if parsed is None:
+        return {
+            'success': False,
+            'error': f"Hash invalide pour le type {hash_type}",
+            'execution_time': time.time() - start_time
+        }
+    hash_value, target = parsed
+    hash_type = target[0]
+
     # Exécuter la méthode de crackage appropriée
     if mode == "dictionary":
-        return dictionary_attack(hash_value, hash_func, wordlist, start_time, hash_type)
+        return _record_attack(mode, dictionary_attack(hash_value, target, wordlist, start_time, hash_type, rules))
     elif mode == "bruteforce":
-        return bruteforce_attack(hash_value, hash_func, charset_name, max_length, start_time, hash_type)
+        return _record_attack(mode, bruteforce_attack(hash_value, target, charset_name, max_length, start_time,
+                                                      hash_type))
+    elif mode == "mask":
+        return _record_attack(mode, mask_attack(hash_value, target, mask or '', start_time, hash_type,
+                                                custom_charsets, skip))
     else:
         return {
             'success': False,
@@ -59,49 +85,196 @@ def crack_hash(hash_value, hash_type, wordlist=None, mode="bruteforce", charset_
             'execution_time': time.time() - start_time
         }
 
-def get_hash_function(hash_type):
+def _record_attack(mode, result, attempts=None):
+    """Enregistre une attaque terminée (issue et candidats testés) et retourne son résultat"""
+    if not result['success']:
+        outcome = 'error'
+    else:
+        outcome = 'success' if result.get('found') or result.get('found_count') else 'failure'
+    metrics.record_run(f"hash/{mode}", result['execution_time'], outcome,
+                       candidates=result.get('attempts', 0) if attempts is None else attempts)
+    return result
+
+# Chemins vers les dictionnaires
+DICTIONARIES_DIR = Path(__file__).parent.parent / "dictionaries"
+DICTIONARIES = {
+    'common': DICTIONARIES_DIR / "common_passwords.txt",
+    'french': DICTIONARIES_DIR / "french.txt",
+    'english': DICTIONARIES_DIR / "english.txt"
+}
+
+# Nombre maximal de hashs d'une attaque groupée
+MAX_BATCH_HASHES = 100000
+
+# Fréquence (en candidats) du test de publication de l'avancement d'un dictionnaire
+PROGRESS_CHECK_INTERVAL = 4096
+
+def _target_groups(targets):
+    """
+    Regroupe des cibles (type, sel, empreinte) par type et sel : chaque
+    candidat n'est haché qu'une fois par groupe.
+
+    Returns:
+        list: (type, sel, frozenset des empreintes du groupe)
+    """
+    groups = {}
+    for hash_type, salt, digest in targets:
+        groups.setdefault((hash_type, salt), set()).add(digest)
+    return [(hash_type, salt, frozenset(digests)) for (hash_type, salt), digests in groups.items()]
+
+def _target_hashers(targets):
+    """
+    Fonctions de vérification des cibles, construites une fois par groupe.
+
+    Returns:
+        list: (fonction candidat -> empreinte, type, sel, empreintes du groupe)
+    """
+    return [(get_hash_format(hash_type)['hasher'](salt), hash_type, salt, digests)
+            for hash_type, salt, digests in _target_groups(targets)]
+
+def _dictionary_search(targets, dict_path):
     """
-    Retourne la fonction de hachage correspondant au type spécifié.
+    Hache chaque mot du dictionnaire une seule fois par groupe de cibles et
+    le compare à toutes les cibles du groupe.
 
     Args:
-        hash_type (str): Type de hash (md5, sha1, sha256, sha512)
+        targets (frozenset): Cibles recherchées (type, sel, empreinte)
+        dict_path (Path): Le fichier du dictionnaire
 
     Returns:
-        function: La fonction de hachage correspondante ou None si non supportée
+        tuple: (dict cible -> texte trouvé, nombre de tentatives)
     """
-    hash_functions = {
-        'md5': hashlib.md5,
-        'sha1': hashlib.sha1,
-        'sha256': hashlib.sha256,
-        'sha512': hashlib.sha512
+    hashers = _target_hashers(targets)
+    found = {}
+    attempts = 0
+    start_time = time.time()
+    size = os.path.getsize(dict_path)
+    with open(dict_path, 'rb') as file:
+        for line in file:
+            attempts += 1
+
+            # Nettoyer le mot
+            word = line.decode('utf-8', errors='ignore').strip()
+            candidate = word.encode()
+
+            for hasher, hash_type, salt, digests in hashers:
+                digest = hasher(candidate)
+                if digest in digests and (hash_type, salt, digest) not in found:
+                    found[(hash_type, salt, digest)] = word
+                    if len(found) == len(targets):
+                        return found, attempts
+
+            if attempts % PROGRESS_CHECK_INTERVAL == 0 and progress_due():
+                _publish_dictionary_progress(attempts, file.tell(), size, start_time)
+    return found, attempts
+
+def _publish_dictionary_progress(attempts, position, size, start_time, rule=None):
+    """Publie tentatives, débit, pourcentage du dictionnaire parcouru et temps restant"""
+    elapsed = time.time() - start_time
+    progress = {
+        'engine': 'dictionnaire',
+        'attempts': attempts,
+        'rate': attempts / elapsed if elapsed > 0 else 0.0,
+        'percent': 100.0 * position / size if size else None,
+        'eta': elapsed * (size - position) / position if position else None
     }
+    if rule is not None:
+        progress['rule'] = rule
+    report_progress(**progress)
+
+def _dictionary_rules_search(targets, dict_path, rules):
+    """
+    Décline chaque mot du dictionnaire par les règles et compare chaque
+    candidat à toutes les cibles.
+
+    Returns:
+        tuple: (dict cible -> texte trouvé, nombre de tentatives,
+        dict cible -> règle ayant produit le texte)
+    """
+    hashers = _target_hashers(targets)
+    found = {}
+    matched_rules = {}
+    attempts = 0
+    start_time = time.time()
+    size = os.path.getsize(dict_path)
+    with open(dict_path, 'rb') as file:
+        # Même nettoyage que l'attaque sans règles
+        words = (line.decode('utf-8', errors='ignore').strip().encode() for line in file)
+        for candidate, rule_index in mangle(words, rules):
+            attempts += 1
+            for hasher, hash_type, salt, digests in hashers:
+                digest = hasher(candidate)
+                if digest in digests and (hash_type, salt, digest) not in found:
+                    found[(hash_type, salt, digest)] = candidate.decode('utf-8', errors='replace')
+                    matched_rules[(hash_type, salt, digest)] = rules[rule_index]
+                    if len(found) == len(targets):
+                        return found, attempts, matched_rules
+
+            if attempts % PROGRESS_CHECK_INTERVAL == 0 and progress_due():
+                _publish_dictionary_progress(attempts, file.tell(), size, start_time, rules[rule_index])
+    return found, attempts, matched_rules
+
+def _dictionary_lookup(targets, dict_path, rules=None):
+    """
+    Sans règles, cherche les cibles non salées dans l'index trié du
+    dictionnaire, et le parcourt pour les autres (ou si l'index n'est pas
+    disponible). Avec des règles, chaque mot est décliné avant d'être haché.
 
-    return hash_functions.get(hash_type.lower())
+    Returns:
+        tuple: (dict cible -> texte trouvé, nombre de mots testés,
+        dict cible -> règle ayant produit le texte)
+    """
+    if rules:
+        return _dictionary_rules_search(targets, dict_path, rules)
+
+    found = {}
+    attempts = 0
+    remaining = set(targets)
+    for hash_type, salt, digests in _target_groups(targets):
+        if hash_type not in INDEXED_HASH_TYPES or salt:
+            continue
+        indexed = lookup_digests(dict_path, hash_type, digests)
+        if indexed is None:
+            continue
+        found.update(((hash_type, salt, digest), word) for digest, word in indexed[0].items())
+        attempts = max(attempts, indexed[1])
+        remaining -= {(hash_type, salt, digest) for digest in digests}
+
+    if remaining:
+        scanned, scan_attempts = _dictionary_search(frozenset(remaining), dict_path)
+        found.update(scanned)
+        attempts = max(attempts, scan_attempts)
+    return found, attempts, {}
+
+def rule_hits(matched_rules):
+    """
+    Statistiques des règles : nombre de hashs trouvés par chaque règle.
+
+    Returns:
+        dict: règle -> nombre de hashs trouvés, du plus au moins efficace
+    """
+    hits = {}
+    for rule in matched_rules.values():
+        hits[rule] = hits.get(rule, 0) + 1
+    return dict(sorted(hits.items(), key=lambda item: -item[1]))
 
-def dictionary_attack(hash_value, hash_func, wordlist, start_time, hash_type):
+def dictionary_attack(hash_value, target, wordlist, start_time, hash_type, rules=None):
     """
     Tente de cracker un hash en utilisant une attaque par dictionnaire.
 
     Args:
         hash_value (str): Le hash à cracker
-        hash_func (function): La fonction de hash à utiliser
+        target (tuple): Le hash lu par parse_hash (type, sel, empreinte)
         wordlist (str): Le dictionnaire à utiliser
         start_time (float): Heure de début pour calculer le temps d'exécution
         hash_type (str): Type de hash pour le rapport
+        rules (str | list): Règles de transformation des mots (optionnel)
 
     Returns:
         dict: Résultat de l'attaque
     """
-    # Chemins vers les dictionnaires
-    base_dir = Path(__file__).parent.parent / "dictionaries"
-    dictionaries = {
-        'common': base_dir / "common_passwords.txt",
-        'french': base_dir / "french.txt",
-        'english': base_dir / "english.txt"
-    }
-
     # Récupérer le chemin du dictionnaire
-    dict_path = dictionaries.get(wordlist, dictionaries['common'])
+    dict_path = DICTIONARIES.get(wordlist, DICTIONARIES['common'])
 
     # Vérifier si le fichier existe
     if not dict_path.exists():
@@ -111,36 +284,29 @@ def dictionary_attack(hash_value, hash_func, wordlist, start_time, hash_type):
             'execution_time': time.time() - start_time
         }
 
-    # Compteur de tentatives
-    attempts = 0
-
     try:
-        # Lire le dictionnaire et tester chaque mot
-        with open(dict_path, 'r', encoding='utf-8', errors='ignore') as file:
-            for line in file:
-                attempts += 1
+        if rules:
+            rules = resolve_rules(rules)
+        found, attempts, matched_rules = _dictionary_lookup(frozenset([target]), dict_path, rules)
 
-                # Nettoyer le mot
-                word = line.strip()
-
-                # Calculer le hash du mot
-                word_hash = hash_func(word.encode()).hexdigest()
-
-                # Vérifier si le hash correspond
-                if word_hash == hash_value:
-                    return {
-                        'success': True,
-                        'found': True,
-                        'hash': hash_value,
-                        'original': word,
-                        'type': hash_type,
-                        'mode': 'dictionary',
-                        'attempts': attempts,
-                        'execution_time': time.time() - start_time
-                    }
+        if target in found:
+            result = {
+                'success': True,
+                'found': True,
+                'hash': hash_value,
+                'original': found[target],
+                'type': hash_type,
+                'mode': 'dictionary',
+                'attempts': attempts,
+                'execution_time': time.time() - start_time
+            }
+            if rules:
+                result['rule'] = matched_rules[target]
+                result['rule_hits'] = rule_hits(matched_rules)
+            return result
 
         # Si aucune correspondance n'est trouvée
-        return {
+        result = {
             'success': True,
             'found': False,
             'hash': hash_value,
@@ -149,6 +315,9 @@ def dictionary_attack(hash_value, hash_func, wordlist, start_time, hash_type):
             'attempts': attempts,
             'execution_time': time.time() - start_time
         }
+        if rules:
+            result['rule_hits'] = {}
+        return result
 
     except Exception as e:
         return {
@@ -157,71 +326,403 @@ def dictionary_attack(hash_value, hash_func, wordlist, start_time, hash_type):
             'execution_time': time.time() - start_time
         }
 
-def bruteforce_attack(hash_value, hash_func, charset_name, max_length, start_time, hash_type):
+# Jeux de caractères disponibles pour la force brute
+CHARSETS = {
+    "numeric": "0123456789",
+    "alpha": "abcdefghijklmnopqrstuvwxyz",
+    "alphanumeric": "abcdefghijklmnopqrstuvwxyz0123456789",
+    "full": "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*()-_=+[]{}|;:,.<>?/"
+}
+
+# Nombre maximal de tentatives d'une attaque par force brute
+MAX_BRUTEFORCE_ATTEMPTS = 10000000
+
+# En dessous de cette taille d'espace de clés, la recherche reste dans le processus courant
+MIN_PARALLEL_KEYSPACE = 200000
+
+# Taille minimale d'un segment de l'espace de clés confié à un processus
+MIN_SHARD_SIZE = 50000
+
+# Fréquence (en candidats) de vérification du signal d'arrêt partagé
+STOP_CHECK_INTERVAL = 10000
+
+# Plages soumises d'avance à chaque processus de travail
+SHARDS_IN_FLIGHT = 2
+
+# Signal d'arrêt et compteur de tentatives partagés, installés dans chaque processus de travail
+_stop_event = None
+_progress_counter = None
+
+# Recherche en cours dans ce processus (pour la publication de l'avancement)
+_search = None
+
+def _init_bruteforce_worker(stop_event, progress_counter):
+    """Initialise un processus de travail avec le signal d'arrêt et le compteur partagés"""
+    global _stop_event, _progress_counter
+    _stop_event = stop_event
+    _progress_counter = progress_counter
+    # Seul le processus de la tâche publie l'avancement
+    set_progress_channel(None)
+
+def _count_attempts(count):
+    """Ajoute des tentatives au compteur partagé et publie l'avancement si nécessaire"""
+    if _progress_counter is not None:
+        with _progress_counter.get_lock():
+            _progress_counter.value += count
+    elif _search is not None:
+        _search['counted'] += count
+    if _search is not None and progress_due():
+        _publish_search_progress()
+
+def _publish_search_progress(force=False):
+    """Publie débit, indice courant, longueur, pourcentage et temps restant de la recherche"""
+    counted = _progress_counter.value if _progress_counter is not None else _search['counted']
+    attempts = _search['done'] + counted
+    index = _search['index'] + counted
+    length = None
+    offset = 0
+    for positions, start, stop in _search['segments']:
+        offset += stop - start
+        length = len(positions)
+        if index < _search['index'] + offset:
+            break
+    report_progress(
+        force=force,
+        engine='force brute',
+        attempts=attempts,
+        index=index,
+        length=length,
+        **rate_and_eta(attempts, _search['total'], time.time() - _search['start'], _search['initial'])
+    )
+
+def _bruteforce_shard(targets, positions, start, stop):
+    """
+    Parcourt les candidats d'indices [start, stop) d'un espace de clés à base
+    mixte : positions[i] est le jeu de caractères de la position i, la
+    dernière position variant le plus vite.
+
+    Le préfixe (tous les caractères sauf le dernier) est un odomètre dans un
+    bytearray préalloué ; pour les formats qui le permettent, il n'est haché
+    qu'une fois par groupe de cibles, et chaque candidat part d'une copie de
+    cet état à laquelle on ajoute la fin du candidat (dernier caractère,
+    et sel éventuel).
+
+    Args:
+        targets (frozenset): Cibles recherchées (type, sel, empreinte)
+        positions (list): Jeux de caractères (ASCII) de chaque position
+        start (int): Premier indice
+        stop (int): Indice de fin (exclu)
+
+    Returns:
+        tuple: (dict cible -> texte trouvé, nombre de tentatives)
+    """
+    symbols = [charset.encode() for charset in positions]
+    bases = [len(charset) for charset in positions]
+    last_base = bases[-1]
+    last_symbols = [symbols[-1][i:i + 1] for i in range(last_base)]
+
+    # Par groupe : état du préfixe et fins des candidats, ou vérification complète
+    groups = []
+    for hash_type, salt, digests in _target_groups(targets):
+        hash_format = get_hash_format(hash_type)
+        if hash_format['stream'] is not None:
+            begin, tail = hash_format['stream'](salt)
+            groups.append((begin, [tail(symbol) for symbol in last_symbols], None, hash_type, salt, digests))
+        else:
+            groups.append((None, None, hash_format['hasher'](salt), hash_type, salt, digests))
+
+    # Conversion de l'indice de départ en chiffres de la base mixte
+    prefix_length = len(positions) - 1
+    digits = [0] * prefix_length
+    prefix = bytearray(prefix_length)
+    index, low = divmod(start, last_base)
+    for position in range(prefix_length - 1, -1, -1):
+        index, digits[position] = divmod(index, bases[position])
+        prefix[position] = symbols[position][digits[position]]
+
+    found = {}
+    attempts = 0
+    counted = 0
+    next_check = STOP_CHECK_INTERVAL
+    remaining = stop - start
+    while remaining > 0:
+        high = min(last_base, low + remaining)
+        for begin, tails, hasher, hash_type, salt, digests in groups:
+            matches = []
+            if begin is not None:
+                state = begin(prefix)
+                for tail in tails[low:high]:
+                    candidate = state.copy()
+                    candidate.update(tail)
+                    digest = candidate.digest()
+                    if digest in digests:
+                        matches.append((tails.index(tail), digest))
+            else:
+                base = bytes(prefix)
+                for symbol in last_symbols[low:high]:
+                    digest = hasher(base + symbol)
+                    if digest in digests:
+                        matches.append((last_symbols.index(symbol), digest))
+
+            for index, digest in matches:
+                found[(hash_type, salt, digest)] = (bytes(prefix) + last_symbols[index]).decode()
+                if len(found) == len(targets):
+                    # Toutes les cibles sont trouvées : les autres processus peuvent s'arrêter
+                    if _stop_event is not None:
+                        _stop_event.set()
+                    attempts += index - low + 1
+                    _count_attempts(attempts - counted)
+                    return found, attempts
+        attempts += high - low
+        remaining -= high - low
+        low = 0
+
+        # Incrément du préfixe (odomètre)
+        position = prefix_length - 1
+        while position >= 0:
+            digits[position] += 1
+            if digits[position] < bases[position]:
+                prefix[position] = symbols[position][digits[position]]
+                break
+            digits[position] = 0
+            prefix[position] = symbols[position][0]
+            position -= 1
+
+        if attempts >= next_check:
+            next_check = attempts + STOP_CHECK_INTERVAL
+            _count_attempts(attempts - counted)
+            counted = attempts
+            if _stop_event is not None and _stop_event.is_set():
+                break
+
+    _count_attempts(attempts - counted)
+    return found, attempts
+
+def _bruteforce_segments(charset, max_length, max_attempts):
+    """
+    Espace de clés de la force brute : longueurs 1 à max_length, limité à
+    max_attempts candidats.
+
+    Returns:
+        list: Segments (jeux de caractères par position, début, fin)
+    """
+    segments = []
+    remaining = max_attempts
+    for length in range(1, max_length + 1):
+        size = min(len(charset) ** length, remaining)
+        if size <= 0:
+            break
+        segments.append(([charset] * length, 0, size))
+        remaining -= size
+    return segments
+
+def _keyspace_shards(segments, workers):
+    """
+    Découpe des segments de l'espace de clés en plages d'indices contiguës
+    à répartir entre les processus.
+
+    Returns:
+        list: Plages (jeux de caractères par position, début, fin)
+    """
+    total = sum(stop - start for _, start, stop in segments)
+    shard_size = max(MIN_SHARD_SIZE, total // (workers * 8) + 1)
+    shards = []
+    for positions, start, stop in segments:
+        for first in range(start, stop, shard_size):
+            shards.append((positions, first, min(stop, first + shard_size)))
+    return shards
+
+def _paced_shards(segments, pace):
+    """
+    Découpe des segments de l'espace de clés en plages successives dont la
+    taille est redemandée à pace() pour chaque plage (débit mesuré).
+
+    Yields:
+        tuple: Plage (jeux de caractères par position, début, fin)
+    """
+    for positions, start, stop in segments:
+        first = start
+        while first < stop:
+            last = min(stop, first + pace())
+            yield positions, first, last
+            first = last
+
+def _bruteforce_search(targets, segments, workers, progress=None, checkpoint=None):
+    """
+    Parcourt des segments de l'espace de clés, répartis sur plusieurs
+    processus, jusqu'à trouver toutes les cibles ou épuiser les segments.
+
+    Args:
+        progress (dict): Contexte de l'avancement publié quand la recherche
+            fait partie d'un travail plus grand (session) : 'done' travail
+            déjà fait, 'initial' travail déjà fait à la reprise, 'index'
+            indice global du premier candidat, 'total' taille totale,
+            'start' heure de la reprise
+        checkpoint (callable): Appelé au plus tous les SESSION_CHECKPOINT_INTERVAL
+            secondes avec (candidats parcourus sans trou depuis le début des
+            segments, cibles trouvées, tentatives) ; les plages sont alors
+            dimensionnées d'après le débit pour durer SESSION_SHARD_DURATION
+
+    Returns:
+        tuple: (dict cible -> texte trouvé, nombre de tentatives)
+    """
+    global _search, _progress_counter
+    size = sum(stop - start for _, start, stop in segments)
+    search_start = time.time()
+    found = {}
+    attempts = 0
+
+    def pace():
+        # Débit par processus mesuré sur les plages terminées
+        elapsed = time.time() - search_start
+        rate = attempts / elapsed / workers if attempts and elapsed > 0 else 0
+        return max(SESSION_MIN_SHARD_SIZE, int(rate * SESSION_SHARD_DURATION))
+
+    if checkpoint is None:
+        shards = _keyspace_shards(segments, workers)
+    else:
+        shards = _paced_shards(segments, pace)
+
+    # Compteur et signal d'arrêt partagés seulement entre plusieurs processus : leur
+    # mémoire partagée (sémaphores, /dev/shm) manque dans certains environnements,
+    # comme le serverless, où la recherche reste alors dans le processus courant
+    parallel = workers > 1 and size >= MIN_PARALLEL_KEYSPACE
+    _progress_counter = stop_event = None
+    if parallel:
+        try:
+            _progress_counter = multiprocessing.Value('q', 0)
+            stop_event = multiprocessing.Event()
+        except OSError:
+            parallel = False
+            _progress_counter = None
+    _search = dict({'done': 0, 'initial': 0, 'index': segments[0][1] if segments else 0, 'total': size,
+                    'start': search_start, 'counted': 0}, **(progress or {}), segments=segments)
+
+    # Candidats parcourus sans trou depuis le début, et plages terminées au-delà
+    covered = 0
+    completed = {}
+    last_checkpoint = time.time()
+    try:
+        if parallel:
+            shards = iter(shards)
+            submitted = 0
+            frontier = 0
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_bruteforce_worker,
+                                     initargs=(stop_event, _progress_counter)) as executor:
+                # Plages soumises au fur et à mesure : quelques-unes d'avance par processus
+                pending = {}
+                for shard in shards:
+                    pending[executor.submit(_bruteforce_shard, targets, *shard)] = (submitted, shard)
+                    submitted += 1
+                    if len(pending) >= workers * SHARDS_IN_FLIGHT:
+                        break
+                while pending:
+                    done, _ = wait(pending, timeout=PROGRESS_INTERVAL, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        sequence, (_, first, last) = pending.pop(future)
+                        if future.cancelled():
+                            continue
+                        shard_found, shard_attempts = future.result()
+                        attempts += shard_attempts
+                        found.update(shard_found)
+                        completed[sequence] = last - first
+                    while frontier in completed:
+                        covered += completed.pop(frontier)
+                        frontier += 1
+                    if len(found) == len(targets):
+                        if not stop_event.is_set():
+                            stop_event.set()
+                            for other in pending:
+                                other.cancel()
+                    else:
+                        for shard in shards:
+                            pending[executor.submit(_bruteforce_shard, targets, *shard)] = (submitted, shard)
+                            submitted += 1
+                            if len(pending) >= workers * SHARDS_IN_FLIGHT:
+                                break
+                    if checkpoint is not None and time.time() - last_checkpoint >= SESSION_CHECKPOINT_INTERVAL:
+                        checkpoint(covered, found, attempts)
+                        last_checkpoint = time.time()
+                    if progress_due():
+                        _publish_search_progress()
+        else:
+            for shard in shards:
+                shard_found, shard_attempts = _bruteforce_shard(targets - found.keys(), *shard)
+                attempts += shard_attempts
+                found.update(shard_found)
+                covered += shard[2] - shard[1]
+                if len(found) == len(targets):
+                    break
+                if checkpoint is not None and time.time() - last_checkpoint >= SESSION_CHECKPOINT_INTERVAL:
+                    checkpoint(covered, found, attempts)
+                    last_checkpoint = time.time()
+        _publish_search_progress(force=True)
+    finally:
+        _search = None
+        _progress_counter = None
+
+    return found, attempts
+
+def bruteforce_attack(hash_value, target, charset_name, max_length, start_time, hash_type,
+                      workers=None, max_attempts=MAX_BRUTEFORCE_ATTEMPTS):
     """
     Tente de cracker un hash en utilisant une attaque par force brute.
 
+    L'espace de clés est découpé en segments d'indices répartis sur
+    plusieurs processus ; le premier qui trouve le texte arrête les autres.
+
     Args:
         hash_value (str): Le hash à cracker
-        hash_func (function): La fonction de hash à utiliser
+        target (tuple): Le hash lu par parse_hash (type, sel, empreinte)
         charset_name (str): Le nom du jeu de caractères à utiliser
         max_length (int): La longueur maximale à essayer
         start_time (float): Heure de début pour calculer le temps d'exécution
         hash_type (str): Type de hash pour le rapport
+        workers (int): Nombre de processus (défaut : nombre de cœurs)
+        max_attempts (int): Nombre maximal de tentatives
 
     Returns:
         dict: Résultat de l'attaque
     """
-    # Définir les jeux de caractères selon l'option choisie
-    charsets = {
-        "numeric": "0123456789",
-        "alpha": "abcdefghijklmnopqrstuvwxyz",
-        "alphanumeric": "abcdefghijklmnopqrstuvwxyz0123456789",
-        "full": "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*()-_=+[]{}|;:,.<>?/"
-    }
-
     # Récupérer le jeu de caractères sélectionné
-    charset = charsets.get(charset_name, charsets["alphanumeric"])
+    charset = CHARSETS.get(charset_name, CHARSETS["alphanumeric"])
 
     # Vérifier que max_length est raisonnable
     if max_length > 10:
         max_length = 10  # Limiter pour éviter des temps d'exécution excessifs
 
-    # Compteur de tentatives
-    attempts = 0
+    workers = worker_count(workers)
+
+    keyspace = sum(len(charset) ** length for length in range(1, max_length + 1))
 
     try:
-        # Générer et tester toutes les combinaisons
-        for length in range(1, max_length + 1):
-            for combination in itertools.product(charset, repeat=length):
-                attempts += 1
-                word = ''.join(combination)
-                word_hash = hash_func(word.encode()).hexdigest()
-
-                if word_hash == hash_value:
-                    return {
-                        'success': True,
-                        'found': True,
-                        'hash': hash_value,
-                        'original': word,
-                        'type': hash_type,
-                        'mode': 'bruteforce',
-                        'attempts': attempts,
-                        'execution_time': time.time() - start_time
-                    }
-
-                # Option pour limiter le nombre total de tentatives
-                if attempts >= 10000000:  # 10 millions de tentatives max
-                    return {
-                        'success': True,
-                        'found': False,
-                        'hash': hash_value,
-                        'type': hash_type,
-                        'mode': 'bruteforce',
-                        'attempts': attempts,
-                        'message': "Limite de tentatives atteinte sans trouver de correspondance",
-                        'execution_time': time.time() - start_time
-                    }
+        segments = _bruteforce_segments(charset, max_length, max_attempts)
+        found, attempts = _bruteforce_search(frozenset([target]), segments, workers)
+
+        if target in found:
+            return {
+                'success': True,
+                'found': True,
+                'hash': hash_value,
+                'original': found[target],
+                'type': hash_type,
+                'mode': 'bruteforce',
+                'attempts': attempts,
+                'execution_time': time.time() - start_time
+            }
+
+        if keyspace > max_attempts:
+            # Limite du nombre total de tentatives atteinte
+            return {
+                'success': True,
+                'found': False,
+                'hash': hash_value,
+                'type': hash_type,
+                'mode': 'bruteforce',
+                'attempts': attempts,
+                'message': "Limite de tentatives atteinte sans trouver de correspondance",
+                'execution_time': time.time() - start_time
+            }
 
         # Si aucune correspondance n'est trouvée après avoir essayé toutes les combinaisons
         return {
@@ -242,19 +743,672 @@ def bruteforce_attack(hash_value, hash_func, charset_name, max_length, start_tim
             'execution_time': time.time() - start_time
         }
 
+# Jeux de caractères des masques (syntaxe de hashcat)
+MASK_CHARSETS = {
+    'l': "abcdefghijklmnopqrstuvwxyz",
+    'u': "ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    'd': "0123456789",
+    's': " !\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~",
+    'h': "0123456789abcdef",
+    'H': "0123456789ABCDEF"
+}
+MASK_CHARSETS['a'] = MASK_CHARSETS['l'] + MASK_CHARSETS['u'] + MASK_CHARSETS['d'] + MASK_CHARSETS['s']
+
+# Identifiants des jeux personnalisés (?1 à ?4)
+CUSTOM_CHARSET_KEYS = '1234'
+
+def _expand_mask_charset(definition, custom=None):
+    """
+    Développe une définition de jeu de caractères (ex. '?l?d_') en chaîne
+    sans doublons.
+    """
+    characters = []
+    position = 0
+    while position < len(definition):
+        character = definition[position]
+        position += 1
+        if character != '?':
+            characters.append(character)
+            continue
+        if position >= len(definition):
+            raise ValueError(f"'?' isolé à la fin de: {definition}")
+        key = definition[position]
+        position += 1
+        if key == '?':
+            characters.append('?')
+        elif key in MASK_CHARSETS:
+            characters.extend(MASK_CHARSETS[key])
+        elif custom is not None and key in custom:
+            characters.extend(custom[key])
+        else:
+            raise ValueError(f"Jeu de caractères inconnu '?{key}' dans: {definition}")
+    return ''.join(dict.fromkeys(characters))
+
+def parse_mask(mask, custom_charsets=None):
+    """
+    Convertit un masque (ex. '?u?l?l?l?d?d?d?d') en jeux de caractères par
+    position.
+
+    Syntaxe : ?l minuscules, ?u majuscules, ?d chiffres, ?s symboles,
+    ?a tous, ?h / ?H hexadécimal, ?1 à ?4 jeux personnalisés, ?? pour '?',
+    tout autre caractère est littéral.
+
+    Args:
+        mask (str): Le masque
+        custom_charsets (dict): Jeux personnalisés, ex. {'1': '?l?d'}
+
+    Returns:
+        list: Jeu de caractères de chaque position
+    """
+    custom = {}
+    for key, definition in (custom_charsets or {}).items():
+        key = str(key)
+        if key not in CUSTOM_CHARSET_KEYS:
+            raise ValueError(f"Jeu personnalisé invalide '?{key}' (attendu ?1 à ?4)")
+        custom[key] = _expand_mask_charset(definition)
+        if not custom[key]:
+            raise ValueError(f"Jeu personnalisé ?{key} vide")
+
+    positions = []
+    position = 0
+    while position < len(mask):
+        end = position + 2 if mask[position] == '?' else position + 1
+        positions.append(_expand_mask_charset(mask[position:end], custom))
+        position = end
+
+    if not positions:
+        raise ValueError("Masque vide")
+    if not all(charset.isascii() for charset in positions):
+        raise ValueError("Seuls les caractères ASCII sont acceptés dans un masque")
+    return positions
+
+def mask_keyspace(positions):
+    """Nombre exact de candidats d'un masque"""
+    keyspace = 1
+    for charset in positions:
+        keyspace *= len(charset)
+    return keyspace
+
+def mask_attack(hash_value, target, mask, start_time, hash_type, custom_charsets=None, skip=0,
+                limit=None, workers=None):
+    """
+    Tente de cracker un hash en parcourant exactement l'espace d'un masque,
+    dans l'ordre à base mixte (le dernier caractère varie le plus vite).
+
+    Args:
+        hash_value (str): Le hash à cracker
+        target (tuple): Le hash lu par parse_hash (type, sel, empreinte)
+        mask (str): Le masque, ex. '?u?l?l?l?d?d?d?d'
+        start_time (float): Heure de début pour calculer le temps d'exécution
+        hash_type (str): Type de hash pour le rapport
+        custom_charsets (dict): Jeux personnalisés ?1 à ?4
+        skip (int): Indice du premier candidat (reprise d'une recherche)
+        limit (int): Nombre maximal de candidats (défaut : MAX_BRUTEFORCE_ATTEMPTS)
+        workers (int): Nombre de processus (défaut : nombre de cœurs)
+
+    Returns:
+        dict: Résultat de l'attaque, avec la taille de l'espace de clés et
+        l'indice de reprise si la limite est atteinte
+    """
+    workers = worker_count(workers)
+    if limit is None:
+        limit = MAX_BRUTEFORCE_ATTEMPTS
+
+    try:
+        positions = parse_mask(mask, custom_charsets)
+        keyspace = mask_keyspace(positions)
+        skip = max(0, int(skip))
+        stop = min(keyspace, skip + int(limit))
+
+        segments = [(positions, skip, stop)] if skip < stop else []
+        found, attempts = _bruteforce_search(frozenset([target]), segments, workers)
+
+        result = {
+            'success': True,
+            'found': target in found,
+            'hash': hash_value,
+            'type': hash_type,
+            'mode': 'mask',
+            'mask': mask,
+            'keyspace': keyspace,
+            'skip': skip,
+            'attempts': attempts,
+            'execution_time': time.time() - start_time
+        }
+        if target in found:
+            result['original'] = found[target]
+        elif stop < keyspace:
+            result['next_index'] = stop
+            result['message'] = "Limite de tentatives atteinte sans trouver de correspondance"
+        else:
+            result['message'] = "Aucune correspondance trouvée pour ce masque"
+        return result
+
+    except Exception as e:
+        return {
+            'success': False,
+            'error': f"Erreur lors de l'attaque par masque: {str(e)}",
+            'execution_time': time.time() - start_time
+        }
+
+def crack_hashes(hash_values, hash_type, wordlist=None, mode="bruteforce", charset_name="alphanumeric",
+                 max_length=6, workers=None, rules=None, mask=None, custom_charsets=None, skip=0):
+    """
+    Tente de retrouver les textes originaux d'une liste de hashs en un seul
+    passage : chaque candidat est haché une fois puis cherché dans
+    l'ensemble des empreintes visées.
+
+    Args:
+        hash_values (list): Les hashs à cracker (ou une chaîne, un hash par ligne)
+        hash_type (str): Type de hash, ou 'auto' pour détecter celui de chaque
+            hash (les formats peuvent alors être mélangés)
+        wordlist (str): Nom du dictionnaire à utiliser en mode dictionary
+        mode (str): Mode d'attaque ("dictionary", "bruteforce" ou "mask")
+        charset_name (str): Jeu de caractères pour le mode bruteforce
+        max_length (int): Longueur maximale pour la force brute
+        workers (int): Nombre de processus pour la force brute (défaut : nombre de cœurs)
+        rules (str | list): Règles de transformation des mots en mode dictionary
+        mask (str): Masque pour le mode mask
+        custom_charsets (dict): Jeux personnalisés du masque
+        skip (int): Indice du premier candidat du masque (reprise)
+
+    Returns:
+        dict: Résultat pour chaque hash, dans l'ordre fourni, et hashs invalides
+    """
+    start_time = time.time()
+
+    if isinstance(hash_values, str):
+        hash_values = hash_values.split()
+    if not hash_values:
+        return {
+            'success': False,
+            'error': "Aucun hash fourni",
+            'execution_time': time.time() - start_time
+        }
+    if len(hash_values) > MAX_BATCH_HASHES:
+        return {
+            'success': False,
+            'error': f"Trop de hashs ({len(hash_values)}), maximum {MAX_BATCH_HASHES}",
+            'execution_time': time.time() - start_time
+        }
+
+    if not hash_type_supported(hash_type):
+        return {
+            'success': False,
+            'error': f"Type de hash non supporté: {hash_type}",
+            'execution_time': time.time() - start_time
+        }
+
+    # Cibles visées (les doublons ne sont cherchés qu'une fois)
+    targets = {}
+    invalid = []
+    for value in hash_values:
+        if not str(value).strip():
+            continue
+        parsed = parse_hash(str(value), hash_type)
+        if parsed is None:
+            invalid.append(value)
+        else:
+            targets.setdefault(parsed[1], parsed[0])
+
+    if not targets:
+        return {
+            'success': False,
+            'error': "Aucun hash valide fourni",
+            'invalid': invalid,
+            'execution_time': time.time() - start_time
+        }
+
+    try:
+        if mode == "dictionary":
+            dict_path = DICTIONARIES.get(wordlist, DICTIONARIES['common'])
+            if not dict_path.exists():
+                return {
+                    'success': False,
+                    'error': f"Dictionnaire non trouvé: {dict_path}",
+                    'execution_time': time.time() - start_time
+                }
+            if rules:
+                rules = resolve_rules(rules)
+            found, attempts, matched_rules = _dictionary_lookup(frozenset(targets), dict_path, rules)
+        elif mode == "bruteforce":
+            charset = CHARSETS.get(charset_name, CHARSETS["alphanumeric"])
+            workers = worker_count(workers)
+            segments = _bruteforce_segments(charset, min(max_length, 10), MAX_BRUTEFORCE_ATTEMPTS)
+            found, attempts = _bruteforce_search(frozenset(targets), segments, workers)
+            rules = None
+        elif mode == "mask":
+            positions = parse_mask(mask or '', custom_charsets)
+            keyspace = mask_keyspace(positions)
+            skip = max(0, int(skip))
+            stop = min(keyspace, skip + MAX_BRUTEFORCE_ATTEMPTS)
+            workers = worker_count(workers)
+            segments = [(positions, skip, stop)] if skip < stop else []
+            found, attempts = _bruteforce_search(frozenset(targets), segments, workers)
+            rules = None
+        else:
+            return {
+                'success': False,
+                'error': f"Mode d'attaque non supporté: {mode}",
+                'execution_time': time.time() - start_time
+            }
+
+        results = [
+            {'hash': value, 'found': target in found, 'original': found.get(target)}
+            for target, value in targets.items()
+        ]
+        if rules:
+            for result, target in zip(results, targets):
+                result['rule'] = matched_rules.get(target)
+        if hash_type.lower() == 'auto':
+            for result, target in zip(results, targets):
+                result['type'] = target[0]
+
+        response = {
+            'success': True,
+            'type': hash_type,
+            'mode': mode,
+            'total': len(targets),
+            'found_count': len(found),
+            'results': results,
+            'invalid': invalid,
+            'attempts': attempts,
+            'execution_time': time.time() - start_time
+        }
+        if rules:
+            response['rule_hits'] = rule_hits(matched_rules)
+        if mode == "mask":
+            response['keyspace'] = keyspace
+            response['skip'] = skip
+            if stop < keyspace and len(found) < len(targets):
+                response['next_index'] = stop
+        return _record_attack(mode, response)
+
+    except Exception as e:
+        return {
+            'success': False,
+            'error': f"Erreur lors de l'attaque groupée: {str(e)}",
+            'execution_time': time.time() - start_time
+        }
+
+# Intervalle entre deux points de reprise d'une session (secondes)
+SESSION_CHECKPOINT_INTERVAL = 30.0
+
+# Durée visée d'une plage de force brute d'une session, et taille minimale
+# d'une plage (la première, avant toute mesure du débit)
+SESSION_SHARD_DURATION = 2.0
+SESSION_MIN_SHARD_SIZE = 1000
+
+# États d'une session
+SESSION_RUNNING = 'running'
+SESSION_DONE = 'done'
+SESSION_FAILED = 'failed'
+
+def _session_segments(params):
+    """
+    Espace de clés complet d'une session de force brute ou de masque.
+
+    Returns:
+        list: Segments (jeux de caractères par position, début, fin)
+    """
+    if params['mode'] == 'mask':
+        positions = parse_mask(params.get('mask') or '', params.get('customCharsets'))
+        return [(positions, 0, mask_keyspace(positions))]
+    charset = CHARSETS.get(params.get('charset'), CHARSETS["alphanumeric"])
+    return [([charset] * length, 0, len(charset) ** length)
+            for length in range(1, min(int(params.get('maxLength', 6)), 10) + 1)]
+
+def _slice_segments(segments, start, stop):
+    """Restreint des segments consécutifs à la plage d'indices globale [start, stop)"""
+    sliced = []
+    offset = 0
+    for positions, _, size in segments:
+        first, last = max(start - offset, 0), min(stop - offset, size)
+        if first < last:
+            sliced.append((positions, first, last))
+        offset += size
+    return sliced
+
+def _dictionary_session_chunk(targets, dict_path, rules, position, duration, progress=None):
+    """
+    Parcourt le dictionnaire (décliné par les règles) à partir d'un point de
+    reprise, pendant au plus duration secondes (vérifié entre deux mots), ou
+    jusqu'à ce que toutes les cibles soient trouvées.
+
+    Args:
+        position (dict): {'offset': position en octets du mot courant,
+            'rule_index': première règle à appliquer à ce mot,
+            'words': nombre de mots déjà terminés}
+        progress (dict): Contexte de l'avancement publié : 'attempts'
+            tentatives de la session avant ce passage, 'initial' tentatives
+            à la reprise, 'start' heure de la reprise
+
+    Returns:
+        tuple: (dict cible -> texte, dict cible -> règle, tentatives,
+        nouveau point de reprise, fin du dictionnaire atteinte)
+    """
+    hashers = _target_hashers(targets)
+    compiled = [compile_rule(rule) for rule in rules]
+    found = {}
+    matched_rules = {}
+    attempts = 0
+    offset, rule_index, words = position['offset'], position['rule_index'], position['words']
+    limit = position.get('limit')
+    progress = dict({'attempts': 0, 'initial': 0, 'start': time.time()}, **(progress or {}))
+    size = os.path.getsize(dict_path)
+    next_check = PROGRESS_CHECK_INTERVAL
+    deadline = time.time() + duration
+
+    with open(dict_path, 'rb') as file:
+        file.seek(offset)
+        while time.time() < deadline:
+            if limit is not None and words >= limit:
+                return found, matched_rules, attempts, dict(position, offset=offset, rule_index=0, words=words), True
+            line = file.readline()
+            if not line:
+                return found, matched_rules, attempts, dict(position, offset=offset, rule_index=0, words=words), True
+
+            # Même nettoyage que l'attaque sans session
+            word = line.decode('utf-8', errors='ignore').strip().encode()
+            seen = set()
+            while rule_index < len(compiled):
+                candidate = word
+                for step in compiled[rule_index]:
+                    candidate = step(candidate)
+                rule_index += 1
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                attempts += 1
+                for hasher, hash_type, salt, digests in hashers:
+                    digest = hasher(candidate)
+                    if digest in digests and (hash_type, salt, digest) not in found:
+                        found[(hash_type, salt, digest)] = candidate.decode('utf-8', errors='replace')
+                        matched_rules[(hash_type, salt, digest)] = rules[rule_index - 1]
+                        if len(found) == len(targets):
+                            # Toutes les cibles sont trouvées : inutile de finir le mot
+                            return (found, matched_rules, attempts,
+                                    dict(position, offset=offset, rule_index=rule_index, words=words), False)
+
+            offset += len(line)
+            rule_index = 0
+            words += 1
+
+            if attempts >= next_check:
+                next_check = attempts + PROGRESS_CHECK_INTERVAL
+                if progress_due():
+                    _publish_dictionary_progress(progress['attempts'] + attempts - progress['initial'], offset,
+                                                 size, progress['start'])
+
+    return found, matched_rules, attempts, dict(position, offset=offset, rule_index=rule_index, words=words), False
+
+def _skip_words(dict_path, count):
+    """Position en octets du mot d'indice count"""
+    offset = 0
+    with open(dict_path, 'rb') as file:
+        for _ in range(count):
+            line = file.readline()
+            if not line:
+                break
+            offset += len(line)
+    return offset
+
+def _session_result(session_id, params, state, status, start_time):
+    """Mise en forme du résultat d'une session (même forme que crack_hashes)"""
+    found = state['found']
+    results = [
+        {'hash': value, 'found': value in found, 'original': found.get(value)}
+        for value in params['hashes']
+    ]
+    if params.get('rules'):
+        for result in results:
+            result['rule'] = state['rules'].get(result['hash'])
+
+    response = {
+        'success': True,
+        'session_id': session_id,
+        'status': status,
+        'type': params['type'],
+        'mode': params['mode'],
+        'total': len(params['hashes']),
+        'found_count': len(found),
+        'results': results,
+        'attempts': state['attempts'],
+        'position': state['position'],
+        'execution_time': time.time() - start_time
+    }
+    if 'keyspace' in state:
+        response['keyspace'] = state['keyspace']
+    if params.get('rules'):
+        response['rule_hits'] = rule_hits(state['rules'])
+    return response
+
+def _run_session(session_id, params, state, start_time, workers):
+    """
+    Exécute une session depuis son point de reprise, en enregistrant ce
+    point toutes les SESSION_CHECKPOINT_INTERVAL secondes. La force brute
+    garde le même groupe de processus pour toute la session.
+    """
+    targets = {parse_hash(value, params['type'])[1]: value for value in params['hashes']}
+    resumed_attempts = state['attempts']
+
+    def remaining_targets():
+        return frozenset(target for target, value in targets.items() if value not in state['found'])
+
+    if params['mode'] == 'dictionary':
+        dict_path = DICTIONARIES.get(params.get('dictionary'), DICTIONARIES['common'])
+        if not dict_path.exists():
+            raise ValueError(f"Dictionnaire non trouvé: {dict_path}")
+        rules = resolve_rules(params['rules']) if params.get('rules') else [':']
+        finished = False
+        initial = state['attempts']
+        while not finished and remaining_targets():
+            progress = {'attempts': state['attempts'], 'initial': initial, 'start': start_time}
+            found, matched_rules, attempts, state['position'], finished = _dictionary_session_chunk(
+                remaining_targets(), dict_path, rules, state['position'],
+                SESSION_CHECKPOINT_INTERVAL, progress
+            )
+            for target, word in found.items():
+                state['found'][targets[target]] = word
+                if params.get('rules'):
+                    state['rules'][targets[target]] = matched_rules[target]
+            state['attempts'] += attempts
+            save_session(session_id, params, state, SESSION_RUNNING)
+    elif state['position'] < state['end'] and remaining_targets():
+        start, end = state['position'], state['end']
+        skip = min(params['skip'], state['keyspace'])
+        attempts_before = state['attempts']
+
+        def record(covered, found, attempts):
+            for target, word in found.items():
+                state['found'][targets[target]] = word
+            state['attempts'] = attempts_before + attempts
+            state['position'] = start + covered
+
+        def checkpoint(covered, found, attempts):
+            record(covered, found, attempts)
+            save_session(session_id, params, state, SESSION_RUNNING)
+
+        progress = {'done': start - skip, 'initial': start - skip, 'index': start,
+                    'total': end - skip, 'start': start_time}
+        found, attempts = _bruteforce_search(remaining_targets(),
+                                             _slice_segments(_session_segments(params), start, end),
+                                             workers, progress, checkpoint)
+        # Espace parcouru en entier, sauf si toutes les cibles ont été trouvées avant
+        record(end - start, found, attempts)
+
+    save_session(session_id, params, state, SESSION_DONE)
+    return _record_attack(params['mode'], _session_result(session_id, params, state, SESSION_DONE, start_time),
+                          state['attempts'] - resumed_attempts)
+
+def start_session(hash_values, hash_type, mode="bruteforce", wordlist=None, rules=None,
+                  charset_name="alphanumeric", max_length=6, mask=None, custom_charsets=None,
+                  skip=0, limit=None, session_id=None, workers=None):
+    """
+    Démarre une session de crackage reprenable : le point d'avancement
+    (indice dans l'espace de clés, ou position dans le dictionnaire et
+    indice de règle) est enregistré régulièrement, et resume_session
+    repart de là après une interruption.
+
+    skip et limit restreignent la session à une tranche de l'espace de clés
+    (en candidats pour la force brute et les masques, en mots pour un
+    dictionnaire), pour répartir une recherche entre plusieurs machines.
+
+    Args:
+        hash_values (list): Les hashs à cracker (ou une chaîne, un hash par ligne)
+        hash_type (str): Type de hash, ou 'auto' pour détecter celui de chaque hash
+        mode (str): "dictionary", "bruteforce" ou "mask"
+        wordlist (str): Nom du dictionnaire
+        rules (str | list): Règles de transformation des mots
+        charset_name (str): Jeu de caractères de la force brute
+        max_length (int): Longueur maximale de la force brute
+        mask (str): Masque
+        custom_charsets (dict): Jeux personnalisés du masque
+        skip (int): Début de la tranche
+        limit (int): Taille de la tranche (défaut : jusqu'à la fin)
+        session_id (str): Identifiant imposé (défaut : aléatoire)
+        workers (int): Nombre de processus (défaut : nombre de cœurs)
+
+    Returns:
+        dict: Résultat de la session, avec son identifiant
+    """
+    start_time = time.time()
+    session_id = session_id or uuid.uuid4().hex
+
+    if isinstance(hash_values, str):
+        hash_values = hash_values.split()
+    if not hash_type_supported(hash_type):
+        return {
+            'success': False,
+            'error': f"Type de hash non supporté: {hash_type}",
+            'execution_time': time.time() - start_time
+        }
+    hashes = []
+    invalid = []
+    for value in hash_values or []:
+        if not str(value).strip():
+            continue
+        parsed = parse_hash(str(value), hash_type)
+        if parsed is None:
+            invalid.append(value)
+        elif parsed[0] not in hashes:
+            hashes.append(parsed[0])
+    if not hashes or invalid:
+        return {
+            'success': False,
+            'error': f"Hashs invalides: {invalid}" if invalid else "Aucun hash fourni",
+            'execution_time': time.time() - start_time
+        }
+    if mode not in ("dictionary", "bruteforce", "mask"):
+        return {
+            'success': False,
+            'error': f"Mode d'attaque non supporté: {mode}",
+            'execution_time': time.time() - start_time
+        }
+
+    params = {
+        'hashes': hashes,
+        'type': hash_type,
+        'mode': mode,
+        'dictionary': wordlist,
+        'rules': rules,
+        'charset': charset_name,
+        'maxLength': max_length,
+        'mask': mask,
+        'customCharsets': custom_charsets,
+        'skip': max(0, int(skip)),
+        'limit': int(limit) if limit is not None else None
+    }
+    state = {'found': {}, 'rules': {}, 'attempts': 0}
+
+    try:
+        if mode == 'dictionary':
+            dict_path = DICTIONARIES.get(wordlist, DICTIONARIES['common'])
+            if not dict_path.exists():
+                raise ValueError(f"Dictionnaire non trouvé: {dict_path}")
+            state['position'] = {
+                'offset': _skip_words(dict_path, params['skip']),
+                'rule_index': 0,
+                'words': params['skip'],
+                'limit': params['skip'] + params['limit'] if params['limit'] is not None else None
+            }
+        else:
+            keyspace = sum(size for _, _, size in _session_segments(params))
+            state['keyspace'] = keyspace
+            state['position'] = min(params['skip'], keyspace)
+            state['end'] = keyspace if params['limit'] is None else min(keyspace, params['skip'] + params['limit'])
+
+        save_session(session_id, params, state, SESSION_RUNNING)
+        return _run_session(session_id, params, state, start_time, worker_count(workers))
+
+    except Exception as e:
+        save_session(session_id, params, state, SESSION_FAILED)
+        return {
+            'success': False,
+            'session_id': session_id,
+            'error': f"Erreur lors de la session de crackage: {str(e)}",
+            'execution_time': time.time() - start_time
+        }
+
+def resume_session(session_id, workers=None):
+    """
+    Reprend une session depuis son dernier point de reprise enregistré.
+
+    Returns:
+        dict: Résultat de la session (immédiat si elle est déjà terminée)
+    """
+    start_time = time.time()
+    session = load_session(session_id)
+    if session is None:
+        return {
+            'success': False,
+            'error': f"Session inconnue: {session_id}",
+            'execution_time': time.time() - start_time
+        }
+    if session['status'] == SESSION_DONE:
+        return _session_result(session_id, session['params'], session['state'], SESSION_DONE, start_time)
+
+    try:
+        save_session(session_id, session['params'], session['state'], SESSION_RUNNING)
+        return _run_session(session_id, session['params'], session['state'], start_time,
+                            worker_count(workers))
+    except Exception as e:
+        save_session(session_id, session['params'], session['state'], SESSION_FAILED)
+        return {
+            'success': False,
+            'session_id': session_id,
+            'error': f"Erreur lors de la session de crackage: {str(e)}",
+            'execution_time': time.time() - start_time
+        }
+
+def get_session(session_id):
+    """
+    Retourne l'état d'une session sans la relancer.
+
+    Returns:
+        dict: Résultat partiel de la session, ou None si elle est inconnue
+    """
+    session = load_session(session_id)
+    if session is None:
+        return None
+    result = _session_result(session_id, session['params'], session['state'], session['status'], time.time())
+    del result['execution_time']
+    result['updated'] = session['updated']
+    return result
+
 def hash_string(text, hash_type):
     """
     Utilitaire pour hacher une chaîne avec l'algorithme spécifié.
 
     Args:
         text (str): Texte à hacher
-        hash_type (str): Type de hash (md5, sha1, sha256, sha512)
+        hash_type (str): Type de hash sans sel (md5, sha1, sha256, sha512, ntlm)
 
     Returns:
         str: Hash généré ou None en cas d'erreur
     """
-    hash_func = get_hash_function(hash_type)
-    if not hash_func:
+    hash_format = get_hash_format(hash_type)
+    if not hash_format or hash_format['salted']:
         return None
 
-    return hash_func(text.encode()).hexdigest()
\ No newline at end of file
+    return hash_format['hasher'](b'')(text.encode()).hex()
\ No newline at end of file
@@ -0,0 +1,348 @@
+"""
+Module des formats de hash
+Registre des formats reconnus par le cracker : empreintes brutes (MD5,
+SHA-1, SHA-256, SHA-512, NTLM), empreintes salées au format 'hash:sel',
+md5crypt ($1$), sha512crypt ($6$) et PBKDF2-SHA256.
+
+Chaque format sait lire un hash (sel, paramètres et empreinte) et fournit
+sa fonction de vérification des candidats, construite une seule fois par
+sel : l'état du hash du sel préfixé est précalculé puis copié pour chaque
+candidat, et les formats à empreinte brute exposent en plus un mode
+« flux » (état d'un préfixe + fin du candidat) utilisé par la force brute.
+
+Un format est un dict :
+    'label'  : nom affiché
+    'salted' : True si chaque hash porte son propre sel ou ses paramètres
+    'parse'  : hash -> (hash normalisé, sel, empreinte) ou None
+    'hasher' : sel -> fonction candidat (bytes) -> empreinte
+    'stream' : sel -> (préfixe -> état hashlib, symbole -> octets à ajouter),
+               ou None si le format ne se calcule pas par ajouts successifs
+"""
+
+import base64
+import binascii
+import hashlib
+import re
+
+# Type de hash à détecter d'après la forme de chaque hash
+AUTO_HASH_TYPE = 'auto'
+
+_HEX_DIGITS = frozenset('0123456789abcdef')
+
+def _parse_hex(value, digest_size):
+    """Empreinte brute d'un hash hexadécimal de la bonne longueur, ou None"""
+    if len(value) != 2 * digest_size or not _HEX_DIGITS.issuperset(value):
+        return None
+    return bytes.fromhex(value)
+
+def _raw_format(label, constructor, digest_size):
+    """Empreinte brute sans sel : constructor(mot de passe)"""
+    def parse(value):
+        value = value.lower()
+        digest = _parse_hex(value, digest_size)
+        return None if digest is None else (value, b'', digest)
+
+    def hasher(salt):
+        return lambda candidate: constructor(candidate).digest()
+
+    def stream(salt):
+        return constructor, bytes
+
+    return {'label': label, 'salted': False, 'parse': parse, 'hasher': hasher, 'stream': stream}
+
+def _salted_format(label, constructor, digest_size, salt_first):
+    """
+    Empreinte salée au format 'hash:sel', sel placé avant (salt_first) ou
+    après le mot de passe.
+    """
+    def parse(value):
+        digest_hex, separator, salt = value.partition(':')
+        if not separator:
+            return None
+        digest = _parse_hex(digest_hex.lower(), digest_size)
+        if digest is None:
+            return None
+        return f"{digest_hex.lower()}:{salt}", salt.encode(), digest
+
+    def hasher(salt):
+        if salt_first:
+            # L'état après le sel est calculé une fois, puis copié par candidat
+            base = constructor(salt)
+
+            def salted(candidate):
+                state = base.copy()
+                state.update(candidate)
+                return state.digest()
+            return salted
+        return lambda candidate: constructor(candidate + salt).digest()
+
+    def stream(salt):
+        if salt_first:
+            base = constructor(salt)
+
+            def begin(prefix):
+                state = base.copy()
+                state.update(prefix)
+                return state
+            return begin, bytes
+        return constructor, lambda symbol: symbol + salt
+
+    return {'label': label, 'salted': True, 'parse': parse, 'hasher': hasher, 'stream': stream}
+
+def _ntlm_format():
+    """NTLM : MD4 du mot de passe encodé en UTF-16LE"""
+    def parse(value):
+        value = value.lower()
+        digest = _parse_hex(value, 16)
+        return None if digest is None else (value, b'', digest)
+
+    # MD4 (pycryptodome) n'est chargé qu'à la première attaque NTLM
+    def hasher(salt):
+        from Crypto.Hash import MD4
+        return lambda candidate: MD4.new(candidate.decode('utf-8', errors='replace')
+                                         .encode('utf-16-le')).digest()
+
+    def stream(salt):
+        from Crypto.Hash import MD4
+        # Les candidats de la force brute sont en ASCII
+        return (lambda prefix: MD4.new(bytes(prefix).decode('latin-1').encode('utf-16-le')),
+                lambda symbol: symbol.decode('latin-1').encode('utf-16-le'))
+
+    return {'label': 'NTLM', 'salted': False, 'parse': parse, 'hasher': hasher, 'stream': stream}
+
+# Alphabet et ordre des octets de l'encodage base64 de crypt(3)
+_CRYPT_ALPHABET = b'./0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+_CRYPT_CHARACTERS = frozenset(_CRYPT_ALPHABET.decode())
+_MD5_CRYPT_ORDER = ((0, 6, 12), (1, 7, 13), (2, 8, 14), (3, 9, 15), (4, 10, 5))
+_SHA512_CRYPT_ORDER = (
+    (0, 21, 42), (22, 43, 1), (44, 2, 23), (3, 24, 45), (25, 46, 4), (47, 5, 26), (6, 27, 48),
+    (28, 49, 7), (50, 8, 29), (9, 30, 51), (31, 52, 10), (53, 11, 32), (12, 33, 54), (34, 55, 13),
+    (56, 14, 35), (15, 36, 57), (37, 58, 16), (59, 17, 38), (18, 39, 60), (40, 61, 19), (62, 20, 41)
+)
+
+def _crypt_b64(digest, order, last):
+    """Encode une empreinte dans le base64 de crypt(3), octets permutés selon order"""
+    encoded = bytearray()
+    for first, second, third in order:
+        word = digest[first] << 16 | digest[second] << 8 | digest[third]
+        for _ in range(4):
+            encoded.append(_CRYPT_ALPHABET[word & 63])
+            word >>= 6
+    word = digest[last]
+    encoded.append(_CRYPT_ALPHABET[word & 63])
+    encoded.append(_CRYPT_ALPHABET[word >> 6])
+    return bytes(encoded)
+
+def _crypt_schedule(rounds):
+    """
+    Variante de chaque tour de md5crypt / sha512crypt : bit 4 pour un tour
+    impair, bit 2 si le sel est ajouté (tour non multiple de 3), bit 1 si
+    le mot de passe est ajouté (tour non multiple de 7).
+    """
+    return [(i & 1) << 2 | (i % 3 != 0) << 1 | (i % 7 != 0) for i in range(rounds)]
+
+def _crypt_pieces(password, salt):
+    """
+    Octets ajoutés à l'empreinte précédente pour chacune des 8 variantes de
+    tour : avant elle pour un tour impair, après elle pour un tour pair.
+    """
+    pieces = []
+    for variant in range(8):
+        middle = (salt if variant & 2 else b'') + (password if variant & 1 else b'')
+        pieces.append(password + middle if variant & 4 else middle + password)
+    return pieces
+
+def _crypt_rounds(constructor, digest, pieces, schedule):
+    """Tours d'étirement de md5crypt / sha512crypt"""
+    for variant in schedule:
+        piece = pieces[variant]
+        digest = constructor(piece + digest).digest() if variant & 4 else constructor(digest + piece).digest()
+    return digest
+
+_MD5_CRYPT_SCHEDULE = _crypt_schedule(1000)
+
+def md5_crypt(password, salt):
+    """
+    md5crypt (FreeBSD, $1$) d'un mot de passe.
+
+    Args:
+        password (bytes): Le mot de passe
+        salt (bytes): Le sel (8 caractères au plus)
+
+    Returns:
+        bytes: L'empreinte encodée (22 caractères)
+    """
+    md5 = hashlib.md5
+    alternate = md5(password + salt + password).digest()
+    length = len(password)
+    state = md5(password + b'$1$' + salt)
+    state.update(alternate * (length // 16) + alternate[:length % 16])
+    i = length
+    while i:
+        state.update(b'\x00' if i & 1 else password[:1])
+        i >>= 1
+    digest = _crypt_rounds(md5, state.digest(), _crypt_pieces(password, salt), _MD5_CRYPT_SCHEDULE)
+    return _crypt_b64(digest, _MD5_CRYPT_ORDER, 11)
+
+def _md5_crypt_format():
+    """md5crypt : $1$sel$empreinte"""
+    def parse(value):
+        match = re.fullmatch(r'\$1\$([^$]{0,8})\$([./0-9A-Za-z]{22})', value)
+        if match is None:
+            return None
+        return value, match.group(1).encode(), match.group(2).encode()
+
+    def hasher(salt):
+        return lambda candidate: md5_crypt(candidate, salt)
+
+    return {'label': 'md5crypt ($1$)', 'salted': True, 'parse': parse, 'hasher': hasher, 'stream': None}
+
+SHA512_CRYPT_DEFAULT_ROUNDS = 5000
+
+def sha512_crypt(password, salt, rounds=SHA512_CRYPT_DEFAULT_ROUNDS, schedule=None):
+    """
+    sha512crypt (glibc, $6$) d'un mot de passe.
+
+    Args:
+        password (bytes): Le mot de passe
+        salt (bytes): Le sel (16 caractères au plus)
+        rounds (int): Nombre de tours
+        schedule (list): Variantes des tours précalculées (voir _crypt_schedule)
+
+    Returns:
+        bytes: L'empreinte encodée (86 caractères)
+    """
+    sha512 = hashlib.sha512
+    length = len(password)
+    alternate = sha512(password + salt + password).digest()
+    state = sha512(password + salt)
+    state.update(alternate * (length // 64) + alternate[:length % 64])
+    i = length
+    while i:
+        state.update(alternate if i & 1 else password)
+        i >>= 1
+    digest = state.digest()
+
+    password_digest = sha512(password * length).digest()
+    password_bytes = password_digest * (length // 64) + password_digest[:length % 64]
+    salt_bytes = sha512(salt * (16 + digest[0])).digest()[:len(salt)]
+
+    digest = _crypt_rounds(sha512, digest, _crypt_pieces(password_bytes, salt_bytes),
+                           schedule or _crypt_schedule(rounds))
+    return _crypt_b64(digest, _SHA512_CRYPT_ORDER, 63)
+
+def _sha512_crypt_format():
+    """sha512crypt : $6$[rounds=N$]sel$empreinte"""
+    def parse(value):
+        match = re.fullmatch(r'\$6\$(?:rounds=(\d+)\$)?([^$]{0,16})\$([./0-9A-Za-z]{86})', value)
+        if match is None:
+            return None
+        rounds = SHA512_CRYPT_DEFAULT_ROUNDS
+        if match.group(1) is not None:
+            rounds = min(max(int(match.group(1)), 1000), 999999999)
+        return value, (rounds, match.group(2).encode()), match.group(3).encode()
+
+    def hasher(salt):
+        rounds, salt = salt
+        schedule = _crypt_schedule(rounds)
+        return lambda candidate: sha512_crypt(candidate, salt, rounds, schedule)
+
+    return {'label': 'sha512crypt ($6$)', 'salted': True, 'parse': parse, 'hasher': hasher, 'stream': None}
+
+def _pbkdf2_sha256_format():
+    """
+    PBKDF2-SHA256 au format de passlib ($pbkdf2-sha256$tours$sel$empreinte,
+    base64 adapté) ou de Django (pbkdf2_sha256$tours$sel$empreinte).
+    """
+    def ab64_decode(value):
+        value = value.replace('.', '+')
+        return base64.b64decode(value + '=' * (-len(value) % 4), validate=True)
+
+    def parse(value):
+        try:
+            if value.startswith('$pbkdf2-sha256$'):
+                _, _, rounds, salt, digest = value.split('$')
+                salt, digest = ab64_decode(salt), ab64_decode(digest)
+            elif value.startswith('pbkdf2_sha256$'):
+                _, rounds, salt, digest = value.split('$')
+                salt, digest = salt.encode(), base64.b64decode(digest, validate=True)
+            else:
+                return None
+            rounds = int(rounds)
+        except (ValueError, binascii.Error):
+            return None
+        if rounds < 1 or not digest:
+            return None
+        return value, (rounds, salt, len(digest)), digest
+
+    def hasher(salt):
+        rounds, salt, length = salt
+        return lambda candidate: hashlib.pbkdf2_hmac('sha256', candidate, salt, rounds, length)
+
+    return {'label': 'PBKDF2-SHA256', 'salted': True, 'parse': parse, 'hasher': hasher, 'stream': None}
+
+# Formats reconnus ; pour la détection automatique, le premier format qui
+# accepte un hash l'emporte (MD5 avant NTLM, sel après le mot de passe
+# avant sel avant)
+HASH_FORMATS = {
+    'md5': _raw_format('MD5', hashlib.md5, 16),
+    'sha1': _raw_format('SHA-1', hashlib.sha1, 20),
+    'sha256': _raw_format('SHA-256', hashlib.sha256, 32),
+    'sha512': _raw_format('SHA-512', hashlib.sha512, 64),
+    'ntlm': _ntlm_format(),
+    'md5-pass-salt': _salted_format('MD5(mot de passe + sel)', hashlib.md5, 16, salt_first=False),
+    'md5-salt-pass': _salted_format('MD5(sel + mot de passe)', hashlib.md5, 16, salt_first=True),
+    'sha1-pass-salt': _salted_format('SHA-1(mot de passe + sel)', hashlib.sha1, 20, salt_first=False),
+    'sha1-salt-pass': _salted_format('SHA-1(sel + mot de passe)', hashlib.sha1, 20, salt_first=True),
+    'md5crypt': _md5_crypt_format(),
+    'sha512crypt': _sha512_crypt_format(),
+    'pbkdf2-sha256': _pbkdf2_sha256_format()
+}
+
+def get_hash_format(hash_type):
+    """
+    Retourne le format correspondant au type spécifié.
+
+    Returns:
+        dict: Le format (voir HASH_FORMATS), ou None si non supporté
+    """
+    return HASH_FORMATS.get((hash_type or '').lower())
+
+def hash_type_supported(hash_type):
+    """Indique si le type est un format connu ou la détection automatique"""
+    return (hash_type or '').lower() == AUTO_HASH_TYPE or get_hash_format(hash_type) is not None
+
+def detect_hash_types(hash_value):
+    """
+    Types possibles d'un hash d'après son préfixe, la longueur de son
+    empreinte et la présence d'un sel.
+
+    Returns:
+        list: Types compatibles, du plus probable au moins probable
+    """
+    hash_value = hash_value.strip()
+    return [name for name, hash_format in HASH_FORMATS.items() if hash_format['parse'](hash_value) is not None]
+
+def parse_hash(hash_value, hash_type):
+    """
+    Lit un hash selon son type.
+
+    Args:
+        hash_value (str): Le hash
+        hash_type (str): Type de hash, ou 'auto' pour le détecter
+
+    Returns:
+        tuple: (hash normalisé, cible (type, sel, empreinte)), ou None si le
+        hash est invalide pour ce type
+    """
+    hash_value = hash_value.strip()
+    if hash_type.lower() == AUTO_HASH_TYPE:
+        names = detect_hash_types(hash_value)
+    else:
+        names = [hash_type.lower()] if hash_type.lower() in HASH_FORMATS else []
+    for name in names:
+        parsed = HASH_FORMATS[name]['parse'](hash_value)
+        if parsed is not None:
+            normalized, salt, digest = parsed
+            return normalized, (name, salt, digest)
+    return None
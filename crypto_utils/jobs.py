@@ -0,0 +1,342 @@
+"""
+Module de gestion des tâches asynchrones
+Exécute les factorisations et les crackages longs dans des processus séparés,
+en nombre limité, pour que les requêtes HTTP répondent immédiatement.
+"""
+
+import atexit
+import multiprocessing
+import os
+import resource
+import signal
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from crypto_utils import metrics
+from crypto_utils.batch_gcd import import_moduli
+from crypto_utils.factorizer import factorize_number
+from crypto_utils.progress import report_progress, set_progress_channel, set_worker_limit
+from crypto_utils.hash_cracker import crack_hash, crack_hashes, resume_session, start_session
+
+# Nombre maximal de tâches exécutées simultanément ; les moteurs d'une tâche
+# n'ont qu'un processus de calcul (JOB_WORKERS) : au plus un processus par
+# cœur, et la limite de temps CPU du processus couvre tout le travail de la tâche
+MAX_RUNNING_JOBS = os.cpu_count() or 1
+JOB_WORKERS = 1
+
+# Temps CPU maximal par tâche (secondes), au-delà le processus est tué
+DEFAULT_CPU_TIME_LIMIT = 300
+MAX_CPU_TIME_LIMIT = 3600
+
+# Nombre de tâches conservées dans la table (les plus anciennes terminées sont oubliées)
+MAX_STORED_JOBS = 1000
+
+# Intervalle de surveillance des processus (secondes)
+POLL_INTERVAL = 0.05
+
+# États possibles d'une tâche
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+def _run_factorize(params):
+    """Tâche de factorisation (mêmes paramètres que /api/factorize)"""
+    return factorize_number(params.get('number'), params.get('method'))
+
+def _run_crack_hash(params):
+    """Tâche de crackage de hash (mêmes paramètres que /api/crack-hash)"""
+    return crack_hash(
+        params.get('hash'),
+        params.get('type'),
+        params.get('dictionary'),
+        params.get('mode', 'bruteforce'),
+        params.get('charset', 'alphanumeric'),
+        int(params.get('maxLength', 6)),
+        params.get('rules'),
+        params.get('mask'),
+        params.get('customCharsets'),
+        int(params.get('skip', 0))
+    )
+
+def _run_crack_hashes(params):
+    """Tâche de crackage groupé (mêmes paramètres que /api/crack-hashes)"""
+    return crack_hashes(
+        params.get('hashes'),
+        params.get('type'),
+        params.get('dictionary'),
+        params.get('mode', 'bruteforce'),
+        params.get('charset', 'alphanumeric'),
+        int(params.get('maxLength', 6)),
+        rules=params.get('rules'),
+        mask=params.get('mask'),
+        custom_charsets=params.get('customCharsets'),
+        skip=int(params.get('skip', 0))
+    )
+
+def _run_crack_session(params):
+    """Session de crackage reprenable (mêmes paramètres que /api/crack-sessions)"""
+    limit = params.get('limit')
+    return start_session(
+        params.get('hashes'),
+        params.get('type'),
+        params.get('mode', 'bruteforce'),
+        params.get('dictionary'),
+        params.get('rules'),
+        params.get('charset', 'alphanumeric'),
+        int(params.get('maxLength', 6)),
+        params.get('mask'),
+        params.get('customCharsets'),
+        int(params.get('skip', 0)),
+        int(limit) if limit is not None else None,
+        params.get('sessionId')
+    )
+
+def _run_resume_session(params):
+    """Reprise d'une session de crackage depuis son dernier point de reprise"""
+    return resume_session(params.get('sessionId'))
+
+def _run_import_moduli(params):
+    """Import de modules dans le corpus RSA (mêmes paramètres que /api/rsa-corpus)"""
+    return import_moduli((int(str(n).strip(), 0) for n in params.get('moduli', [])), params.get('source'))
+
+JOB_TYPES = {
+    'factorize': _run_factorize,
+    'crack-hash': _run_crack_hash,
+    'crack-hashes': _run_crack_hashes,
+    'crack-session': _run_crack_session,
+    'resume-session': _run_resume_session,
+    'import-moduli': _run_import_moduli
+}
+
+_jobs = OrderedDict()
+_lock = threading.Lock()
+_scheduler = None
+
+def _job_entry(job_type, params, cpu_time_limit, connection):
+    """Point d'entrée du processus d'une tâche"""
+    # Groupe de processus dédié : l'annulation tue aussi les sous-processus
+    os.setpgrp()
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu_time_limit, cpu_time_limit + 5))
+    # Les moteurs publient leur avancement par report_progress
+    set_progress_channel(connection)
+    set_worker_limit(JOB_WORKERS)
+    # Mesures propres à la tâche, ajoutées à celles du serveur à la fin
+    metrics.reset()
+    try:
+        result = JOB_TYPES[job_type](params)
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    connection.send(('metrics', metrics.snapshot()))
+    connection.send(('result', result))
+    connection.close()
+
+def submit_job(job_type, params, cpu_time_limit=None):
+    """
+    Ajoute une tâche à la file d'attente.
+
+    Args:
+        job_type (str): Type de tâche (voir JOB_TYPES)
+        params (dict): Paramètres de la tâche
+        cpu_time_limit (int): Temps CPU maximal en secondes
+
+    Returns:
+        str: Identifiant de la tâche
+    """
+    if job_type not in JOB_TYPES:
+        raise ValueError(f"Type de tâche non supporté: {job_type}")
+    if cpu_time_limit is None:
+        cpu_time_limit = DEFAULT_CPU_TIME_LIMIT
+    try:
+        cpu_time_limit = max(1, min(int(cpu_time_limit), MAX_CPU_TIME_LIMIT))
+    except (TypeError, ValueError):
+        raise ValueError(f"Temps CPU maximal invalide: {cpu_time_limit}")
+
+    job_id = uuid.uuid4().hex
+    with _lock:
+        _jobs[job_id] = {
+            'id': job_id,
+            'type': job_type,
+            'params': params,
+            'status': QUEUED,
+            'cpu_time_limit': cpu_time_limit,
+            'submitted_at': time.time(),
+            'started_at': None,
+            'finished_at': None,
+            'progress': {},
+            'result': None,
+            'error': None,
+            'process': None,
+            'connection': None
+        }
+        _prune_jobs()
+    _ensure_scheduler()
+    return job_id
+
+def get_job(job_id):
+    """
+    Retourne l'état d'une tâche (sans son résultat).
+
+    Returns:
+        dict: État, avancement et durées, ou None si la tâche est inconnue
+    """
+    with _lock:
+        job = _jobs.get(job_id)
+        if job is None:
+            return None
+        now = time.time()
+        return {
+            'job_id': job['id'],
+            'type': job['type'],
+            'status': job['status'],
+            'progress': dict(job['progress']),
+            'error': job['error'],
+            'queued_time': (job['started_at'] or now) - job['submitted_at'],
+            'elapsed_time': ((job['finished_at'] or now) - job['started_at']) if job['started_at'] else 0,
+            'cpu_time_limit': job['cpu_time_limit']
+        }
+
+def get_job_result(job_id):
+    """
+    Retourne le résultat d'une tâche terminée.
+
+    Returns:
+        tuple: (état de la tâche ou None si inconnue, résultat ou None)
+    """
+    with _lock:
+        job = _jobs.get(job_id)
+        if job is None:
+            return None, None
+        return job['status'], job['result']
+
+def cancel_job(job_id):
+    """
+    Annule une tâche en attente ou en cours (le processus est tué).
+
+    Returns:
+        bool: True si la tâche a été annulée
+    """
+    with _lock:
+        job = _jobs.get(job_id)
+        if job is None or job['status'] in FINISHED_STATES:
+            return False
+        if job['status'] == RUNNING:
+            _kill(job)
+        job['status'] = CANCELLED
+        job['finished_at'] = time.time()
+        return True
+
+def _kill(job):
+    """Tue le processus d'une tâche et ses sous-processus"""
+    process = job['process']
+    if process is not None:
+        # Même mort (SIGXCPU), le processus a pu laisser des sous-processus dans son groupe
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            # Groupe vide, ou pas encore créé par le processus
+            if process.is_alive():
+                process.kill()
+        process.join(1)
+    if job['connection'] is not None:
+        job['connection'].close()
+    job['process'] = None
+    job['connection'] = None
+
+def _shutdown():
+    """Tue les tâches en cours à l'arrêt du serveur"""
+    with _lock:
+        for job in _jobs.values():
+            if job['status'] == RUNNING:
+                _kill(job)
+                job['status'] = CANCELLED
+
+atexit.register(_shutdown)
+
+def _prune_jobs():
+    """Oublie les tâches terminées les plus anciennes au-delà de MAX_STORED_JOBS"""
+    excess = len(_jobs) - MAX_STORED_JOBS
+    for job_id in [i for i, job in _jobs.items() if job['status'] in FINISHED_STATES]:
+        if excess <= 0:
+            break
+        del _jobs[job_id]
+        excess -= 1
+
+def _ensure_scheduler():
+    """Démarre le thread de surveillance s'il ne tourne pas déjà"""
+    global _scheduler
+    with _lock:
+        if _scheduler is None or not _scheduler.is_alive():
+            _scheduler = threading.Thread(target=_schedule, name='job-scheduler', daemon=True)
+            _scheduler.start()
+
+def _schedule():
+    """Boucle du thread de surveillance : démarre, suit et termine les tâches"""
+    while True:
+        with _lock:
+            active = [job for job in _jobs.values() if job['status'] in (QUEUED, RUNNING)]
+            running = [job for job in active if job['status'] == RUNNING]
+
+            for job in running:
+                _poll(job)
+
+            free_slots = MAX_RUNNING_JOBS - sum(1 for job in running if job['status'] == RUNNING)
+            for job in active:
+                if free_slots <= 0:
+                    break
+                if job['status'] == QUEUED:
+                    _start(job)
+                    free_slots -= 1
+        time.sleep(POLL_INTERVAL)
+
+def _start(job):
+    """Lance le processus d'une tâche"""
+    parent_connection, child_connection = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_job_entry,
+        args=(job['type'], job['params'], job['cpu_time_limit'], child_connection),
+        name=f"job-{job['id']}"
+    )
+    process.start()
+    child_connection.close()
+    job['process'] = process
+    job['connection'] = parent_connection
+    job['status'] = RUNNING
+    job['started_at'] = time.time()
+
+def _poll(job):
+    """Relève les messages d'une tâche en cours et détecte sa fin"""
+    connection = job['connection']
+    try:
+        while connection.poll():
+            kind, payload = connection.recv()
+            if kind == 'progress':
+                # Changement de moteur : l'avancement du précédent n'a plus de sens
+                if 'engine' in payload and payload['engine'] != job['progress'].get('engine'):
+                    job['progress'] = {}
+                job['progress'].update(payload)
+            elif kind == 'metrics':
+                metrics.merge(payload)
+            elif kind == 'result':
+                job['result'] = payload
+                job['status'] = DONE
+    except (EOFError, OSError):
+        pass
+
+    process = job['process']
+    if job['status'] == DONE:
+        process.join(1)
+        _kill(job)
+        job['finished_at'] = time.time()
+    elif not process.is_alive():
+        job['status'] = FAILED
+        if process.exitcode == -signal.SIGXCPU or process.exitcode == -signal.SIGKILL:
+            job['error'] = f"Limite de temps CPU dépassée ({job['cpu_time_limit']} s)"
+        else:
+            job['error'] = f"Le processus de la tâche s'est arrêté (code {process.exitcode})"
+        _kill(job)
+        job['finished_at'] = time.time()
@@ -0,0 +1,195 @@
+"""
+Module de règles de transformation des mots
+Décline chaque mot d'un dictionnaire (casse, leetspeak, chiffres et années
+ajoutés, inversion, duplication...) selon des règles dans la syntaxe de
+hashcat / John the Ripper.
+
+Chaque règle est compilée une seule fois en une suite de transformations
+sur des bytes ; les tables de substitution consécutives sont fusionnées en
+un seul bytes.translate.
+"""
+
+# Tables de casse (ASCII, comme les règles de hashcat)
+_IDENTITY = bytes(range(256))
+_LOWER = _IDENTITY.lower()
+_UPPER = _IDENTITY.upper()
+_TOGGLE = _IDENTITY.swapcase()
+
+# Opérations sans argument
+_SIMPLE_OPERATIONS = {
+    'r': lambda word: word[::-1],
+    'd': lambda word: word + word,
+    'f': lambda word: word + word[::-1],
+    'c': bytes.capitalize,
+    'C': lambda word: word[:1].lower() + word[1:].upper(),
+    '[': lambda word: word[1:],
+    ']': lambda word: word[:-1]
+}
+
+# Opérations de casse, exprimées comme tables de substitution
+_TABLE_OPERATIONS = {
+    'l': _LOWER,
+    'u': _UPPER,
+    't': _TOGGLE
+}
+
+def _leet(substitutions):
+    """Règle de substitutions leetspeak, ex. 'ao' -> 'sa@so0'"""
+    return ''.join(f"s{source}{target}" for source, target in substitutions)
+
+_YEARS = [str(year) for year in range(1970, 2031)]
+
+# Jeux de règles prédéfinis
+RULESETS = {
+    'basic': [':', 'l', 'u', 'c', 't', 'r', 'd', 'f', 'C'],
+    'leet': [
+        ':',
+        _leet(['a@']), _leet(['a4']), _leet(['e3']), _leet(['i1']), _leet(['o0']), _leet(['s$']), _leet(['s5']),
+        _leet(['a@', 'o0']), _leet(['e3', 'o0']), _leet(['a@', 'e3', 'i1', 'o0']),
+        _leet(['a4', 'e3', 'i1', 'o0', 's5']), _leet(['a@', 'e3', 'i1', 'o0', 's$']),
+        'c' + _leet(['a@', 'o0']), 'c' + _leet(['e3', 'o0']), 'c' + _leet(['a@', 'e3', 'i1', 'o0'])
+    ],
+    'digits': (
+        [':']
+        + [f"${d}" for d in '0123456789']
+        + [f"${a}${b}" for a in '0123456789' for b in '0123456789']
+        + [f"^{d}" for d in '0123456789']
+        + ['$1$2$3', '$!', '$1$!', '$!$1', '$*', '$.', '$?']
+        + [f"c${d}" for d in '0123456789']
+        + ['c$1$2$3', 'c$!', 'c$1$!', 'c$1$2$!', 'c$1$2$3$!', 'u$1', 'u$!']
+    ),
+    'years': (
+        [':']
+        + ['$' + '$'.join(year) for year in _YEARS]
+        + ['c$' + '$'.join(year) for year in _YEARS]
+        + ['$' + '$'.join(year[2:]) for year in _YEARS]
+        + ['c$' + '$'.join(year[2:]) for year in _YEARS]
+        + ['c$' + '$'.join(year) + '$!' for year in _YEARS]
+    )
+}
+RULESETS['all'] = list(dict.fromkeys(rule for name in ('basic', 'leet', 'digits', 'years')
+                                     for rule in RULESETS[name]))
+
+def _compose(first, second):
+    """Table de substitution équivalente à first puis second"""
+    return first.translate(second)
+
+def compile_rule(rule):
+    """
+    Compile une règle en suite de transformations.
+
+    Syntaxe reconnue (hashcat) : ':' (aucune), 'l', 'u', 'c', 'C', 't',
+    'TN' (bascule la casse en position N), 'r', 'd', 'f', '[', ']',
+    '$X' (ajoute X), '^X' (préfixe X), 'sXY' (remplace X par Y).
+    Les espaces entre opérations sont ignorés.
+
+    Args:
+        rule (str): La règle
+
+    Returns:
+        tuple: Fonctions bytes -> bytes à appliquer dans l'ordre
+    """
+    steps = []
+    table = None
+    suffix = b''
+    position = 0
+
+    def flush():
+        nonlocal table, suffix
+        if table is not None:
+            steps.append(lambda word, table=table: word.translate(table))
+            table = None
+        if suffix:
+            steps.append(lambda word, suffix=suffix: word + suffix)
+            suffix = b''
+
+    while position < len(rule):
+        operation = rule[position]
+        position += 1
+        if operation in ' :':
+            continue
+
+        if operation in _TABLE_OPERATIONS or operation == 's':
+            if operation == 's':
+                if position + 2 > len(rule):
+                    raise ValueError(f"Règle incomplète: {rule}")
+                source, target = rule[position:position + 2].encode('latin-1')
+                position += 2
+                substitution = bytearray(_IDENTITY)
+                substitution[source] = target
+                operation_table = bytes(substitution)
+            else:
+                operation_table = _TABLE_OPERATIONS[operation]
+            if suffix:
+                flush()
+            table = operation_table if table is None else _compose(table, operation_table)
+            continue
+
+        if operation == '$':
+            if position >= len(rule):
+                raise ValueError(f"Règle incomplète: {rule}")
+            character = rule[position].encode('latin-1')
+            position += 1
+            if table is not None:
+                flush()
+            suffix += character
+            continue
+
+        flush()
+        if operation in _SIMPLE_OPERATIONS:
+            steps.append(_SIMPLE_OPERATIONS[operation])
+        elif operation == '^':
+            if position >= len(rule):
+                raise ValueError(f"Règle incomplète: {rule}")
+            prefix = rule[position].encode('latin-1')
+            position += 1
+            steps.append(lambda word, prefix=prefix: prefix + word)
+        elif operation == 'T':
+            if position >= len(rule) or not rule[position].isdigit():
+                raise ValueError(f"Règle incomplète: {rule}")
+            index = int(rule[position])
+            position += 1
+            steps.append(lambda word, index=index: word[:index] + word[index:index + 1].swapcase() + word[index + 1:])
+        else:
+            raise ValueError(f"Opération de règle inconnue '{operation}' dans: {rule}")
+
+    flush()
+    return tuple(steps)
+
+def resolve_rules(rules):
+    """
+    Normalise la sélection de règles.
+
+    Args:
+        rules (str | list): Nom d'un jeu prédéfini (voir RULESETS), règles
+            séparées par des retours à la ligne, ou liste de règles
+
+    Returns:
+        list: Les règles textuelles, sans doublons
+    """
+    if isinstance(rules, str):
+        rules = RULESETS[rules] if rules in RULESETS else rules.splitlines()
+    return list(dict.fromkeys(rule.strip() or ':' for rule in rules))
+
+def mangle(words, rules):
+    """
+    Décline paresseusement chaque mot par chaque règle, sans répéter un même
+    candidat pour un mot donné.
+
+    Args:
+        words (iterable): Mots de base (bytes)
+        rules (list): Règles textuelles
+
+    Returns:
+        generator: (candidat, indice de la règle qui l'a produit)
+    """
+    compiled = [compile_rule(rule) for rule in rules]
+    for word in words:
+        seen = set()
+        for index, steps in enumerate(compiled):
+            candidate = word
+            for step in steps:
+                candidate = step(candidate)
+            if candidate not in seen:
+                seen.add(candidate)
+                yield candidate, index
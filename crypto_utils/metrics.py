@@ -0,0 +1,212 @@
+"""
+Module d'instrumentation des moteurs
+Chaque exécution d'un moteur (division par essai, Rho, crible, ECM,
+FactorDB, attaques de hash, lecture PEM, vérifications de sécurité RSA)
+enregistre sa durée, son issue et le travail effectué (itérations, PGCD,
+candidats...). Les mesures sont exposées au format texte de Prometheus.
+
+Les mesures sont propres au processus : un processus de tâche envoie les
+siennes au serveur à la fin de la tâche (voir jobs). CRYPTOTOOLS_METRICS=0
+désactive l'enregistrement, chaque appel se réduit alors à un test.
+
+Le profilage d'une requête (cProfile) par start_profile n'est possible que
+si CRYPTOTOOLS_PROFILING=1 : le rapport expose le code du serveur.
+"""
+
+import io
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+METRICS_ENABLED = os.environ.get('CRYPTOTOOLS_METRICS', '1') != '0'
+PROFILING_ENABLED = os.environ.get('CRYPTOTOOLS_PROFILING', '0') == '1'
+
+# Bornes supérieures des histogrammes de durée (secondes)
+DURATION_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0, 300.0)
+
+# Lignes du rapport de profilage, et tri des fonctions
+PROFILE_LINES = 40
+PROFILE_SORT = 'cumulative'
+
+# Description et type de chaque métrique exposée
+METRICS = {
+    'cryptotools_engine_runs_total': (
+        'counter', "Exécutions des moteurs par issue (success, failure, error, timeout ; ok ou "
+                   "vulnerable pour les vérifications RSA)"),
+    'cryptotools_engine_duration_seconds': ('histogram', "Durée d'une exécution de moteur"),
+    'cryptotools_engine_work_total': (
+        'counter', "Travail effectué par les moteurs (itérations, PGCD, candidats, courbes...)"),
+    'cryptotools_http_request_duration_seconds': ('histogram', "Durée de traitement des requêtes HTTP"),
+}
+
+# (nom, étiquettes) -> valeur ; étiquettes : tuple de paires (nom, valeur)
+_counters = {}
+# (nom, étiquettes) -> [effectif de chaque intervalle..., effectif au-delà, somme]
+_histograms = {}
+_lock = threading.Lock()
+
+def _reset_after_fork():
+    """Le verrou a pu être pris par un autre thread au moment du fork"""
+    global _lock
+    _lock = threading.Lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+def _increment(name, labels, value):
+    _counters[name, labels] = _counters.get((name, labels), 0) + value
+
+def _observe(name, labels, value):
+    histogram = _histograms.get((name, labels))
+    if histogram is None:
+        histogram = _histograms[name, labels] = [0] * (len(DURATION_BUCKETS) + 1) + [0.0]
+    index = 0
+    while index < len(DURATION_BUCKETS) and value > DURATION_BUCKETS[index]:
+        index += 1
+    histogram[index] += 1
+    histogram[-1] += value
+
+def record_run(engine, seconds, outcome='success', **work):
+    """
+    Enregistre une exécution de moteur.
+
+    Args:
+        engine (str): Nom du moteur (ex. 'pollard-rho', 'rsa/close-primes')
+        seconds (float): Durée de l'exécution
+        outcome (str): Issue (success, failure, error...)
+        **work: Quantités de travail effectuées, par unité (ex. iterations=1200)
+    """
+    if not METRICS_ENABLED:
+        return
+    with _lock:
+        _increment('cryptotools_engine_runs_total', (('engine', engine), ('outcome', outcome)), 1)
+        _observe('cryptotools_engine_duration_seconds', (('engine', engine),), seconds)
+        for unit, amount in work.items():
+            if amount:
+                _increment('cryptotools_engine_work_total', (('engine', engine), ('unit', unit)), amount)
+
+@contextmanager
+def timed(engine):
+    """
+    Mesure le bloc comme une exécution de moteur. Le bloc reçoit un dict où
+    renseigner l'issue ('outcome', 'success' par défaut) et le travail
+    effectué ; une exception est comptée comme une erreur.
+    """
+    run = {}
+    if not METRICS_ENABLED:
+        yield run
+        return
+    start = time.perf_counter()
+    try:
+        yield run
+    except BaseException:
+        run['outcome'] = 'error'
+        raise
+    finally:
+        outcome = run.pop('outcome', 'success')
+        record_run(engine, time.perf_counter() - start, outcome, **run)
+
+def record_request(endpoint, method, status, seconds):
+    """Enregistre la durée d'une requête HTTP (endpoint : règle de la route, pas le chemin)"""
+    if not METRICS_ENABLED:
+        return
+    labels = (('endpoint', endpoint), ('method', method), ('status', str(status)))
+    with _lock:
+        _observe('cryptotools_http_request_duration_seconds', labels, seconds)
+
+def snapshot():
+    """
+    Copie des mesures du processus (transmissible à un autre processus).
+
+    Returns:
+        tuple: (compteurs, histogrammes)
+    """
+    with _lock:
+        return dict(_counters), {key: list(values) for key, values in _histograms.items()}
+
+def merge(measures):
+    """Ajoute les mesures d'un autre processus (résultat de snapshot) à celles du processus"""
+    counters, histograms = measures
+    with _lock:
+        for (name, labels), value in counters.items():
+            _increment(name, labels, value)
+        for key, values in histograms.items():
+            histogram = _histograms.setdefault(key, [0] * len(values))
+            for index, value in enumerate(values):
+                histogram[index] += value
+
+def reset():
+    """Oublie toutes les mesures (processus de tâche hérité du serveur)"""
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+def _format_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+               for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+def render_metrics():
+    """
+    Mesures au format texte d'exposition de Prometheus (version 0.0.4).
+
+    Returns:
+        str: Une métrique par famille, avec HELP et TYPE
+    """
+    counters, histograms = snapshot()
+    lines = []
+    for name, (kind, description) in METRICS.items():
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {kind}")
+        if kind == 'counter':
+            for (metric, labels), value in sorted(counters.items()):
+                if metric == name:
+                    lines.append(f"{name}{_format_labels(labels)} {value}")
+            continue
+        for (metric, labels), values in sorted(histograms.items()):
+            if metric != name:
+                continue
+            cumulative = 0
+            for bound, count in zip(DURATION_BUCKETS + ('+Inf',), values):
+                cumulative += count
+                lines.append(f"{name}_bucket{_format_labels(labels, [('le', bound)])} {cumulative}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {values[-1]}")
+            lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+    return '\n'.join(lines) + '\n'
+
+def start_profile():
+    """
+    Démarre le profilage du thread courant.
+
+    Returns:
+        cProfile.Profile: Le profileur actif, ou None si le profilage est désactivé
+        ou si un autre profileur est déjà actif
+    """
+    if not PROFILING_ENABLED:
+        return None
+    import cProfile
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        return None
+    return profiler
+
+def profile_report(profiler, lines=PROFILE_LINES, sort=PROFILE_SORT):
+    """
+    Arrête le profileur et met en forme ses statistiques.
+
+    Returns:
+        str: Fonctions les plus coûteuses (sortie de pstats)
+    """
+    profiler.disable()
+    import pstats
+
+    output = io.StringIO()
+    pstats.Stats(profiler, stream=output).strip_dirs().sort_stats(sort).print_stats(lines)
+    return output.getvalue()
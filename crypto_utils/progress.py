@@ -0,0 +1,91 @@
+"""
+Module de publication de l'avancement
+Les moteurs (crackage, factorisation) publient leur avancement vers le
+processus parent d'une tâche asynchrone. Les envois sont limités à
+quelques-uns par seconde ; hors d'une tâche, les appels sont sans effet.
+
+Une tâche borne aussi le nombre de processus de calcul des moteurs
+(set_worker_limit, worker_count).
+"""
+
+import os
+import time
+
+# Intervalle minimal entre deux publications (secondes)
+PROGRESS_INTERVAL = 0.25
+
+# Canal vers le processus parent, défini uniquement dans un processus de tâche
+_connection = None
+_last_report = 0.0
+
+# Nombre maximal de processus de calcul d'un moteur (None : pas de limite)
+_worker_limit = None
+
+def set_progress_channel(connection):
+    """
+    Définit le canal de publication du processus courant (None pour le
+    désactiver, par exemple dans les sous-processus de calcul).
+    """
+    global _connection, _last_report
+    _connection = connection
+    _last_report = 0.0
+
+def set_worker_limit(limit):
+    """Borne le nombre de processus de calcul des moteurs du processus courant (None : aucune)"""
+    global _worker_limit
+    _worker_limit = limit
+
+def worker_count(requested=None):
+    """
+    Nombre de processus de calcul d'un moteur.
+
+    Args:
+        requested (int): Nombre demandé (défaut : nombre de cœurs)
+
+    Returns:
+        int: requested, borné par la limite du processus courant
+    """
+    workers = requested or os.cpu_count() or 1
+    return min(workers, _worker_limit) if _worker_limit is not None else workers
+
+def progress_due():
+    """Indique si une publication serait envoyée maintenant (test peu coûteux)"""
+    return _connection is not None and time.monotonic() - _last_report >= PROGRESS_INTERVAL
+
+def report_progress(force=False, **progress):
+    """
+    Publie l'avancement de la tâche en cours.
+
+    Args:
+        force (bool): Publier même si la précédente est trop récente
+        **progress: Valeurs à publier (tentatives, débit, moteur...)
+    """
+    global _last_report
+    if _connection is None:
+        return
+    now = time.monotonic()
+    if not force and now - _last_report < PROGRESS_INTERVAL:
+        return
+    _last_report = now
+    try:
+        _connection.send(('progress', progress))
+    except (OSError, ValueError):
+        pass
+
+def rate_and_eta(done, total, elapsed, initial=0):
+    """
+    Débit, pourcentage et temps restant estimé d'un travail mesurable.
+
+    Args:
+        done (int): Quantité de travail faite
+        total (int): Quantité totale (None si inconnue)
+        elapsed (float): Durée écoulée depuis le début (ou la reprise)
+        initial (int): Travail déjà fait au début (ou à la reprise)
+
+    Returns:
+        dict: {'rate', 'percent', 'eta'} (eta en secondes, None si inconnu)
+    """
+    rate = (done - initial) / elapsed if elapsed > 0 else 0.0
+    percent = 100.0 * done / total if total else None
+    eta = (total - done) / rate if total and rate > 0 else None
+    return {'rate': rate, 'percent': percent, 'eta': eta}
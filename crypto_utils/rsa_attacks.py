@@ -0,0 +1,196 @@
+"""
+Module des attaques sur les clés RSA
+Factorisation de Fermat (facteurs proches), attaque de Wiener (petit exposant
+privé) et attaques par petit exposant public (racine e-ième, diffusion de
+Håstad). Chaque moteur dispose de son propre budget de temps.
+"""
+
+import math
+import time
+from functools import lru_cache
+
+from crypto_utils import arithmetic
+from crypto_utils.factorizer import integer_root
+
+# Budgets de temps par défaut (secondes) et budget maximal accepté ; Fermat
+# est lancé à chaque analyse et n'aboutit que sur des facteurs très proches
+FERMAT_TIME_LIMIT = 0.1
+WIENER_TIME_LIMIT = 1.0
+LOW_EXPONENT_TIME_LIMIT = 1.0
+MAX_ATTACK_TIME_LIMIT = 30.0
+
+# Crible de Fermat : a n'est essayé que si a² - n est un carré modulo chacun
+# de ces facteurs (leur produit est le pas du crible)
+FERMAT_SIEVE_FACTORS = (16, 9, 5, 7, 11)
+FERMAT_SIEVE_MODULUS = math.prod(FERMAT_SIEVE_FACTORS)
+
+# Valeurs de a essayées directement avant de construire le crible
+FERMAT_QUICK_STEPS = 1024
+
+# Second filtre, appliqué à a² - n avant le calcul de la racine entière
+FERMAT_FILTER_MODULUS = 13 * 17 * 19 * 23
+
+@lru_cache(maxsize=None)
+def _square_table(m):
+    """Table des carrés modulo m (1 si l'indice est un carré)"""
+    table = bytearray(m)
+    for x in range(m // 2 + 1):
+        table[x * x % m] = 1
+    return bytes(table)
+
+def _fermat_residues(n):
+    """Résidus de a modulo FERMAT_SIEVE_MODULUS pour lesquels a² - n peut être un carré"""
+    # Combinaison par restes chinois des résidus admissibles de chaque facteur
+    residues, modulus = [0], 1
+    for f in FERMAT_SIEVE_FACTORS:
+        squares = _square_table(f)
+        admissible = [r for r in range(f) if squares[(r * r - n) % f]]
+        inverse = pow(modulus, -1, f)
+        residues = [x + modulus * ((r - x) * inverse % f) for x in residues for r in admissible]
+        modulus *= f
+    residues.sort()
+    return residues
+
+def fermat_factor(n, time_limit=FERMAT_TIME_LIMIT):
+    """
+    Factorisation de Fermat : cherche a tel que a² - n = b², d'où n = (a - b)(a + b).
+    Aboutit vite lorsque p et q sont proches de la racine carrée de n.
+
+    Args:
+        n (int): Le module (impair)
+        time_limit (float): Budget de temps en secondes (0 : passe rapide seule)
+
+    Returns:
+        tuple: (p, q) avec p <= q, ou None si le budget est épuisé
+    """
+    deadline = time.time() + time_limit
+    if n % 2 == 0:
+        return 2, n // 2
+    a = arithmetic.isqrt(n)
+    if a * a == n:
+        return a, a
+    a += 1
+
+    f = FERMAT_FILTER_MODULUS
+    filter_squares = _square_table(f)
+
+    # Passe rapide : facteurs très proches, sans construire le crible
+    squares_64 = _square_table(64)
+    b2 = a * a - n
+    for _ in range(FERMAT_QUICK_STEPS):
+        if squares_64[b2 & 63] and filter_squares[b2 % f] and arithmetic.is_square(b2):
+            b = arithmetic.isqrt(b2)
+            return a - b, a + b
+        b2 += 2 * a + 1
+        a += 1
+
+    m = FERMAT_SIEVE_MODULUS
+    residues = _fermat_residues(n)
+
+    start = a
+    base = a - a % m
+    while time.time() < deadline:
+        for r in residues:
+            a = base + r
+            if a < start:
+                continue
+            b2 = a * a - n
+            if filter_squares[b2 % f] and arithmetic.is_square(b2):
+                b = arithmetic.isqrt(b2)
+                return a - b, a + b
+        base += m
+    return None
+
+def wiener_attack(n, e, time_limit=WIENER_TIME_LIMIT):
+    """
+    Attaque de Wiener : si d < n^(1/4) / 3, k/d est une réduite du développement
+    en fraction continue de e/n (car ed - kφ(n) = 1).
+
+    Args:
+        n (int): Le module
+        e (int): L'exposant public
+        time_limit (float): Budget de temps en secondes
+
+    Returns:
+        tuple: (p, q, d) ou None
+    """
+    deadline = time.time() + time_limit
+    # Au-delà de la borne de Wiener, les réduites ne peuvent plus donner d
+    bound = arithmetic.isqrt(arithmetic.isqrt(n))
+    num, den = e, n
+    k_prev, k = 0, 1
+    d_prev, d = 1, 0
+    while den and d <= bound and time.time() < deadline:
+        quotient, remainder = divmod(num, den)
+        num, den = den, remainder
+        k_prev, k = k, quotient * k + k_prev
+        d_prev, d = d, quotient * d + d_prev
+        if k == 0 or (e * d - 1) % k:
+            continue
+
+        # φ(n) candidat : p et q sont les racines de x² - (n - φ + 1)x + n
+        phi = (e * d - 1) // k
+        s = n - phi + 1
+        discriminant = s * s - 4 * n
+        if discriminant < 0:
+            continue
+        if not arithmetic.is_square(discriminant):
+            continue
+        t = arithmetic.isqrt(discriminant)
+        if (s + t) % 2 == 0:
+            p, q = (s - t) // 2, (s + t) // 2
+            if p > 1 and p * q == n:
+                return p, q, d
+    return None
+
+def low_exponent_attack(c, e, n, time_limit=LOW_EXPONENT_TIME_LIMIT):
+    """
+    Déchiffrement sans clé privée quand m^e dépasse peu n (exposant faible,
+    message sans bourrage) : cherche k tel que c + k·n soit une puissance e-ième.
+
+    Args:
+        c (int): Le chiffré
+        e (int): L'exposant public
+        n (int): Le module
+        time_limit (float): Budget de temps en secondes
+
+    Returns:
+        int: Le message clair, ou None
+    """
+    deadline = time.time() + time_limit
+    x = c
+    while True:
+        m = integer_root(x, e)
+        if m ** e == x:
+            return m
+        if time.time() >= deadline:
+            return None
+        x += n
+
+def hastad_broadcast(ciphertexts, moduli, e):
+    """
+    Attaque de Håstad : un même message chiffré sans bourrage pour e
+    destinataires (même exposant e) est retrouvé par les restes chinois.
+
+    Args:
+        ciphertexts (list): Les chiffrés (au moins e)
+        moduli (list): Les modules correspondants
+        e (int): L'exposant public commun
+
+    Returns:
+        int: Le message clair, ou None
+    """
+    if len(ciphertexts) < e or len(ciphertexts) != len(moduli):
+        raise ValueError(f"Il faut au moins {e} couples (chiffré, module)")
+    pairs = list(zip(ciphertexts, moduli))[:e]
+
+    product = math.prod(n for _, n in pairs)
+    x = 0
+    for c, n in pairs:
+        partial = product // n
+        # Modules non premiers entre eux : ValueError (ils partagent un facteur)
+        x += c * partial * arithmetic.invert(partial, n)
+    x %= product
+
+    m = integer_root(x, e)
+    return m if m ** e == x else None
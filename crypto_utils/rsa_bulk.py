@@ -0,0 +1,173 @@
+"""
+Module d'analyse de clés RSA en masse
+Lit un flux (lot de blocs PEM, chaîne de certificats, NDJSON de modules)
+ligne par ligne et produit un résultat par clé au fil de la lecture, sans
+conserver le flux en mémoire. Les modules sont vérifiés contre le corpus
+par lots.
+"""
+
+import json
+import time
+
+from crypto_utils.batch_gcd import IMPORT_CHUNK, check_moduli, serialize_finding
+from crypto_utils.rsa_utils import analyze_security, load_pem_block, pem_body_to_der
+
+# Nombre maximal de lignes d'un bloc PEM (au-delà, le bloc est abandonné)
+MAX_PEM_LINES = 2000
+
+# Budgets de temps par clé pour une analyse en masse (Fermat : passe rapide seule)
+BULK_FERMAT_TIME_LIMIT = 0
+BULK_WIENER_TIME_LIMIT = 0.05
+
+# Premiers caractères d'une ligne NDJSON (objet, chaîne ou nombre)
+NDJSON_STARTS = '{"0123456789'
+
+NDJSON_FORMAT = 'NDJSON'
+
+def iter_key_sources(lines):
+    """
+    Découpe un flux texte en clés, au fil de la lecture. Hors des blocs PEM,
+    les lignes qui ne ressemblent pas à du JSON (texte d'openssl...) sont ignorées.
+
+    Args:
+        lines (iterable): Lignes du flux
+
+    Yields:
+        tuple: (numéro de la première ligne, format, contenu) ; le format est le
+        type du bloc PEM ou NDJSON, le contenu est le corps base64 du bloc (None
+        s'il est incomplet) ou la ligne JSON
+    """
+    label = None
+    start = 0
+    body = []
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if label is not None:
+            if line.startswith('-----END '):
+                yield start, label, '\n'.join(body) if line == f'-----END {label}-----' else None
+                label = None
+            elif len(body) >= MAX_PEM_LINES:
+                yield start, label, None
+                label = None
+            else:
+                body.append(line)
+        elif line.startswith('-----BEGIN ') and line.endswith('-----'):
+            label = line[len('-----BEGIN '):-len('-----')]
+            start = number
+            body = []
+        elif line[:1] and line[:1] in NDJSON_STARTS:
+            yield number, NDJSON_FORMAT, line
+    if label is not None:
+        yield start, label, None
+
+def _to_int(value):
+    """Entier depuis un nombre JSON ou une chaîne (décimale ou hexadécimale 0x)"""
+    if isinstance(value, bool):
+        raise ValueError("Valeur numérique invalide")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = value.strip()
+        return int(value, 16) if value.lower().startswith('0x') else int(value)
+    raise ValueError("Valeur numérique invalide")
+
+def parse_ndjson_key(line):
+    """
+    Paramètres d'une clé décrite par une ligne NDJSON : objet {"n", "e"} (ou
+    modulus, publicExponent), ou module seul (e = 65537 est alors supposé).
+
+    Returns:
+        dict: Paramètres de la clé
+    """
+    value = json.loads(line)
+    if isinstance(value, dict):
+        modulus = value.get('n', value.get('modulus'))
+        exponent = value.get('e', value.get('publicExponent', 65537))
+    else:
+        modulus, exponent = value, 65537
+    if modulus is None:
+        raise ValueError("Module manquant")
+
+    n = _to_int(modulus)
+    if n <= 1:
+        raise ValueError("Le module doit être supérieur à 1")
+    return {
+        'modulus': str(n),
+        'publicExponent': _to_int(exponent),
+        'keySize': n.bit_length(),
+        'isPrivate': False
+    }
+
+def _parse_source(key_format, payload):
+    """Paramètres d'une clé du flux, selon son format"""
+    if key_format == NDJSON_FORMAT:
+        return parse_ndjson_key(payload)
+    if payload is None:
+        raise ValueError(f"Bloc PEM {key_format} incomplet ou mal terminé")
+    return load_pem_block(key_format, pem_body_to_der(payload))
+
+def _shared_prime_records(pending, source):
+    """Vérifie un lot de modules contre le corpus et décrit les modules cassés"""
+    for finding in check_moduli(list(pending), source):
+        record = {'type': 'shared-prime', 'indices': pending[finding['modulus']]}
+        record.update(serialize_finding(finding))
+        yield record
+
+def analyze_rsa_stream(lines, options=None, source='import'):
+    """
+    Analyse en flux toutes les clés d'un lot.
+
+    Args:
+        lines (iterable): Lignes du flux (PEM, certificats ou NDJSON, mélangeables)
+        options (dict): Options de analyze_rsa_key ; les budgets de temps par
+            défaut sont réduits (BULK_FERMAT_TIME_LIMIT, BULK_WIENER_TIME_LIMIT)
+        source (str): Provenance enregistrée avec les modules dans le corpus
+
+    Yields:
+        dict: Un résultat par clé (type 'key'), les modules cassés par un
+        facteur partagé après la vérification de chaque lot (type
+        'shared-prime'), puis un résumé (type 'summary')
+    """
+    start_time = time.time()
+    options = dict(options or {})
+    options.setdefault('fermatTimeLimit', BULK_FERMAT_TIME_LIMIT)
+    options.setdefault('wienerTimeLimit', BULK_WIENER_TIME_LIMIT)
+    check_shared = options.get('checkSharedPrimes', True) or options.get('checkCommonFactors', True)
+
+    summary = {'type': 'summary', 'keys': 0, 'errors': 0, 'vulnerable': 0, 'sharedPrimes': 0}
+    # Modules en attente de vérification contre le corpus -> indices des clés
+    pending = {}
+
+    for index, (line, key_format, payload) in enumerate(iter_key_sources(lines)):
+        record = {'type': 'key', 'index': index, 'line': line, 'format': key_format}
+        try:
+            key_data = _parse_source(key_format, payload)
+            vulnerabilities = analyze_security(key_data, options)
+        except Exception as e:
+            record.update({'success': False, 'error': str(e)})
+            summary['errors'] += 1
+            yield record
+            continue
+
+        record.update(key_data)
+        record.update({'success': True, 'vulnerabilities': vulnerabilities})
+        summary['keys'] += 1
+        if vulnerabilities:
+            summary['vulnerable'] += 1
+        yield record
+
+        if check_shared:
+            pending.setdefault(int(key_data['modulus']), []).append(index)
+            if len(pending) >= IMPORT_CHUNK:
+                for shared in _shared_prime_records(pending, source):
+                    summary['sharedPrimes'] += 1
+                    yield shared
+                pending = {}
+
+    if pending:
+        for shared in _shared_prime_records(pending, source):
+            summary['sharedPrimes'] += 1
+            yield shared
+
+    summary['execution_time'] = time.time() - start_time
+    yield summary
@@ -4,10 +4,21 @@ Module d'analyse et d'extraction des paramètres des clés RSA
 
 import time
 import base64
+import binascii
 import re
-from cryptography.hazmat.primitives.asymmetric import rsa
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.backends import default_backend
+from crypto_utils import arithmetic, metrics
+from crypto_utils.batch_gcd import METHOD_NAME as SHARED_PRIME_METHOD, check_modulus
+from crypto_utils.factorisation_bdd import store_factorization
+from crypto_utils.factorizer import integer_root
+from crypto_utils.rsa_attacks import (FERMAT_TIME_LIMIT, LOW_EXPONENT_TIME_LIMIT, MAX_ATTACK_TIME_LIMIT,
+                                      WIENER_TIME_LIMIT, fermat_factor, hastad_broadcast,
+                                      low_exponent_attack, wiener_attack)
+
+# Plus grand exposant public signalé comme exposé à l'attaque de Håstad
+HASTAD_MAX_EXPONENT = 17
+
+# Nombre maximal de chiffrés soumis avec une clé (options ciphertexts et broadcast)
+MAX_CIPHERTEXTS = 32
 
 def analyze_rsa_key(key_type, key_content, options=None):
     """
@@ -16,12 +27,15 @@ def analyze_rsa_key(key_type, key_content, options=None):
     Args:
         key_type (str): Type de format ('PEM', 'DER', 'modulus-exponent')
         key_content (str): Contenu de la clé
-        options (dict): Options d'analyse supplémentaires
+        options (dict): Options d'analyse supplémentaires (voir analyze_security ;
+            checkSharedPrimes, checkCommonFactors : recherche d'un facteur
+            partagé avec le corpus)
 
     Returns:
         dict: Résultats de l'analyse avec paramètres extraits
     """
     start_time = time.time()
+    options = options or {}
 
     try:
         result = {
@@ -44,7 +58,17 @@ def analyze_rsa_key(key_type, key_content, options=None):
         result.update(key_params)
 
         # Analyse de sécurité de la clé
-        vulnerabilities = analyze_security(result)
+        vulnerabilities = analyze_security(result, options)
+
+        # Facteur premier partagé avec une clé du corpus (le module y est ensuite ajouté)
+        if options.get('checkSharedPrimes', True) or options.get('checkCommonFactors', True):
+            result['methodsUsed'].append(SHARED_PRIME_METHOD)
+            with metrics.timed('rsa/shared-prime') as run:
+                vulnerability = check_shared_primes(result)
+                run['outcome'] = 'vulnerable' if vulnerability else 'ok'
+            if vulnerability:
+                vulnerabilities.append(vulnerability)
+
         if vulnerabilities:
             result['vulnerabilities'] = vulnerabilities
 
@@ -58,29 +82,49 @@ def analyze_rsa_key(key_type, key_content, options=None):
             'execution_time': time.time() - start_time
         }
 
-def extract_from_pem(key_content):
-    """Extrait les paramètres d'une clé au format PEM"""
-    try:
-        # Tentative de chargement comme clé publique
-        key = serialization.load_pem_public_key(
-            key_content.encode(),
-            backend=default_backend()
-        )
-        is_private = False
-    except:
-        try:
-            # Tentative de chargement comme clé privée
-            key = serialization.load_pem_private_key(
-                key_content.encode(),
-                password=None,
-                backend=default_backend()
-            )
-            is_private = True
-        except:
-            raise ValueError("Format PEM invalide ou non reconnu")
+# Blocs PEM : BEGIN et END de même type, contenu base64 entre les deux
+PEM_BLOCK = re.compile(r'-----BEGIN ([A-Z0-9 ]+)-----(.*?)-----END \1-----', re.S)
+
+# cryptography n'est importé qu'au premier chargement d'une clé : son import
+# coûte plus que celui de tous les autres modules de l'outil réunis
+def _load_public_key(der):
+    from cryptography.hazmat.primitives import serialization
+    return serialization.load_der_public_key(der)
+
+def _load_private_key(der):
+    from cryptography.hazmat.primitives import serialization
+    return serialization.load_der_private_key(der, password=None)
+
+def _load_certificate(der):
+    from cryptography import x509
+    return x509.load_der_x509_certificate(der).public_key()
+
+# Chargeur à utiliser selon le type annoncé par l'en-tête PEM : (chargeur DER, clé privée)
+PEM_LOADERS = {
+    'PUBLIC KEY': (_load_public_key, False),
+    'RSA PUBLIC KEY': (_load_public_key, False),
+    'PRIVATE KEY': (_load_private_key, True),
+    'RSA PRIVATE KEY': (_load_private_key, True),
+    'CERTIFICATE': (_load_certificate, False)
+}
 
-    # Extraction des paramètres communs
-    public_numbers = key.public_numbers()
+def key_parameters(key, is_private):
+    """
+    Paramètres d'une clé RSA chargée par cryptography.
+
+    Args:
+        key: Clé publique ou privée
+        is_private (bool): La clé est une clé privée
+
+    Returns:
+        dict: Module, exposants, taille et, pour une clé privée, facteurs
+    """
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    if not isinstance(key, (rsa.RSAPublicKey, rsa.RSAPrivateKey)):
+        raise ValueError("La clé n'est pas une clé RSA")
+
+    public_numbers = key.private_numbers().public_numbers if is_private else key.public_numbers()
     result = {
         'modulus': str(public_numbers.n),
         'publicExponent': public_numbers.e,
@@ -100,6 +144,40 @@ def extract_from_pem(key_content):
 
     return result
 
+def pem_body_to_der(body):
+    """Décode le contenu base64 d'un bloc PEM (les blocs chiffrés, à en-têtes, sont refusés)"""
+    if ':' in body:
+        raise ValueError("Les blocs PEM chiffrés ne sont pas pris en charge")
+    try:
+        return base64.b64decode(''.join(body.split()), validate=True)
+    except (binascii.Error, ValueError):
+        raise ValueError("Contenu base64 du bloc PEM invalide")
+
+def load_pem_block(label, der):
+    """
+    Charge un bloc PEM avec le chargeur correspondant à son en-tête, sans
+    essayer successivement les formats.
+
+    Args:
+        label (str): Type du bloc (PUBLIC KEY, RSA PRIVATE KEY, CERTIFICATE...)
+        der (bytes): Contenu décodé du bloc
+
+    Returns:
+        dict: Paramètres de la clé (voir key_parameters)
+    """
+    if label not in PEM_LOADERS:
+        raise ValueError(f"Type de bloc PEM non pris en charge: {label}")
+    loader, is_private = PEM_LOADERS[label]
+    with metrics.timed('rsa/pem-parse'):
+        return key_parameters(loader(der), is_private)
+
+def extract_from_pem(key_content):
+    """Extrait les paramètres d'une clé au format PEM (premier bloc : clé ou certificat)"""
+    match = PEM_BLOCK.search(key_content)
+    if match is None:
+        raise ValueError("Format PEM invalide ou non reconnu")
+    return load_pem_block(match.group(1), pem_body_to_der(match.group(2)))
+
 def extract_from_der(key_content):
     """Extrait les paramètres d'une clé au format DER"""
     try:
@@ -111,39 +189,10 @@ def extract_from_der(key_content):
 
         try:
             # Tentative de chargement comme clé publique
-            key = serialization.load_der_public_key(
-                binary_data,
-                backend=default_backend()
-            )
-            is_private = False
-        except:
+            return key_parameters(_load_public_key(binary_data), False)
+        except ValueError:
             # Tentative de chargement comme clé privée
-            key = serialization.load_der_private_key(
-                binary_data,
-                password=None,
-                backend=default_backend()
-            )
-            is_private = True
-
-        # Suite similaire à extract_from_pem
-        public_numbers = key.public_numbers()
-        result = {
-            'modulus': str(public_numbers.n),
-            'publicExponent': public_numbers.e,
-            'keySize': key.key_size,
-            'isPrivate': is_private
-        }
-
-        if is_private:
-            private_numbers = key.private_numbers()
-            result.update({
-                'privateExponent': str(private_numbers.d),
-                'prime1': str(private_numbers.p),
-                'prime2': str(private_numbers.q),
-                'factorsFound': True
-            })
-
-        return result
+            return key_parameters(_load_private_key(binary_data), True)
 
     except Exception as e:
         raise ValueError(f"Erreur lors de l'analyse du format DER: {str(e)}")
@@ -204,8 +253,215 @@ def auto_detect_and_extract(key_content):
             except:
                 raise ValueError("Format de clé non reconnu")
 
-def analyze_security(key_data):
-    """Analyse la sécurité de la clé RSA"""
+def check_shared_primes(key_data):
+    """
+    Cherche un facteur premier partagé entre la clé et le corpus des modules
+    déjà analysés ou importés ; complète key_data avec p, q et d en cas de succès.
+
+    Returns:
+        dict: La vulnérabilité détectée, ou None
+    """
+    n = int(key_data['modulus'])
+    finding = check_modulus(n, source='analyse')
+    if finding is None:
+        return None
+
+    _record_factors(key_data, finding['p'], finding['q'], SHARED_PRIME_METHOD)
+    key_data['sharedWith'] = [str(m) for m in finding['sharedWith']]
+
+    return {
+        'name': 'Nombre premier partagé',
+        'description': f"Le modulus partage un facteur premier avec {len(finding['sharedWith'])} autre(s) clé(s) "
+                       "du corpus : toutes sont factorisées par un simple PGCD.",
+        'severity': 'Critique'
+    }
+
+def _record_factors(key_data, p, q, method, d=None):
+    """Complète key_data avec les facteurs retrouvés et l'exposant privé (sauf clé privée)"""
+    if key_data.get('factorsFound'):
+        return
+    if d is None:
+        try:
+            d = arithmetic.invert(key_data['publicExponent'], (p - 1) * (q - 1))
+        except ValueError:
+            d = None
+    key_data.update({
+        'p': str(min(p, q)),
+        'q': str(max(p, q)),
+        'factorsFound': True,
+        'factorizationMethod': method
+    })
+    if d is not None:
+        key_data['privateExponent'] = str(d)
+    if method != SHARED_PRIME_METHOD:
+        store_factorization(p * q, [p, q], method)
+
+def _time_limit(options, name, default):
+    """Budget de temps d'une attaque (option facultative, bornée)"""
+    try:
+        return max(0.0, min(float(options.get(name, default)), MAX_ATTACK_TIME_LIMIT))
+    except (TypeError, ValueError):
+        return default
+
+def check_small_exponents(key_data, options):
+    """
+    Exposant public faible (e = 1, e pair, diffusion de Håstad) et exposant
+    privé trop petit (attaque de Wiener, bornée par wienerTimeLimit).
+
+    Returns:
+        list: Les vulnérabilités détectées
+    """
+    vulnerabilities = []
+    n = int(key_data['modulus'])
+    e = key_data.get('publicExponent', 0)
+
+    if e == 1:
+        vulnerabilities.append({
+            'name': 'Exposant public égal à 1',
+            'description': 'Le chiffré est égal au message clair.',
+            'severity': 'Critique'
+        })
+    elif e % 2 == 0:
+        vulnerabilities.append({
+            'name': 'Exposant public pair',
+            'description': 'Un exposant pair n\'est pas inversible modulo φ(n) : la clé est invalide.',
+            'severity': 'Élevée'
+        })
+    elif e <= HASTAD_MAX_EXPONENT:
+        vulnerabilities.append({
+            'name': 'Diffusion de Håstad',
+            'description': f"Un même message chiffré sans bourrage pour {e} destinataires est retrouvé par "
+                           f"les restes chinois, et tout message de moins de {(n.bit_length() - 1) // e} bits "
+                           "par simple racine e-ième du chiffré.",
+            'severity': 'Élevée'
+        })
+
+    key_data.setdefault('methodsUsed', []).append('Wiener')
+    if key_data.get('privateExponent'):
+        # Exposant privé connu : la borne de Wiener se vérifie directement
+        vulnerable = 3 * int(key_data['privateExponent']) < integer_root(n, 4)
+    else:
+        recovered = wiener_attack(n, e, _time_limit(options, 'wienerTimeLimit', WIENER_TIME_LIMIT))
+        vulnerable = recovered is not None
+        if vulnerable:
+            p, q, d = recovered
+            _record_factors(key_data, p, q, 'Wiener (fraction continue)', d)
+    if vulnerable:
+        vulnerabilities.append({
+            'name': 'Exposant privé trop petit',
+            'description': 'd < n^(1/4) / 3 : l\'exposant privé se déduit du développement en fraction continue '
+                           'de e/n (attaque de Wiener).',
+            'severity': 'Critique'
+        })
+
+    return vulnerabilities
+
+def check_close_primes(key_data, options):
+    """
+    Facteurs trop proches : factorisation de Fermat bornée par fermatTimeLimit.
+
+    Returns:
+        dict: La vulnérabilité détectée, ou None
+    """
+    n = int(key_data['modulus'])
+    if n % 2 == 0:
+        return None
+    key_data.setdefault('methodsUsed', []).append('Fermat')
+    known = [key_data.get(name) for name in (('prime1', 'prime2') if key_data.get('prime1') else ('p', 'q'))]
+    if all(known):
+        # Facteurs connus : |p - q| comparé directement à la portée de Fermat (~ n^(1/4))
+        p, q = int(known[0]), int(known[1])
+        if abs(p - q) > 2 * integer_root(n, 4):
+            return None
+    else:
+        factors = fermat_factor(n, _time_limit(options, 'fermatTimeLimit', FERMAT_TIME_LIMIT))
+        if factors is None:
+            return None
+        _record_factors(key_data, factors[0], factors[1], 'Fermat')
+
+    return {
+        'name': 'Facteurs trop proches',
+        'description': 'p et q sont proches de √n : la méthode de Fermat factorise le module.',
+        'severity': 'Critique'
+    }
+
+def _parse_integer(value):
+    """Entier décimal ou préfixé (0x...) d'une option"""
+    return int(str(value).strip(), 0)
+
+def check_ciphertexts(key_data, options):
+    """
+    Déchiffrement sans clé privée des chiffrés fournis, pour un exposant
+    public faible : racine e-ième de chaque chiffré de ciphertexts (budget
+    partagé lowExponentTimeLimit), et attaque de Håstad sur le même message
+    chiffré pour d'autres destinataires de même exposant (broadcast : liste
+    de {'ciphertext', 'modulus'}, complétée par le premier chiffré de
+    ciphertexts). Les messages retrouvés sont ajoutés à key_data['plaintexts'].
+
+    Returns:
+        list: Les vulnérabilités détectées
+    """
+    n = int(key_data['modulus'])
+    e = key_data.get('publicExponent', 0)
+    ciphertexts = [_parse_integer(c) for c in options.get('ciphertexts') or []]
+    broadcast = [(_parse_integer(entry['ciphertext']), _parse_integer(entry['modulus']))
+                 for entry in options.get('broadcast') or []]
+    if len(ciphertexts) > MAX_CIPHERTEXTS or len(broadcast) > MAX_CIPHERTEXTS:
+        raise ValueError(f"Au plus {MAX_CIPHERTEXTS} chiffrés par analyse")
+    if not 1 <= e <= HASTAD_MAX_EXPONENT:
+        return []
+
+    vulnerabilities = []
+    plaintexts = []
+    key_data.setdefault('methodsUsed', []).append('Racine e-ième')
+    deadline = time.time() + _time_limit(options, 'lowExponentTimeLimit', LOW_EXPONENT_TIME_LIMIT)
+    for index, c in enumerate(ciphertexts):
+        m = low_exponent_attack(c, e, n, max(0.0, deadline - time.time()))
+        if m is not None:
+            plaintexts.append({'ciphertext': index, 'plaintext': str(m), 'method': 'Racine e-ième'})
+    if plaintexts:
+        vulnerabilities.append({
+            'name': 'Message chiffré sans bourrage',
+            'description': f"{len(plaintexts)} chiffré(s) retrouvé(s) par simple racine e-ième : "
+                           "m^e dépasse à peine n.",
+            'severity': 'Critique'
+        })
+
+    if broadcast:
+        key_data['methodsUsed'].append('Håstad')
+        pairs = ([(ciphertexts[0], n)] if ciphertexts else []) + broadcast
+        # Modules non premiers entre eux ou couples trop peu nombreux : ValueError
+        m = hastad_broadcast([c for c, _ in pairs], [modulus for _, modulus in pairs], e)
+        if m is not None:
+            plaintexts.append({'ciphertext': 0 if ciphertexts else None, 'plaintext': str(m),
+                               'method': 'Håstad'})
+            vulnerabilities.append({
+                'name': 'Message diffusé retrouvé',
+                'description': f"Le même message, chiffré sans bourrage pour {e} destinataires, "
+                               "est retrouvé par les restes chinois (attaque de Håstad).",
+                'severity': 'Critique'
+            })
+
+    if plaintexts:
+        key_data['plaintexts'] = plaintexts
+    return vulnerabilities
+
+def analyze_security(key_data, options=None):
+    """
+    Analyse la sécurité de la clé RSA.
+    Les attaques retrouvant p, q et d complètent key_data.
+
+    Args:
+        key_data (dict): Paramètres extraits de la clé
+        options (dict): useFermat, checkSmallExponent, les chiffrés à déchiffrer
+            ciphertexts et broadcast (voir check_ciphertexts), et les budgets de
+            temps facultatifs fermatTimeLimit, wienerTimeLimit et lowExponentTimeLimit
+            (secondes)
+
+    Returns:
+        list: Les vulnérabilités détectées
+    """
+    options = options or {}
     vulnerabilities = []
 
     # Vérification de la taille de la clé
@@ -224,4 +480,23 @@ def analyze_security(key_data):
             'severity': 'Moyenne'
         })
 
-    return vulnerabilities
\ No newline at end of file
+    if options.get('checkSmallExponent', True):
+        with metrics.timed('rsa/small-exponent') as run:
+            found = check_small_exponents(key_data, options)
+            run['outcome'] = 'vulnerable' if found else 'ok'
+        vulnerabilities.extend(found)
+
+    if options.get('useFermat', True):
+        with metrics.timed('rsa/close-primes') as run:
+            vulnerability = check_close_primes(key_data, options)
+            run['outcome'] = 'vulnerable' if vulnerability else 'ok'
+        if vulnerability:
+            vulnerabilities.append(vulnerability)
+
+    if options.get('ciphertexts') or options.get('broadcast'):
+        with metrics.timed('rsa/ciphertexts') as run:
+            found = check_ciphertexts(key_data, options)
+            run['outcome'] = 'vulnerable' if found else 'ok'
+        vulnerabilities.extend(found)
+
+    return vulnerabilities
@@ -0,0 +1,115 @@
+"""
+Module de stockage des sessions de crackage
+Conserve les paramètres et le dernier point de reprise de chaque session
+dans la base SQLite locale cracking_sessions.db, pour qu'une recherche
+interrompue reprenne là où elle s'était arrêtée.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+
+from crypto_utils.bdd import DATA_DIR, connect
+
+# Chemin de la base de données des sessions (voir bdd.DATA_DIR)
+DB_PATH = DATA_DIR / "cracking_sessions.db"
+
+_SELECT = "SELECT params, state, status, created, updated FROM sessions WHERE id = ?"
+_UPSERT = (
+    "INSERT INTO sessions (id, params, state, status, created, updated) VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(id) DO UPDATE SET params = excluded.params, state = excluded.state, "
+    "status = excluded.status, updated = excluded.updated"
+)
+
+_local = threading.local()
+_schema_lock = threading.Lock()
+_schema_ready = False
+_disabled = False
+
+# Sessions gardées en mémoire si la base est inaccessible
+_memory = {}
+
+def _connection():
+    """Connexion SQLite propre au thread courant (None si la base est inaccessible)"""
+    global _disabled, _schema_ready
+    if _disabled:
+        return None
+    connection = getattr(_local, 'connection', None)
+    if connection is not None:
+        return connection
+
+    try:
+        connection = connect(DB_PATH)
+        with _schema_lock:
+            if not _schema_ready:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS sessions ("
+                    "id TEXT PRIMARY KEY, params TEXT, state TEXT, status TEXT, created REAL, updated REAL)"
+                )
+                connection.commit()
+                _schema_ready = True
+    except sqlite3.Error:
+        # Système de fichiers en lecture seule : sessions en mémoire uniquement
+        _disabled = True
+        return None
+
+    _local.connection = connection
+    return connection
+
+def load_session(session_id):
+    """
+    Lit une session.
+
+    Returns:
+        dict: {'id', 'params', 'state', 'status', 'created', 'updated'}, ou
+        None si la session est inconnue
+    """
+    connection = _connection()
+    if connection is None:
+        session = _memory.get(session_id)
+        return json.loads(json.dumps(session)) if session else None
+    try:
+        row = connection.execute(_SELECT, (session_id,)).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        return None
+    params, state, status, created, updated = row
+    return {
+        'id': session_id,
+        'params': json.loads(params),
+        'state': json.loads(state),
+        'status': status,
+        'created': created,
+        'updated': updated
+    }
+
+def save_session(session_id, params, state, status):
+    """
+    Enregistre (ou met à jour) une session et son point de reprise.
+
+    Args:
+        session_id (str): Identifiant de la session
+        params (dict): Paramètres de la recherche
+        state (dict): Point de reprise et résultats partiels
+        status (str): État de la session
+    """
+    now = time.time()
+    connection = _connection()
+    if connection is None:
+        created = _memory.get(session_id, {}).get('created', now)
+        _memory[session_id] = {
+            'id': session_id,
+            'params': params,
+            'state': state,
+            'status': status,
+            'created': created,
+            'updated': now
+        }
+        return
+    try:
+        with connection:
+            connection.execute(_UPSERT, (session_id, json.dumps(params), json.dumps(state), status, now, now))
+    except sqlite3.Error:
+        pass
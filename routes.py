@@ -1,9 +1,72 @@
-from flask import render_template, request, jsonify
-from crypto_utils.factorizer import factorize_number
-from crypto_utils.hash_cracker import crack_hash
-from crypto_utils.rsa_utils import analyze_rsa_key
+import io
+import json
+import os
+import time
+import uuid
+
+from flask import Response, g, render_template, request, jsonify, stream_with_context
+from crypto_utils import metrics
+
+# Les moteurs (factorisation, crackage, RSA, tâches) sont importés dans les routes
+# qui s'en servent : l'import de l'application et les pages restent légers au
+# démarrage à froid, chaque moteur n'est chargé qu'à sa première requête
+
+# Intervalle de relève de l'état d'une tâche pour le flux d'événements (secondes)
+JOB_EVENTS_INTERVAL = 0.2
+
+# Les pages suivent les calculs par des tâches asynchrones seulement si le serveur
+# les conserve d'une requête à l'autre : la table des tâches est en mémoire, ce
+# que ne garantit pas un déploiement serverless (Vercel), où les pages
+# appellent les API synchrones. CRYPTOTOOLS_JOBS=1 ou 0 impose le choix.
+JOBS_ENABLED = os.environ.get('CRYPTOTOOLS_JOBS', '0' if os.environ.get('VERCEL') else '1') == '1'
+
+# Options booléennes de l'analyse RSA en masse (paramètres d'URL, actives par défaut)
+BULK_RSA_FLAGS = ('checkCommonFactors', 'useFermat', 'checkSmallExponent', 'checkSharedPrimes')
+BULK_RSA_TIME_LIMITS = ('fermatTimeLimit', 'wienerTimeLimit')
+
+# Type de contenu du format texte d'exposition de Prometheus
+METRICS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+def _search_bounds(data):
+    """Longueur maximale et nombre de candidats à sauter d'une recherche (ValueError si invalides)"""
+    try:
+        return int(data.get('maxLength', 6)), int(data.get('skip', 0))
+    except (TypeError, ValueError):
+        raise ValueError("maxLength et skip doivent être des entiers")
 
 def register_routes(app):
+    # Mesure de chaque requête ; si CRYPTOTOOLS_PROFILING=1, ?profile=1 remplace la
+    # réponse par le profil cProfile de son traitement (thread de la requête seulement : les processus
+    # de calcul et la génération des réponses en flux n'y figurent pas)
+    @app.before_request
+    def start_request():
+        g.request_start = time.perf_counter()
+        g.profiler = metrics.start_profile() if request.args.get('profile') == '1' else None
+
+    @app.after_request
+    def finish_request(response):
+        rule = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        metrics.record_request(rule, request.method, response.status_code,
+                               time.perf_counter() - g.request_start)
+        if g.get('profiler') is not None:
+            report = metrics.profile_report(g.pop('profiler'))
+            return Response(report, mimetype='text/plain')
+        return response
+
+    @app.teardown_request
+    def stop_profile(error):
+        # Exception non rattrapée : le profileur ne doit pas rester actif sur le thread
+        if g.get('profiler') is not None:
+            g.pop('profiler').disable()
+
+    @app.context_processor
+    def page_capabilities():
+        return {'jobs_enabled': JOBS_ENABLED}
+
+    @app.route('/metrics')
+    def metrics_endpoint():
+        return Response(metrics.render_metrics(), content_type=METRICS_CONTENT_TYPE)
+
     # Page d'accueil
     @app.route('/')
     def index():
@@ -25,6 +88,7 @@ def register_routes(app):
     # API pour le factorizer
     @app.route('/api/factorize', methods=['POST'])
     def api_factorize():
+        from crypto_utils.factorizer import factorize_number
         data = request.get_json()
         number = data.get('number')
         method = data.get('method')
@@ -34,19 +98,181 @@ def register_routes(app):
     # API pour le hash cracker
     @app.route('/api/crack-hash', methods=['POST'])
     def api_crack_hash():
+        from crypto_utils.hash_cracker import crack_hash
         data = request.get_json()
+        try:
+            max_length, skip = _search_bounds(data)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
         hash_value = data.get('hash')
         hash_type = data.get('type')
         wordlist = data.get('dictionary')
-        result = crack_hash(hash_value, hash_type, wordlist)
+        result = crack_hash(
+            hash_value,
+            hash_type,
+            wordlist,
+            data.get('mode', 'bruteforce'),
+            data.get('charset', 'alphanumeric'),
+            max_length,
+            data.get('rules'),
+            data.get('mask'),
+            data.get('customCharsets'),
+            skip
+        )
+        return jsonify(result)
+
+    @app.route('/api/crack-hashes', methods=['POST'])
+    def api_crack_hashes():
+        from crypto_utils.hash_cracker import crack_hashes
+        data = request.get_json()
+        try:
+            max_length, skip = _search_bounds(data)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        result = crack_hashes(
+            data.get('hashes'),
+            data.get('type'),
+            data.get('dictionary'),
+            data.get('mode', 'bruteforce'),
+            data.get('charset', 'alphanumeric'),
+            max_length,
+            rules=data.get('rules'),
+            mask=data.get('mask'),
+            custom_charsets=data.get('customCharsets'),
+            skip=skip
+        )
         return jsonify(result)
     
     # API pour l'analyse RSA
     @app.route('/api/analyze-rsa', methods=['POST'])
     def api_analyze_rsa():
+        from crypto_utils.rsa_utils import analyze_rsa_key
         data = request.get_json()
         key_type = data.get('keyType')
         key_content = data.get('keyContent')
         options = data.get('options', {})
         result = analyze_rsa_key(key_type, key_content, options)
         return jsonify(result)
+
+    @app.route('/api/analyze-rsa/bulk', methods=['POST'])
+    def api_analyze_rsa_bulk():
+        from crypto_utils.rsa_bulk import analyze_rsa_stream
+        # Corps brut (PEM, certificats, NDJSON) lu en flux ; options dans l'URL
+        options = {name: request.args.get(name, 'true').lower() not in ('0', 'false', 'no')
+                   for name in BULK_RSA_FLAGS}
+        options.update({name: request.args[name] for name in BULK_RSA_TIME_LIMITS if name in request.args})
+        lines = io.TextIOWrapper(request.stream, encoding='utf-8', errors='replace')
+
+        def results():
+            for record in analyze_rsa_stream(lines, options, request.args.get('source', 'import')):
+                yield json.dumps(record) + '\n'
+
+        return Response(stream_with_context(results()), mimetype='application/x-ndjson',
+                        headers={'X-Accel-Buffering': 'no'})
+
+    # API du corpus de modules RSA (recherche de nombres premiers partagés)
+    @app.route('/api/rsa-corpus', methods=['GET'])
+    def api_corpus_status():
+        from crypto_utils.corpus_bdd import corpus_size
+        return jsonify({'success': True, 'size': corpus_size()})
+
+    @app.route('/api/rsa-corpus', methods=['POST'])
+    def api_import_moduli():
+        from crypto_utils.jobs import submit_job
+        data = request.get_json(silent=True) or {}
+        params = {'moduli': data.get('moduli', []), 'source': data.get('source')}
+        try:
+            job_id = submit_job('import-moduli', params, data.get('cpuTimeLimit'))
+        except (TypeError, ValueError) as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        return jsonify({'success': True, 'job_id': job_id}), 202
+
+    # API des tâches asynchrones
+    @app.route('/api/jobs', methods=['POST'])
+    def api_submit_job():
+        from crypto_utils.jobs import submit_job
+        data = request.get_json()
+        try:
+            job_id = submit_job(data.get('type'), data.get('params', {}), data.get('cpuTimeLimit'))
+        except (TypeError, ValueError) as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        return jsonify({'success': True, 'job_id': job_id}), 202
+
+    @app.route('/api/jobs/<job_id>', methods=['GET'])
+    def api_job_status(job_id):
+        from crypto_utils.jobs import get_job
+        job = get_job(job_id)
+        if job is None:
+            return jsonify({'success': False, 'error': 'Tâche inconnue'}), 404
+        job['success'] = True
+        return jsonify(job)
+
+    @app.route('/api/jobs/<job_id>/events', methods=['GET'])
+    def api_job_events(job_id):
+        from crypto_utils.jobs import FINISHED_STATES, get_job
+        if get_job(job_id) is None:
+            return jsonify({'success': False, 'error': 'Tâche inconnue'}), 404
+
+        def events():
+            # Server-Sent Events : un message à chaque changement d'état ou d'avancement
+            previous = None
+            while True:
+                job = get_job(job_id)
+                if job is None:
+                    break
+                state = (job['status'], job['progress'], job['error'])
+                if state != previous:
+                    previous = state
+                    yield f"data: {json.dumps(job)}\n\n"
+                if job['status'] in FINISHED_STATES:
+                    break
+                time.sleep(JOB_EVENTS_INTERVAL)
+            yield f"event: end\ndata: {json.dumps({'job_id': job_id})}\n\n"
+
+        return Response(stream_with_context(events()), mimetype='text/event-stream',
+                        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+    @app.route('/api/jobs/<job_id>/result', methods=['GET'])
+    def api_job_result(job_id):
+        from crypto_utils.jobs import get_job_result
+        status, result = get_job_result(job_id)
+        if status is None:
+            return jsonify({'success': False, 'error': 'Tâche inconnue'}), 404
+        if result is None:
+            return jsonify({'success': False, 'status': status, 'error': 'Résultat non disponible'}), 409
+        return jsonify(result)
+
+    @app.route('/api/jobs/<job_id>', methods=['DELETE'])
+    def api_cancel_job(job_id):
+        from crypto_utils.jobs import cancel_job
+        if not cancel_job(job_id):
+            return jsonify({'success': False, 'error': 'Tâche inconnue ou déjà terminée'}), 409
+        return jsonify({'success': True, 'job_id': job_id, 'status': 'cancelled'})
+
+    # API des sessions de crackage reprenables (exécutées comme tâches asynchrones)
+    @app.route('/api/crack-sessions', methods=['POST'])
+    def api_start_session():
+        from crypto_utils.jobs import submit_job
+        data = request.get_json()
+        params = dict(data, sessionId=uuid.uuid4().hex)
+        params.pop('cpuTimeLimit', None)
+        job_id = submit_job('crack-session', params, data.get('cpuTimeLimit'))
+        return jsonify({'success': True, 'session_id': params['sessionId'], 'job_id': job_id}), 202
+
+    @app.route('/api/crack-sessions/<session_id>', methods=['GET'])
+    def api_session_status(session_id):
+        from crypto_utils.hash_cracker import get_session
+        session = get_session(session_id)
+        if session is None:
+            return jsonify({'success': False, 'error': 'Session inconnue'}), 404
+        return jsonify(session)
+
+    @app.route('/api/crack-sessions/<session_id>/resume', methods=['POST'])
+    def api_resume_session(session_id):
+        from crypto_utils.hash_cracker import get_session
+        from crypto_utils.jobs import submit_job
+        if get_session(session_id) is None:
+            return jsonify({'success': False, 'error': 'Session inconnue'}), 404
+        data = request.get_json(silent=True) or {}
+        job_id = submit_job('resume-session', {'sessionId': session_id}, data.get('cpuTimeLimit'))
+        return jsonify({'success': True, 'session_id': session_id, 'job_id': job_id}), 202
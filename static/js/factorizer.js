@@ -9,6 +9,7 @@ document.addEventListener('DOMContentLoaded', function() {
     const methodInputs = document.querySelectorAll('input[name="method"]');
     const resultBox = document.getElementById('result-box');
     const loadingIndicator = document.getElementById('loading-indicator');
+    const jobProgress = document.getElementById('job-progress');
 
     // Événement pour le bouton de factorisation
     factorizeBtn.addEventListener('click', function() {
@@ -42,21 +43,12 @@ document.addEventListener('DOMContentLoaded', function() {
         const startTime = Date.now();
 
         // Appel à l'API pour factoriser
-        fetch('/api/factorize', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify({
-                number: numberToFactorize,
-                method: selectedMethod
-            }),
-        })
-        .then(response => {
-            if (!response.ok) {
-                throw new Error('Erreur lors de la factorisation. Vérifiez votre entrée.');
-            }
-            return response.json();
+        jobProgress.textContent = '';
+        runTool('factorize', {
+            number: numberToFactorize,
+            method: selectedMethod
+        }, '/api/factorize', job => {
+            jobProgress.textContent = formatProgress(job.progress);
         })
         .then(data => {
             // Masquer l'indicateur de chargement
@@ -8,11 +8,16 @@ document.addEventListener('DOMContentLoaded', function() {
     const hashType = document.getElementById('hash-type');
     const attackModes = document.querySelectorAll('input[name="attack-mode"]');
     const dictionarySelect = document.getElementById('dictionary-select');
+    const rulesSelect = document.getElementById('rules-select');
     const charsetSelect = document.getElementById('charset-select');
     const lengthMax = document.getElementById('length-max');
+    const maskInput = document.getElementById('mask-input');
+    const customCharsetInput = document.getElementById('custom-charset-input');
+    const maskSkip = document.getElementById('mask-skip');
     const crackBtn = document.getElementById('crack-btn');
     const resultBox = document.getElementById('result-box');
     const loadingIndicator = document.getElementById('loading-indicator');
+    const jobProgress = document.getElementById('job-progress');
 
     // Événement pour le bouton de crackage
     crackBtn.addEventListener('click', function() {
@@ -42,6 +47,9 @@ document.addEventListener('DOMContentLoaded', function() {
         // Ajouter les paramètres spécifiques au mode
         if (attackMode === 'dictionary') {
             requestData.dictionary = dictionarySelect.value;
+            if (rulesSelect.value) {
+                requestData.rules = rulesSelect.value;
+            }
         } else if (attackMode === 'bruteforce') {
             requestData.charset = charsetSelect.value;
             requestData.maxLength = parseInt(lengthMax.value, 10);
@@ -51,6 +59,16 @@ document.addEventListener('DOMContentLoaded', function() {
                 showError('La longueur maximale est limitée à 10 caractères pour des raisons de performance.');
                 return;
             }
+        } else if (attackMode === 'mask') {
+            requestData.mask = maskInput.value.trim();
+            if (!requestData.mask) {
+                showError('Veuillez entrer un masque.');
+                return;
+            }
+            if (customCharsetInput.value.trim()) {
+                requestData.customCharsets = { '1': customCharsetInput.value.trim() };
+            }
+            requestData.skip = parseInt(maskSkip.value, 10) || 0;
         }
 
         // Afficher l'indicateur de chargement
@@ -61,18 +79,9 @@ document.addEventListener('DOMContentLoaded', function() {
         const startTime = Date.now();
 
         // Appel à l'API pour cracker le hash
-        fetch('/api/crack-hash', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify(requestData),
-        })
-        .then(response => {
-            if (!response.ok) {
-                throw new Error('Erreur lors du crackage du hash. Vérifiez votre entrée.');
-            }
-            return response.json();
+        jobProgress.textContent = '';
+        runTool('crack-hash', requestData, '/api/crack-hash', job => {
+            jobProgress.textContent = formatProgress(job.progress);
         })
         .then(data => {
             // Masquer l'indicateur de chargement
@@ -119,8 +128,15 @@ document.addEventListener('DOMContentLoaded', function() {
                     <p>Hash: <code>${data.hash}</code></p>
                     <p>Texte original: <code style="background-color: #f0f8ff; padding: 2px 5px;">${data.original}</code></p>
                     <p>Algorithme: ${data.type.toUpperCase()}</p>
-                    <p>Mode utilisé: ${data.mode === 'dictionary' ? 'Dictionnaire' : 'Force brute'}</p>
+                    <p>Mode utilisé: ${{dictionary: 'Dictionnaire', bruteforce: 'Force brute', mask: 'Masque'}[data.mode]}</p>
+                    ${data.rule ? `<p>Règle appliquée: <code>${data.rule}</code></p>` : ''}
                 </div>`;
+        } else if (data.next_index !== undefined) {
+            // Masque parcouru en partie : proposer la reprise
+            maskSkip.value = data.next_index;
+            resultBox.innerHTML = `
+                <p>Aucune correspondance parmi les candidats ${data.skip} à ${data.next_index - 1} (sur ${data.keyspace}).</p>
+                <p>Relancez pour reprendre à l'indice ${data.next_index}.</p>`;
         } else {
             resultBox.innerHTML = `
                 <p>Aucune correspondance trouvée pour ce hash.</p>
@@ -60,7 +60,8 @@ document.addEventListener('DOMContentLoaded', function() {
     // Configuration pour la page hash-cracker
     setupToggleOptions('attack-mode', {
         'dictionary': 'dictionary-options',
-        'bruteforce': 'bruteforce-options'
+        'bruteforce': 'bruteforce-options',
+        'mask': 'mask-options'
     });
 
     // Fonction pour formater les grands nombres
@@ -111,6 +112,112 @@ document.addEventListener('DOMContentLoaded', function() {
         return executionTime;
     };
 
+    // Erreur signalant que le suivi des tâches n'est pas disponible sur ce serveur
+    function jobUnavailable(message) {
+        const error = new Error(message);
+        error.jobUnavailable = true;
+        return error;
+    }
+
+    // Exécute une tâche asynchrone et suit son avancement par Server-Sent Events
+    window.runJob = function(type, params, onProgress) {
+        return fetch('/api/jobs', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ type: type, params: params }),
+        })
+        .then(response => {
+            if (response.status === 404 || response.status >= 500) {
+                throw jobUnavailable('Tâches asynchrones indisponibles.');
+            }
+            return response.json();
+        })
+        .then(data => {
+            if (!data.success) {
+                throw new Error(data.error || 'La tâche n\'a pas pu être créée.');
+            }
+            return new Promise((resolve, reject) => {
+                const events = new EventSource(`/api/jobs/${data.job_id}/events`);
+                let lastError = null;
+                events.onmessage = function(event) {
+                    const job = JSON.parse(event.data);
+                    lastError = job.error;
+                    if (onProgress) {
+                        onProgress(job);
+                    }
+                };
+                events.addEventListener('end', function() {
+                    events.close();
+                    fetch(`/api/jobs/${data.job_id}/result`)
+                        .then(response => {
+                            if (response.status === 404) {
+                                throw jobUnavailable('Tâche inconnue.');
+                            }
+                            return response.json();
+                        })
+                        .then(result => resolve(result.status ? { success: false, error: lastError || result.error } : result))
+                        .catch(reject);
+                });
+                events.onerror = function() {
+                    // Suivi impossible (tâche inconnue de cette instance, connexion coupée) :
+                    // la tâche est abandonnée
+                    events.close();
+                    fetch(`/api/jobs/${data.job_id}`, { method: 'DELETE' }).catch(() => {});
+                    reject(jobUnavailable('Connexion au suivi de la tâche perdue.'));
+                };
+            });
+        });
+    };
+
+    // Exécute un outil : par une tâche suivie si le serveur les prend en charge
+    // (attribut data-jobs de la page), sinon, ou si le suivi échoue, par l'appel
+    // synchrone de l'API (url) avec les mêmes paramètres
+    window.runTool = function(type, params, url, onProgress) {
+        const synchronous = () => fetch(url, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify(params),
+        })
+        .then(response => {
+            if (!response.ok) {
+                throw new Error('La requête a échoué (HTTP ' + response.status + ').');
+            }
+            return response.json();
+        });
+
+        if (document.body.dataset.jobs !== '1') {
+            return synchronous();
+        }
+        return runJob(type, params, onProgress).catch(error => {
+            if (error.jobUnavailable) {
+                return synchronous();
+            }
+            throw error;
+        });
+    };
+
+    // Fonction pour décrire l'avancement publié par une tâche
+    window.formatProgress = function(progress) {
+        if (!progress || !progress.engine) {
+            return '';
+        }
+        const parts = [progress.engine];
+        if (progress.length !== undefined) parts.push(`longueur ${progress.length}`);
+        if (progress.digits !== undefined) parts.push(`${progress.digits} chiffres`);
+        if (progress.attempts !== undefined) parts.push(`${progress.attempts.toLocaleString('fr-FR')} tentatives`);
+        if (progress.iterations !== undefined) parts.push(`${progress.iterations.toLocaleString('fr-FR')} itérations`);
+        if (progress.relations !== undefined) parts.push(`${progress.relations}/${progress.needed} relations`);
+        if (progress.curves !== undefined) parts.push(`${progress.curves} courbes (B1 = ${progress.B1})`);
+        if (progress.rate) parts.push(`${Math.round(progress.rate).toLocaleString('fr-FR')}/s`);
+        if (progress.percent !== undefined && progress.percent !== null) parts.push(`${progress.percent.toFixed(1)} %`);
+        if (progress.eta !== undefined && progress.eta !== null) parts.push(`reste ~${Math.ceil(progress.eta)} s`);
+        return parts.join(' · ');
+    };
+
     // Gestionnaire d'erreurs global
     window.addEventListener('error', function(event) {
         console.error('Erreur capturée:', event.error);
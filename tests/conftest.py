@@ -0,0 +1,33 @@
+"""
+Configuration commune des tests
+Les bases SQLite sont écrites dans un répertoire temporaire (avant tout
+import de crypto_utils) et FactorDB n'est jamais interrogé.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+os.environ['CRYPTOTOOLS_DATA_DIR'] = tempfile.mkdtemp(prefix='cryptotools-tests-')
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crypto_utils import factorizer
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(os.environ['CRYPTOTOOLS_DATA_DIR'], ignore_errors=True)
+
+@pytest.fixture(autouse=True)
+def offline(monkeypatch):
+    """Méthode automatique sans course contre FactorDB (pas d'accès réseau)"""
+    monkeypatch.setattr(factorizer, 'AUTO_FACTORDB_RACE', False)
+
+def next_prime(n):
+    """Plus petit nombre premier supérieur ou égal à n"""
+    n |= 1
+    while not factorizer.is_prime(n):
+        n += 2
+    return n
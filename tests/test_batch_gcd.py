@@ -0,0 +1,38 @@
+"""Tests du PGCD par lots : modules partageant un nombre premier"""
+
+from conftest import next_prime
+from crypto_utils import corpus_bdd
+from crypto_utils.batch_gcd import batch_gcd, check_moduli, check_modulus
+
+def primes(count, start=2 ** 127):
+    """count nombres premiers distincts de 128 bits"""
+    found = []
+    p = start
+    for _ in range(count):
+        p = next_prime(p + 1)
+        found.append(p)
+    return found
+
+def test_batch_gcd_finds_shared_prime():
+    p, q, r, s, t = primes(5)
+    assert batch_gcd([p * q, p * r, s * t]) == [p, p, 1]
+
+def test_batch_gcd_single_modulus():
+    p, q = primes(2)
+    assert batch_gcd([p * q]) == [1]
+
+def test_check_moduli_reports_both_moduli():
+    p, q, r, s, t = primes(5, 2 ** 127 + 10 ** 6)
+    findings = check_moduli([p * q, p * r, s * t], source='tests')
+    broken = {finding['modulus']: finding for finding in findings}
+    assert set(broken) == {p * q, p * r}
+    assert (broken[p * q]['p'], broken[p * q]['q']) == (min(p, q), max(p, q))
+    assert broken[p * r]['sharedWith'] == [p * q]
+
+def test_check_modulus_against_corpus():
+    p, q, r = primes(3, 2 ** 127 + 10 ** 7)
+    assert check_modulus(p * q, source='tests') is None
+    size = corpus_bdd.corpus_size()
+    finding = check_modulus(p * r, source='tests')
+    assert finding['sharedWith'] == [p * q]
+    assert corpus_bdd.corpus_size() == size + 1
@@ -0,0 +1,59 @@
+"""Tests de la factorisation : cas limites de chaque méthode locale"""
+
+import math
+
+import pytest
+
+from conftest import next_prime
+from crypto_utils.factorizer import QS_MAX_DIGITS, factorize_number
+
+LOCAL_METHODS = ('trial-division', 'pollard-rho', 'quadratic-sieve', 'ecm', 'auto')
+
+M61 = 2 ** 61 - 1
+
+# (nombre, facteurs attendus)
+VECTORS = [
+    (2, [2]),
+    (3 ** 20, [3] * 20),
+    (101 ** 5, [101] * 5),
+    (2 ** 64, [2] * 64),
+    (2 ** 10 * 999983, [2] * 10 + [999983]),
+    (M61, [M61]),
+    (10 ** 51, [2] * 51 + [5] * 51),
+    (999983 * 1000003, [999983, 1000003]),
+]
+
+@pytest.mark.parametrize('method', LOCAL_METHODS)
+@pytest.mark.parametrize('n, factors', VECTORS)
+def test_known_factorizations(n, factors, method):
+    result = factorize_number(str(n), method)
+    assert result['success'], result.get('error')
+    assert result['factors'] == factors
+    assert result['number'] == n
+
+@pytest.mark.parametrize('number', ['1', '0', '-15'])
+def test_rejects_numbers_below_two(number):
+    result = factorize_number(number, 'auto')
+    assert not result['success']
+    assert 'execution_time' in result
+
+def test_trial_division_returns_partial_result():
+    p, q = next_prime(10 ** 15), next_prime(10 ** 16)
+    result = factorize_number(6 * p * q, 'trial-division')
+    assert not result['success']
+    assert result['factors'] == [2, 3]
+    assert result['cofactor'] == p * q
+
+def test_quadratic_sieve_rejects_oversized_cofactor():
+    n = next_prime(10 ** 39) * next_prime(10 ** 40)
+    assert len(str(n)) > QS_MAX_DIGITS
+    result = factorize_number(n, 'quadratic-sieve')
+    assert not result['success']
+    assert result['cofactor'] == n
+
+def test_explicit_method_ignores_cached_result():
+    n = next_prime(10 ** 9) * next_prime(10 ** 10)
+    assert factorize_number(n, 'pollard-rho')['source'] == 'Pollard Rho'
+    assert factorize_number(n, 'ecm')['source'] == 'ECM'
+    cached = factorize_number(n, 'auto')
+    assert cached.get('cached') and math.prod(cached['factors']) == n
@@ -0,0 +1,60 @@
+"""Tests des formats de hash : empreintes crypt(3) et crackage des formats salés"""
+
+import warnings
+
+import pytest
+
+from crypto_utils.hash_cracker import crack_hash, hash_string
+from crypto_utils.hash_formats import md5_crypt, parse_hash, sha512_crypt
+
+# Vecteurs produits par crypt.crypt (glibc) : (mot de passe, empreinte complète)
+MD5_CRYPT_VECTORS = [
+    ('password', '$1$saltstri$qQY4WxjABChYG1ccLpfkz/'),
+    ('motdepasse', '$1$abc$wqLsLAMWsrgovzY6Za5U01'),
+    ('ab', '$1$xy$/LaZzSlapvkAtwkwAP2sA.'),
+]
+
+SHA512_CRYPT_VECTORS = [
+    ('Hello world!', '$6$saltstring$svn8UoSVapNtMuq1ukKS4tPQd8iKwSMHWjl/O817G3uBnIFNjnQJuesI68u4OTLiBFdcbYEdFCoEOfaS35inz1'),
+    ('Hello world!', '$6$rounds=10000$saltstringsaltst$OW1/O6BYHV6BcXZu8QVeXbDWra3Oeqh0sbHbbMCVNSnCM/UrjmM0Dp8vOuZeHBy/YTBmSK6H9qs/y3RnOaw5v.'),
+    ('', '$6$saltstring$kyGrqt6gmjAdtFLPrflEFifSYLCWWq1pyx95SvqinLDy2UHmj0sTF0MSLMwxPFZc3tu5kQckI8fks0zOPda3n1'),
+    ('42', '$6$rounds=1000$salt$ae9bIWinF0lYTjKl1vwkt6oxqtV1cjdIZNUJDRA82mLCSc2ZolBG56xBwYjotOyyvtgo4eN4oNaultn/nHPiZ/'),
+]
+
+@pytest.mark.parametrize('password, expected', MD5_CRYPT_VECTORS)
+def test_md5_crypt_vectors(password, expected):
+    _, (_, salt, digest) = parse_hash(expected, 'md5crypt')
+    assert md5_crypt(password.encode(), salt) == digest
+
+@pytest.mark.parametrize('password, expected', SHA512_CRYPT_VECTORS)
+def test_sha512_crypt_vectors(password, expected):
+    _, (_, (rounds, salt), digest) = parse_hash(expected, 'sha512crypt')
+    assert sha512_crypt(password.encode(), salt, rounds) == digest
+
+def test_matches_system_crypt():
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', DeprecationWarning)
+        crypt = pytest.importorskip('crypt')
+    for password in ('', 'a', 'x' * 17, 'p@ssw0rd é', 'y' * 80):
+        for salt in ('$1$', '$6$', '$6$rounds=2000$'):
+            expected = crypt.crypt(password, salt + 'Sel4Test')
+            if salt == '$1$':
+                assert '$1$Sel4Test$' + md5_crypt(password.encode(), b'Sel4Test').decode() == expected
+            else:
+                rounds = 2000 if 'rounds' in salt else 5000
+                assert expected.endswith('$' + sha512_crypt(password.encode(), b'Sel4Test', rounds).decode())
+
+def test_raw_digests():
+    assert hash_string('password', 'md5') == '5f4dcc3b5aa765d61d8327deb882cf99'
+    assert hash_string('password', 'sha1') == '5baa61e4c9b93f3f0682250b6cf8331b7ee68fd8'
+    assert hash_string('password', 'ntlm') == '8846f7eaee8fb117ad06bdd830b7586c'
+
+@pytest.mark.parametrize('hash_value, password', [
+    ('$1$xy$/LaZzSlapvkAtwkwAP2sA.', 'ab'),
+    (SHA512_CRYPT_VECTORS[3][1], '42'),
+])
+def test_bruteforce_salted_formats(hash_value, password):
+    charset = 'alpha' if password.isalpha() else 'numeric'
+    result = crack_hash(hash_value, 'auto', mode='bruteforce', charset_name=charset, max_length=2)
+    assert result['success'] and result['found']
+    assert result['original'] == password
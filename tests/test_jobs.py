@@ -0,0 +1,54 @@
+"""Tests des tâches asynchrones : soumission, suivi et annulation par l'API"""
+
+import time
+
+import pytest
+
+from app import app
+from crypto_utils.hash_cracker import hash_string
+
+# Durée maximale d'attente d'un changement d'état (secondes)
+WAIT_TIMEOUT = 30
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+def wait_for(client, job_id, statuses):
+    """Relève l'état de la tâche jusqu'à l'un des états attendus"""
+    deadline = time.time() + WAIT_TIMEOUT
+    while time.time() < deadline:
+        job = client.get(f"/api/jobs/{job_id}").get_json()
+        if job['status'] in statuses:
+            return job
+        time.sleep(0.05)
+    pytest.fail(f"Tâche {job_id} toujours dans l'état {job['status']}")
+
+def test_submit_and_poll(client):
+    response = client.post('/api/jobs', json={'type': 'factorize',
+                                              'params': {'number': str(999983 * 1000003), 'method': 'auto'}})
+    assert response.status_code == 202
+    job_id = response.get_json()['job_id']
+
+    job = wait_for(client, job_id, ('done', 'failed'))
+    assert job['status'] == 'done'
+    result = client.get(f"/api/jobs/{job_id}/result").get_json()
+    assert result['success'] and result['factors'] == [999983, 1000003]
+
+def test_cancel_running_job(client):
+    # Hash introuvable : la force brute tourne jusqu'à l'annulation
+    params = {'hash': hash_string('introuvable', 'md5'), 'type': 'md5', 'mode': 'bruteforce',
+              'charset': 'full', 'maxLength': 8}
+    job_id = client.post('/api/jobs', json={'type': 'crack-hash', 'params': params}).get_json()['job_id']
+    wait_for(client, job_id, ('running',))
+
+    response = client.delete(f"/api/jobs/{job_id}")
+    assert response.status_code == 200
+    assert client.get(f"/api/jobs/{job_id}").get_json()['status'] == 'cancelled'
+    assert client.delete(f"/api/jobs/{job_id}").status_code == 409
+    assert client.get(f"/api/jobs/{job_id}/result").status_code == 409
+
+def test_rejects_invalid_jobs(client):
+    assert client.post('/api/jobs', json={'type': 'inconnu'}).status_code == 400
+    assert client.post('/api/jobs', json={'type': 'factorize', 'cpuTimeLimit': 'abc'}).status_code == 400
+    assert client.get('/api/jobs/inconnue').status_code == 404
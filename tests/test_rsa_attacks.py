@@ -0,0 +1,51 @@
+"""Tests des attaques RSA sur des clés construites pour y être vulnérables"""
+
+import pytest
+
+from conftest import next_prime
+from crypto_utils.rsa_attacks import fermat_factor, hastad_broadcast, low_exponent_attack, wiener_attack
+from crypto_utils.rsa_utils import analyze_rsa_key
+
+def wiener_key():
+    """Clé de 512 bits dont l'exposant privé (61 bits) est sous la borne de Wiener"""
+    p = next_prime(2 ** 255 + 12345)
+    q = next_prime(2 ** 256 + 999)
+    d = next_prime(2 ** 60)
+    e = pow(d, -1, (p - 1) * (q - 1))
+    return p, q, d, e
+
+def test_wiener_recovers_private_exponent():
+    p, q, d, e = wiener_key()
+    assert wiener_attack(p * q, e) == (p, q, d)
+
+def test_wiener_ignores_large_private_exponent():
+    p, q = next_prime(2 ** 255 + 12345), next_prime(2 ** 256 + 999)
+    assert wiener_attack(p * q, 65537) is None
+
+def test_analysis_reports_wiener():
+    p, q, d, e = wiener_key()
+    result = analyze_rsa_key('modulus-exponent', f"n = {p * q}\ne = {e}", {'checkSharedPrimes': False})
+    assert result['success']
+    assert result['factorizationMethod'].startswith('Wiener')
+    assert {int(result['p']), int(result['q'])} == {p, q}
+    assert int(result['privateExponent']) == d
+
+def test_hastad_broadcast_recovers_message():
+    message = int.from_bytes(b'message diffuse sans bourrage', 'big')
+    moduli = [next_prime(2 ** 255 + 1000 * i) * next_prime(2 ** 256 + 1000 * i) for i in range(1, 4)]
+    ciphertexts = [pow(message, 3, n) for n in moduli]
+    assert hastad_broadcast(ciphertexts, moduli, 3) == message
+
+def test_hastad_requires_e_ciphertexts():
+    with pytest.raises(ValueError):
+        hastad_broadcast([1, 2], [15, 77], 3)
+
+def test_low_exponent_recovers_short_message():
+    n = next_prime(2 ** 255) * next_prime(2 ** 256)
+    message = int.from_bytes(b'court', 'big')
+    assert low_exponent_attack(pow(message, 3, n), 3, n) == message
+
+def test_fermat_factors_close_primes():
+    p = next_prime(2 ** 256)
+    q = next_prime(p + 2 ** 40)
+    assert sorted(fermat_factor(p * q)) == [p, q]